@@ -0,0 +1,8 @@
+"""
+Benchmarks of Sothoth, run from the root of the repository,
+e.g. ``python -m benchmarks.indexes``.
+
+The synthetic graphs and question workloads are generated by ``benchmarks.graphs``,
+and ``python -m benchmarks.suite --output results.json`` measures the ingest,
+the cold start and the answer latency across graph sizes and comparators.
+"""
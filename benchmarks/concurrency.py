@@ -0,0 +1,101 @@
+"""
+Throughput of one Answeroid shared by a thread pool.
+
+A sqlite database of synthetic people is learned by a thread-safe Answeroid,
+then the same question workload is answered by pools of growing sizes.
+
+Usage: ``python -m benchmarks.concurrency --threads 1 2 4 8``
+
+The NLTK tokenizer, tagger and recognizer need their data packages,
+other components can be given by dotted paths.
+"""
+import os
+import time
+import json
+import random
+import argparse
+import tempfile
+
+from .graphs import people
+
+
+def measure(answeroid, questions, threads):
+    """
+    Return the answered questions per second of a pool of threads.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(threads) as executor:
+        start_time = time.perf_counter()
+        list(executor.map(answeroid.get_answer, questions))
+        elapsed_time = time.perf_counter() - start_time
+
+    return len(questions) / elapsed_time
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.concurrency',
+        description='Measure the throughput of one Answeroid shared by thread pools.'
+    )
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 2, 4, 8],
+                        help='sizes of the thread pools')
+    parser.add_argument('--people', type=int, default=200,
+                        help='number of synthetic people')
+    parser.add_argument('--questions', type=int, default=1000,
+                        help='questions answered per pool')
+    parser.add_argument('--pool-size', type=int, default=8,
+                        help='connections kept by the database pool')
+    parser.add_argument('--tokenizer', default='sothoth.tokenizers.TreebankTokenizer')
+    parser.add_argument('--tagger', default='sothoth.taggers.PerceptronTagger')
+    parser.add_argument('--recognizer', default='sothoth.recognizers.MaximumEntropyRecognizer')
+    parser.add_argument('--sent-comparator', default='sothoth.comparisons.sent_comparators.LevenshteinSimilarity')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    from sothoth import Answeroid
+
+    triples, questions = people(args.people)
+
+    rng = random.Random(1)
+    workload = [rng.choice(questions) for _ in range(args.questions)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        answeroid = Answeroid(
+            storage_adapter={
+                'import_path': 'sothoth.storage.SQLStorageAdapter',
+                'database_uri': 'sqlite:///' + os.path.join(directory, 'concurrency.sqlite3'),
+                'thread_safe': True,
+                'pool_size': args.pool_size,
+            },
+            tokenizer=args.tokenizer,
+            tagger=args.tagger,
+            recognizer=args.recognizer,
+            sent_comparator=args.sent_comparator,
+        )
+        answeroid.learn_knowledge(triples, bulk=True)
+
+        # Build the lazy indexes before measuring
+        answeroid.get_answers(workload[:10])
+
+        results = []
+        for threads in args.threads:
+            throughput = measure(answeroid, workload, threads)
+            results.append({'threads': threads, 'questions_per_second': throughput})
+
+        answeroid.storage.engine.dispose()
+
+    print('{:>8} {:>14} {:>8}'.format('threads', 'questions/sec', 'speedup'))
+    for result in results:
+        print('{:>8} {:>14.1f} {:>7.2f}x'.format(
+            result['threads'], result['questions_per_second'],
+            result['questions_per_second'] / results[0]['questions_per_second']
+        ))
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump({'benchmark': 'concurrency', 'people': args.people, 'results': results}, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+"""
+Synthetic knowledge graphs and the question workloads asking about them.
+
+A graph has a number of entity types, of entities per type and of relationships,
+each relationship links a subject type to an object type and is described by
+contexts templated like the demo, e.g. 'What is the vakor of <TYPE0>'.
+Every entity of the subject type has one triple of the relationship, and the
+workload asks about the triples with the contexts filled by the subject names.
+"""
+import random
+
+
+FIRST_NAMES = ['Alice', 'Bruno', 'Chloe', 'Diego', 'Emma', 'Farid', 'Grace', 'Hugo', 'Irene', 'Jonas']
+
+LAST_NAMES = ['Smith', 'Garcia', 'Muller', 'Rossi', 'Dubois', 'Novak', 'Silva', 'Kowalski', 'Jensen', 'Okafor']
+
+CITIES = ['Paris', 'Lagos', 'Lima', 'Oslo', 'Rome', 'Seoul', 'Tokyo', 'Quito']
+
+JOBS = ['teacher', 'engineer', 'doctor', 'farmer', 'painter', 'lawyer']
+
+# (relationship type, object type, contexts, question template)
+RELATIONSHIPS = [
+    ('AGE', 'NUMBER', ['How old is <PERSON>', 'What is the age of <PERSON>'], 'How old is {}?'),
+    ('BIRTHPLACE', 'GPE', ['Where was <PERSON> born', 'What is the birthplace of <PERSON>'], 'Where was {} born?'),
+    ('OCCUPATION', 'JOB', ['What does <PERSON> do', 'What is the job of <PERSON>'], 'What does {} do?'),
+]
+
+# Templates of the contexts of a synthetic relationship,
+# filled by its attribute word and its subject type
+CONTEXT_TEMPLATES = [
+    'What is the {attribute} of <{type}>',
+    'Tell me the {attribute} of <{type}>',
+    'Which {attribute} does <{type}> have',
+    'What {attribute} is <{type}> known for',
+    'Do you know the {attribute} of <{type}>',
+    'Name the {attribute} of <{type}>',
+]
+
+SYLLABLES = [
+    'ka', 'lo', 'mi', 'ra', 'ten', 'vo', 'shi', 'dar', 'pel', 'qu',
+    'nor', 'bi', 'zan', 'fe', 'gor', 'tia', 'hul', 'wen', 'yas', 'cor',
+]
+
+
+def people(count, seed=0):
+    """
+    Return the triples of count synthetic people and the questions about them.
+    """
+    from sothoth.elements import Triple, Entity, Relationship, Statement
+
+    rng = random.Random(seed)
+
+    triples, questions = [], []
+
+    for number in range(count):
+        name = '{} {}'.format(FIRST_NAMES[number % len(FIRST_NAMES)], LAST_NAMES[number // len(FIRST_NAMES) % len(LAST_NAMES)])
+        if number >= len(FIRST_NAMES) * len(LAST_NAMES):
+            name = '{} {}'.format(name, number)
+
+        values = [str(rng.randint(18, 90)), rng.choice(CITIES), rng.choice(JOBS)]
+
+        for (relationship_type, object_type, contexts, question), value in zip(RELATIONSHIPS, values):
+            triples.append(Triple(
+                subject=Entity(name=name, type='PERSON'),
+                predicate=Relationship(
+                    type=relationship_type, subject_type='PERSON', object_type=object_type,
+                    contexts=[Statement(text=context) for context in contexts]
+                ),
+                object=Entity(name=value, type=object_type)
+            ))
+            questions.append(question.format(name))
+
+    return triples, questions
+
+
+def words(count, syllables, rng):
+    """
+    Return count distinct pronounceable words of the given number of syllables.
+    """
+    result = set()
+
+    while len(result) < count:
+        result.add(''.join(rng.choice(SYLLABLES) for _ in range(syllables)))
+
+    return sorted(result)
+
+
+class Graph(object):
+    """
+    A synthetic knowledge graph.
+
+    :param entity_types: The number of entity types.
+    :param entities_per_type: The number of entities of each type.
+    :param relationships: The number of relationship types.
+    :param contexts_per_relationship: The number of contexts describing a relationship.
+    :param seed: The seed of the random generator, the same parameters
+        always generate the same graph.
+    """
+    def __init__(self, entity_types=5, entities_per_type=100, relationships=10,
+                 contexts_per_relationship=3, seed=0):
+        if contexts_per_relationship > len(CONTEXT_TEMPLATES):
+            raise ValueError('At most {} contexts per relationship.'.format(len(CONTEXT_TEMPLATES)))
+
+        self.entity_types = entity_types
+        self.entities_per_type = entities_per_type
+        self.relationships = relationships
+        self.contexts_per_relationship = contexts_per_relationship
+        self.seed = seed
+
+        rng = random.Random(seed)
+
+        self.types = ['TYPE{}'.format(number) for number in range(entity_types)]
+
+        # Capitalized names of two words, unique across the types
+        first_words = words(int((entity_types * entities_per_type) ** 0.5) + 1, 2, rng)
+        second_words = words(int((entity_types * entities_per_type) ** 0.5) + 1, 3, rng)
+        names = [
+            '{} {}'.format(first.capitalize(), second.capitalize())
+            for first in first_words for second in second_words
+        ]
+        rng.shuffle(names)
+
+        self.entities = dict(
+            (entity_type, names[number * entities_per_type:(number + 1) * entities_per_type])
+            for number, entity_type in enumerate(self.types)
+        )
+
+        # (relationship type, subject type, object type, contexts)
+        attributes = words(relationships, 2, rng)
+        self.relationship_types = []
+        for number, attribute in enumerate(attributes):
+            subject_type = self.types[number % entity_types]
+            object_type = rng.choice(self.types)
+            contexts = [
+                template.format(attribute=attribute, type=subject_type)
+                for template in CONTEXT_TEMPLATES[:contexts_per_relationship]
+            ]
+            self.relationship_types.append(
+                ('RELATIONSHIP{}'.format(number), subject_type, object_type, contexts)
+            )
+
+        # (subject name, relationship index, object name)
+        self.facts = []
+        for index, (_, subject_type, object_type, _) in enumerate(self.relationship_types):
+            for subject_name in self.entities[subject_type]:
+                self.facts.append((subject_name, index, rng.choice(self.entities[object_type])))
+
+    def parameters(self):
+        return {
+            'entity_types': self.entity_types,
+            'entities_per_type': self.entities_per_type,
+            'relationships': self.relationships,
+            'contexts_per_relationship': self.contexts_per_relationship,
+            'seed': self.seed,
+        }
+
+    def triples(self):
+        """
+        Return the triple objects of the graph.
+        """
+        from sothoth.elements import Triple, Entity, Relationship, Statement
+
+        triples = []
+
+        for subject_name, index, object_name in self.facts:
+            relationship_type, subject_type, object_type, contexts = self.relationship_types[index]
+
+            triples.append(Triple(
+                subject=Entity(name=subject_name, type=subject_type),
+                predicate=Relationship(
+                    type=relationship_type, subject_type=subject_type, object_type=object_type,
+                    contexts=[Statement(text=context) for context in contexts]
+                ),
+                object=Entity(name=object_name, type=object_type)
+            ))
+
+        return triples
+
+    def workload(self, count, seed=1):
+        """
+        Return count (question, expected answer) pairs about random triples,
+        each question fills a random context of the relationship.
+        """
+        rng = random.Random(seed)
+
+        workload = []
+
+        for _ in range(count):
+            subject_name, index, object_name = rng.choice(self.facts)
+            _, subject_type, _, contexts = self.relationship_types[index]
+
+            question = rng.choice(contexts).replace('<{}>'.format(subject_type), subject_name) + '?'
+
+            workload.append((question, object_name))
+
+        return workload
@@ -0,0 +1,175 @@
+"""
+Query times of the storage access paths without and with the secondary indexes.
+
+A sqlite database of synthetic triples is created without the secondary indexes,
+as a database created before them, the access paths are timed, then the database
+is migrated by ``SQLStorageAdapter.create_database`` and timed again.
+
+Usage: ``python -m benchmarks.indexes --sizes 10000 100000 1000000``
+"""
+import os
+import time
+import random
+import argparse
+import tempfile
+
+
+SECONDARY_INDEXES = [
+    'ix_entities_name',
+    'ix_entities_type',
+    'ix_statements_relationship_id',
+    'ix_triples_subject_id',
+    'ix_triples_predicate_id',
+    'ix_triples_object_id',
+]
+
+# Timed access paths, a name and the SQL text with one parameter
+QUERIES = [
+    ('entity by name', 'SELECT * FROM entities WHERE name = ?'),
+    ('entities by type', 'SELECT count(*) FROM entities WHERE type = ?'),
+    ('contexts by relationship', 'SELECT * FROM statements WHERE relationship_id = ?'),
+    ('triples by subject', 'SELECT * FROM triples WHERE subject_id = ?'),
+    ('triples by predicate', 'SELECT count(*) FROM triples WHERE predicate_id = ?'),
+    ('triples by object', 'SELECT * FROM triples WHERE object_id = ?'),
+]
+
+
+def populate(engine, triple_count, seed=0):
+    """
+    Insert triple_count random triples between triple_count / 4 entities
+    of 20 types, with 100 relationships of 3 contexts each.
+
+    :returns: The number of entities, relationships and triples.
+    """
+    rng = random.Random(seed)
+
+    entity_count = max(triple_count // 4, 2)
+    relationship_count = 100
+
+    entities = [
+        (entity_id, 'entity {}'.format(entity_id), 'TYPE{}'.format(entity_id % 20))
+        for entity_id in range(1, entity_count + 1)
+    ]
+    relationships = [
+        (relationship_id, 'RELATIONSHIP{}'.format(relationship_id), 'TYPE{}'.format(relationship_id % 20), 'TYPE{}'.format(relationship_id % 7))
+        for relationship_id in range(1, relationship_count + 1)
+    ]
+    statements = [
+        ('Context {} of <TYPE{}>'.format(number, relationship_id % 20), relationship_id)
+        for relationship_id in range(1, relationship_count + 1)
+        for number in range(3)
+    ]
+
+    triples = set()
+    while len(triples) < triple_count:
+        triples.add((
+            rng.randint(1, entity_count),
+            rng.randint(1, relationship_count),
+            rng.randint(1, entity_count),
+        ))
+
+    with engine.begin() as connection:
+        connection.execute('INSERT INTO entities (id, name, type) VALUES (?, ?, ?)', entities)
+        connection.execute(
+            'INSERT INTO relationships (id, type, subject_type, object_type) VALUES (?, ?, ?, ?)',
+            relationships
+        )
+        connection.execute('INSERT INTO statements (text, relationship_id) VALUES (?, ?)', statements)
+        connection.execute(
+            'INSERT INTO triples (subject_id, predicate_id, object_id) VALUES (?, ?, ?)',
+            sorted(triples)
+        )
+
+    return entity_count, relationship_count, triple_count
+
+
+def parameters(name, entity_count, relationship_count, rng):
+    if name == 'entity by name':
+        return 'entity {}'.format(rng.randint(1, entity_count))
+    if name == 'entities by type':
+        return 'TYPE{}'.format(rng.randint(0, 19))
+    if name in ('contexts by relationship', 'triples by predicate'):
+        return rng.randint(1, relationship_count)
+    return rng.randint(1, entity_count)
+
+
+def time_queries(storage, entity_count, relationship_count, repeat, seed=0):
+    """
+    Return the mean milliseconds of each access path, including
+    the candidate triples of an entity through the storage adapter.
+    """
+    rng = random.Random(seed)
+    timings = {}
+
+    with storage.engine.connect() as connection:
+        for name, sql in QUERIES:
+            values = [parameters(name, entity_count, relationship_count, rng) for _ in range(repeat)]
+
+            start_time = time.perf_counter()
+            for value in values:
+                connection.execute(sql, (value, )).fetchall()
+            timings[name] = (time.perf_counter() - start_time) * 1000 / repeat
+
+    Entity = storage.get_object('entity')
+    entities = [Entity(id=rng.randint(1, entity_count)) for _ in range(repeat)]
+
+    start_time = time.perf_counter()
+    for entity in entities:
+        list(storage.get_candidate_triples(entity))
+    timings['get_candidate_triples'] = (time.perf_counter() - start_time) * 1000 / repeat
+
+    return timings
+
+
+def run(size, repeat, directory):
+    from sothoth.storage import SQLStorageAdapter
+
+    database_uri = 'sqlite:///' + os.path.join(directory, 'indexes_{}.sqlite3'.format(size))
+
+    # A database as created before the secondary indexes
+    storage = SQLStorageAdapter(database_uri=database_uri)
+    with storage.engine.begin() as connection:
+        for index in SECONDARY_INDEXES:
+            connection.execute('DROP INDEX IF EXISTS {}'.format(index))
+
+    entity_count, relationship_count, _ = populate(storage.engine, size)
+
+    before = time_queries(storage, entity_count, relationship_count, repeat)
+
+    start_time = time.perf_counter()
+    storage = SQLStorageAdapter(database_uri=database_uri)
+    migration_time = time.perf_counter() - start_time
+
+    after = time_queries(storage, entity_count, relationship_count, repeat)
+
+    storage.engine.dispose()
+
+    return before, after, migration_time
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.indexes',
+        description='Time the storage access paths without and with the secondary indexes.'
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10 ** 4, 10 ** 5, 10 ** 6],
+                        help='numbers of triples')
+    parser.add_argument('--repeat', type=int, default=100,
+                        help='queries per access path')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            before, after, migration_time = run(size, args.repeat, directory)
+
+            print('{} triples, migrated in {:.2f} s'.format(size, migration_time))
+            print('  {:<26} {:>12} {:>12} {:>9}'.format('access path', 'before (ms)', 'after (ms)', 'speedup'))
+
+            for name in before:
+                print('  {:<26} {:>12.3f} {:>12.3f} {:>8.1f}x'.format(
+                    name, before[name], after[name], before[name] / after[name] if after[name] else float('inf')
+                ))
+
+
+if __name__ == '__main__':
+    main()
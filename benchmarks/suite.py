@@ -0,0 +1,192 @@
+"""
+Ingest throughput, cold start and answer latency across graph sizes and comparators.
+
+For each number of entities per type, a synthetic graph is generated and learned
+into a sqlite database, then for each sentence comparator a fresh Answeroid is
+constructed on the database, timed up to its first answer, and asked the question
+workload. The results are written as JSON to track the regressions.
+
+Usage: ``python -m benchmarks.suite --sizes 100 1000 --output results.json``
+
+The NLTK tokenizer, tagger and recognizer need their data packages,
+other components can be given by dotted paths.
+"""
+import os
+import time
+import json
+import argparse
+import platform
+import tempfile
+import subprocess
+
+from .graphs import Graph
+from .warmup import cold_start
+
+
+COMPARATORS = [
+    'sothoth.comparisons.sent_comparators.LevenshteinSimilarity',
+    'sothoth.comparisons.sent_comparators.JaccardSimilarity',
+    'sothoth.comparisons.sent_comparators.GlobalCosineSimilarity',
+]
+
+
+def environment():
+    """
+    Return the versions of the interpreter, the platform and the repository.
+    """
+    try:
+        commit = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL, universal_newlines=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'commit': commit,
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+    }
+
+
+def ingest(graph, database_uri, chunk_size):
+    """
+    Learn the triples of the graph in bulk, and return the triples learned per second.
+    """
+    from sothoth import Answeroid
+
+    triples = graph.triples()
+
+    answeroid = Answeroid(storage_adapter={
+        'import_path': 'sothoth.storage.SQLStorageAdapter', 'database_uri': database_uri
+    })
+
+    start_time = time.perf_counter()
+    answeroid.learn_knowledge(triples, bulk=True, chunk_size=chunk_size)
+    elapsed_time = time.perf_counter() - start_time
+
+    answeroid.storage.engine.dispose()
+
+    return len(triples) / elapsed_time
+
+
+def answer(database_uri, workload, components):
+    """
+    Answer the workload, and return the latency report of the stages,
+    the counters and the share of the expected answers.
+    """
+    from sothoth import Answeroid
+
+    answeroid = Answeroid(
+        storage_adapter={'import_path': 'sothoth.storage.SQLStorageAdapter', 'database_uri': database_uri},
+        instrument='sothoth.instruments.HistogramInstrument',
+        instrument_samples=len(workload),
+        **components
+    )
+
+    # Build the lazy indexes before measuring
+    answeroid.get_answer(workload[0][0])
+    answeroid.instrument.reset()
+
+    correct_answers = 0
+    for question, expected_answer in workload:
+        if expected_answer in answeroid.get_answer(question):
+            correct_answers += 1
+
+    report = answeroid.instrument.report()
+
+    answeroid.storage.engine.dispose()
+
+    return report, correct_answers / len(workload)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.suite',
+        description='Measure the ingest, the cold start and the answer latency on synthetic graphs.'
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000],
+                        help='entities per type of the generated graphs')
+    parser.add_argument('--entity-types', type=int, default=5)
+    parser.add_argument('--relationships', type=int, default=10)
+    parser.add_argument('--contexts', type=int, default=3,
+                        help='contexts per relationship')
+    parser.add_argument('--questions', type=int, default=500,
+                        help='questions of the workload')
+    parser.add_argument('--chunk-size', type=int, default=1000,
+                        help='triples created per transaction when ingesting')
+    parser.add_argument('--comparators', nargs='+', default=COMPARATORS,
+                        help='dotted paths of the sentence comparators')
+    parser.add_argument('--tokenizer', default='sothoth.tokenizers.TreebankTokenizer')
+    parser.add_argument('--tagger', default='sothoth.taggers.PerceptronTagger')
+    parser.add_argument('--recognizer', default='sothoth.recognizers.MaximumEntropyRecognizer')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    components = {
+        'tokenizer': args.tokenizer,
+        'tagger': args.tagger,
+        'recognizer': args.recognizer,
+    }
+
+    results = []
+
+    for size in args.sizes:
+        graph = Graph(
+            entity_types=args.entity_types, entities_per_type=size, relationships=args.relationships,
+            contexts_per_relationship=args.contexts, seed=args.seed
+        )
+        workload = graph.workload(args.questions, seed=args.seed + 1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            database_uri = 'sqlite:///' + os.path.join(directory, 'suite.sqlite3')
+
+            triples_per_second = ingest(graph, database_uri, args.chunk_size)
+
+            for comparator in args.comparators:
+                construction_time, first_answer_time = cold_start(
+                    database_uri, workload[0][0], False, sent_comparator=comparator, **components
+                )
+
+                report, accuracy = answer(
+                    database_uri, workload, dict(components, sent_comparator=comparator)
+                )
+
+                results.append({
+                    'graph': graph.parameters(),
+                    'triples': len(graph.facts),
+                    'comparator': comparator,
+                    'ingest_triples_per_second': triples_per_second,
+                    'construction_seconds': construction_time,
+                    'first_answer_seconds': first_answer_time,
+                    'latency_ms': report['stages']['get_answers'],
+                    'stages_ms': report['stages'],
+                    'counts': report['counts'],
+                    'accuracy': accuracy,
+                })
+
+    print('{:>8} {:>24} {:>10} {:>10} {:>10} {:>9} {:>9} {:>9} {:>8}'.format(
+        'triples', 'comparator', 'ingest/s', 'cold (s)', 'first (s)', 'p50 ms', 'p95 ms', 'p99 ms', 'accuracy'
+    ))
+    for result in results:
+        latency = result['latency_ms']
+        print('{:>8} {:>24} {:>10.0f} {:>10.3f} {:>10.3f} {:>9.2f} {:>9.2f} {:>9.2f} {:>8.2f}'.format(
+            result['triples'], result['comparator'].rsplit('.', 1)[-1],
+            result['ingest_triples_per_second'], result['construction_seconds'],
+            result['first_answer_seconds'], latency['p50_ms'], latency['p95_ms'],
+            latency['p99_ms'], result['accuracy']
+        ))
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump({
+                'benchmark': 'suite',
+                'environment': environment(),
+                'arguments': vars(args),
+                'results': results,
+            }, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
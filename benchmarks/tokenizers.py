@@ -0,0 +1,133 @@
+"""
+Speed of the RegexTreebankTokenizer against nltk.
+
+Every question of the corpus is tokenized by the nltk Treebank tokenizer and
+by the RegexTreebankTokenizer, ``nltk.word_tokenize`` is timed too when the
+punkt data package is installed. The conformance of the tokens on the same
+corpus is checked by tests/test_tokenizers.py.
+
+Usage: ``python -m benchmarks.tokenizers --repeat 20``
+"""
+import time
+import json
+import argparse
+
+from .graphs import people
+
+
+# Questions exercising the quotes, the punctuation and the contractions
+QUESTIONS = [
+    'Where was Barack Obama born?',
+    'How old is Obama',
+    'What does Obama do?',
+    "What's the job of Obama?",
+    "Who's the president of the U.S.?",
+    "Isn't Obama the 44th president?",
+    "Can't you tell me when he was born?",
+    "Where'd they go, and who'll come back?",
+    "I cannot remember, gimme the answer!",
+    "Wanna know who's gonna win?",
+    "'Tis the season, isn't it?",
+    'What is "Hope" about?',
+    "Who wrote ``Dreams from My Father''?",
+    'Who said “Yes we can”?',
+    'What is the capital of France (Paris)?',
+    'Which [bracketed] {braced} <angled> words?',
+    'How much is $3.88 in euros, roughly 3,36?',
+    'What happened at 12:30 on Aug 04, 1961?',
+    'Is it 50% or 100%?',
+    'Who is @obama on #twitter?',
+    'Tom & Jerry -- who are they?',
+    'What is the range 1961–2017?',
+    'Who is O\'Neil, the rock\'n\'roll star?',
+    'Wait... who is he?!',
+    'Who is *the* president?',
+    'Where was Obama born.',
+    "Was it the students' idea?",
+    "What's 'the' answer?",
+    'Why  are   there\tso many\nspaces?',
+    'e.g. who was born in Honolulu?',
+]
+
+
+def corpus(count):
+    """
+    Return the handwritten questions and the questions about count synthetic people.
+    """
+    _, questions = people(count)
+
+    return QUESTIONS + questions
+
+
+def time_tokenize(tokenize_many, questions, repeat):
+    """
+    Return the best microseconds per question of repeated batches.
+    """
+    best_time = float('inf')
+
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        tokenize_many(questions)
+        best_time = min(best_time, time.perf_counter() - start_time)
+
+    return best_time / len(questions) * 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.tokenizers',
+        description='Time the RegexTreebankTokenizer against nltk.'
+    )
+    parser.add_argument('--people', type=int, default=200,
+                        help='number of synthetic people asked about')
+    parser.add_argument('--repeat', type=int, default=20,
+                        help='timed batches per tokenizer')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    import nltk
+    from nltk.tokenize import NLTKWordTokenizer
+    from sothoth.tokenizers import RegexTreebankTokenizer
+
+    questions = corpus(args.people)
+
+    treebank_tokenizer = NLTKWordTokenizer()
+    regex_tokenizer = RegexTreebankTokenizer()
+
+    # The questions are single sentences, where nltk.word_tokenize equals the treebank tokenizer
+    tokenizers = [
+        ('nltk.NLTKWordTokenizer', lambda texts: [treebank_tokenizer.tokenize(text) for text in texts]),
+        ('RegexTreebankTokenizer', regex_tokenizer.tokenize_many),
+    ]
+
+    try:
+        nltk.word_tokenize(questions[0])
+    except LookupError:
+        print('The punkt data package is missing, nltk.word_tokenize is not timed.')
+    else:
+        tokenizers.insert(0, ('nltk.word_tokenize', lambda texts: [nltk.word_tokenize(text) for text in texts]))
+
+    results = []
+    for name, tokenize_many in tokenizers:
+        results.append({
+            'tokenizer': name,
+            'microseconds_per_question': time_tokenize(tokenize_many, questions, args.repeat),
+        })
+
+    print('{} questions'.format(len(questions)))
+    print('{:>24} {:>12} {:>8}'.format('tokenizer', 'us/question', 'speedup'))
+    for result in results:
+        print('{:>24} {:>12.1f} {:>7.1f}x'.format(
+            result['tokenizer'], result['microseconds_per_question'],
+            results[0]['microseconds_per_question'] / result['microseconds_per_question']
+        ))
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump({
+                'benchmark': 'tokenizers', 'questions': len(questions), 'results': results
+            }, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+"""
+Cold-start and per-call latency of the NLTK components.
+
+The first question of a fresh process pays the loading of the models and the
+building of the indexes, unless the Answeroid is constructed with warmup=True.
+The per-call latency of the nltk helper functions, which look up their models
+on every call, is compared with the models held by the wrappers.
+
+Usage: ``python -m benchmarks.warmup --people 200 --calls 200``
+
+The NLTK tokenizer, tagger and recognizer need their data packages.
+"""
+import os
+import time
+import json
+import argparse
+import tempfile
+import statistics
+
+from .graphs import people
+
+
+def cold_start(database_uri, question, warmup, **kwargs):
+    """
+    Return the seconds spent by the construction and by the first answer,
+    the other components of the Answeroid are given by the kwargs.
+    """
+    from sothoth import Answeroid, registry
+
+    registry.clear()
+
+    start_time = time.perf_counter()
+    answeroid = Answeroid(
+        storage_adapter={'import_path': 'sothoth.storage.SQLStorageAdapter', 'database_uri': database_uri},
+        warmup=warmup,
+        **kwargs
+    )
+    construction_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    answeroid.get_answer(question)
+    first_answer_time = time.perf_counter() - start_time
+
+    answeroid.storage.engine.dispose()
+
+    return construction_time, first_answer_time
+
+
+def per_call(function, argument, calls):
+    """
+    Return the median milliseconds of a call of the function.
+    """
+    timings = []
+    for _ in range(calls):
+        start_time = time.perf_counter()
+        function(argument)
+        timings.append((time.perf_counter() - start_time) * 1000)
+
+    return statistics.median(timings)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.warmup',
+        description='Measure the cold-start and per-call latency of the NLTK components.'
+    )
+    parser.add_argument('--people', type=int, default=200,
+                        help='number of synthetic people')
+    parser.add_argument('--calls', type=int, default=200,
+                        help='calls timed per component')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    args = parser.parse_args(argv)
+
+    import nltk
+    from sothoth import Answeroid
+    from sothoth.tokenizers import TreebankTokenizer
+    from sothoth.taggers import PerceptronTagger
+    from sothoth.recognizers import MaximumEntropyRecognizer
+
+    triples, questions = people(args.people)
+    question = questions[0]
+
+    results = {'benchmark': 'warmup', 'people': args.people, 'cold_start': [], 'per_call_ms': []}
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_uri = 'sqlite:///' + os.path.join(directory, 'warmup.sqlite3')
+
+        answeroid = Answeroid(storage_adapter={
+            'import_path': 'sothoth.storage.SQLStorageAdapter', 'database_uri': database_uri
+        })
+        answeroid.learn_knowledge(triples, bulk=True)
+        answeroid.storage.engine.dispose()
+
+        for warmup in (False, True):
+            construction_time, first_answer_time = cold_start(database_uri, question, warmup)
+            results['cold_start'].append({
+                'warmup': warmup,
+                'construction_seconds': construction_time,
+                'first_answer_seconds': first_answer_time,
+            })
+
+    tokens = nltk.word_tokenize(question)
+    tagged_tokens = nltk.pos_tag(tokens)
+
+    tokenizer, tagger, recognizer = TreebankTokenizer(), PerceptronTagger(), MaximumEntropyRecognizer()
+    components = [
+        ('tokenize', nltk.word_tokenize, tokenizer.tokenize, question),
+        ('tag', nltk.pos_tag, tagger.tag, tokens),
+        ('recognize', nltk.ne_chunk, recognizer.get_model().parse, tagged_tokens),
+    ]
+    for name, helper, held, argument in components:
+        results['per_call_ms'].append({
+            'component': name,
+            'nltk_helper': per_call(helper, argument, args.calls),
+            'held_model': per_call(held, argument, args.calls),
+        })
+
+    print('{:>8} {:>14} {:>14}'.format('warmup', 'construct (s)', 'first (s)'))
+    for result in results['cold_start']:
+        print('{:>8} {:>14.3f} {:>14.3f}'.format(
+            str(result['warmup']), result['construction_seconds'], result['first_answer_seconds']
+        ))
+
+    print()
+    print('{:>10} {:>12} {:>12} {:>8}'.format('component', 'nltk (ms)', 'held (ms)', 'speedup'))
+    for result in results['per_call_ms']:
+        print('{:>10} {:>12.3f} {:>12.3f} {:>7.1f}x'.format(
+            result['component'], result['nltk_helper'], result['held_model'],
+            result['nltk_helper'] / result['held_model']
+        ))
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -48,7 +48,7 @@ def demo():
 
         print('Initializing ...')
 
-        answeroid = Answeroid(sent_comparator = 'sothoth.comparisons.sent_comparators.CosineSimilarity')
+        answeroid = Answeroid(sent_comparator = 'sothoth.comparisons.sent_comparators.GlobalCosineSimilarity')
 
         answeroid.learn_knowledge(triples)
 
@@ -6,11 +6,35 @@ class Answeroid(object):
     """
     A knowledge based question-answer chat bot.
     """
+    # Answered at the construction given warmup=True
+    WARMUP_QUESTION = 'Where was John Smith born?'
+
+    # The types of the answers asked by the wh-words, the longest phrase wins
+    ANSWER_TYPES = {
+        'when': ['DATE', 'TIME'],
+        'what time': ['TIME'],
+        'what year': ['DATE'],
+        'where': ['PLACE', 'LOCATION', 'GPE', 'FACILITY'],
+        'who': ['PERSON', 'ORGANIZATION'],
+        'whom': ['PERSON', 'ORGANIZATION'],
+        'how old': ['NUMBER', 'AGE'],
+        'how many': ['NUMBER', 'CARDINAL'],
+        'how much': ['NUMBER', 'MONEY'],
+    }
+
     def __init__(self, **kwargs):
+        # Configure the instrument recording the timings of the stages
+        # and the counts of the work, shared by the components
+        instrument = kwargs.get('instrument', 'sothoth.instruments.Instrument')
+
+        self.instrument = utils.initialize_class(instrument, **kwargs)
+
+        kwargs['instrument'] = self.instrument
+
         # Configure storage
         storage_adapter = kwargs.get('storage_adapter', 'sothoth.storage.SQLStorageAdapter')
 
-        self.storage = utils.initialize_class(storage_adapter)
+        self.storage = utils.initialize_class(storage_adapter, instrument = self.instrument)
 
         # Configure preprocessing functions
         preprocessors = kwargs.get(
@@ -24,6 +48,17 @@ class Answeroid(object):
         for preprocessor in preprocessors:
             self.preprocessors.append(utils.import_module(preprocessor))
 
+        # Configure the caches of the tokenizer, tagger and recognizer stages,
+        # keyed by their input and shared with the comparators, disabled by default
+        from .caches import StageCaches
+
+        self.stage_caches = None
+
+        if kwargs.get('stage_cache_size'):
+            self.stage_caches = StageCaches(kwargs['stage_cache_size'])
+
+            kwargs['stage_caches'] = self.stage_caches
+
         # Configure word tokenizer
         tokenizer = kwargs.get('tokenizer', 'sothoth.tokenizers.TreebankTokenizer')
 
@@ -41,6 +76,17 @@ class Answeroid(object):
 
         self.recognizer = utils.initialize_class(recognizer, **kwargs)
 
+        self.recognizer.fit(self.storage)
+
+        if self.stage_caches is not None:
+            from .tokenizers import MemoizedTokenizer
+            from .taggers import MemoizedTagger
+            from .recognizers import MemoizedRecognizer
+
+            self.tokenizer = MemoizedTokenizer(self.tokenizer, self.stage_caches['tokenize'])
+            self.tagger = MemoizedTagger(self.tagger, self.stage_caches['tag'])
+            self.recognizer = MemoizedRecognizer(self.recognizer, self.stage_caches['recognize'])
+
         # Configure word comparator to measure distance between 
         # two entities` name and two entities` type
         word_comparator = kwargs.get(
@@ -57,14 +103,69 @@ class Answeroid(object):
 
         self.sent_comparator = utils.initialize_class(sent_comparator, **kwargs)
 
+        self.sent_comparator.fit(self.storage)
+
+        # Configure entity linker to link mentioned entities
+        # to the storaged ones by the word comparator
+        entity_linker = kwargs.get(
+            'entity_linker', 'sothoth.linkers.BKTreeEntityLinker'
+        )
+
+        self.entity_linker = utils.initialize_class(
+            entity_linker, self.storage, self.word_comparator, **kwargs
+        )
+
+        # Configure the answer cache, keyed by the preprocessed questions
+        # and invalidated by the changes of the storage, disabled by default
+        from .caches import LRUCache
+
+        self.answer_cache = None
+
+        if kwargs.get('answer_cache_size'):
+            self.answer_cache = LRUCache(
+                kwargs['answer_cache_size'], kwargs.get('answer_cache_ttl')
+            )
+
+        # Configure the pruning of the candidate triples whose relationship types
+        # don`t fit the role of the linked entity or the type asked by the wh-word
+        self.relationship_pruning = kwargs.get('relationship_pruning', False)
+
+        self.answer_types = kwargs.get('answer_types', self.ANSWER_TYPES)
+
+        # Configure the executor running the blocking stages of the coroutines,
+        # None results in the default executor of the event loop
+        self.executor = kwargs.get('executor')
+
         # Configure logger
         self.logger = kwargs.get('logger', logging.getLogger(__name__))
 
-    def learn_knowledge(self, knowledge):
+        if kwargs.get('warmup', False):
+            self.warmup()
+
+    def warmup(self):
+        """
+        Load the models and build the indexes of the components
+        by answering a dummy question, bypassing the answer cache.
+        """
+        import time
+
+        start_time = time.monotonic()
+
+        self._answer(self._preprocess([self.WARMUP_QUESTION]))
+
+        self.logger.info('Warmed up in {:.2f} s'.format(time.monotonic() - start_time))
+
+    def learn_knowledge(self, knowledge, **kwargs):
         """
         Feed provided valid triple(s) to the storage.
 
         :param knowledge: A list of triples or a single triple.
+        :keyword bulk: Create the triples by chunks instead of one by one,
+            which is much faster on large inputs.
+        :keyword chunk_size: The number of triples created per transaction in bulk.
+        :keyword aliases: A dictionary mapping the other surface forms, such as
+            nicknames or abbreviations, to the entities or the entity names they
+            refer to, which are then linked exactly, e.g. {'Barack': 'Barack Obama'}.
         :returns: A list wrapped triple(s) which was provided.
         :rtype: list(Triple) 
         """
@@ -84,10 +185,17 @@ class Answeroid(object):
                     )
 
             # Save the triple(s) to the storage
-            for each_triple in knowledge:
-                self.storage.create(each_triple)
+            if kwargs.get('bulk', False):
+                self.storage.create_many(knowledge, chunk_size=kwargs.get('chunk_size', 1000))
+
+                self.logger.info('Adding {} triples to the storage'.format(len(knowledge)))
+
+            else:
+                for each_triple in knowledge:
+                    self.storage.create(each_triple)
 
-                self.logger.info("Adding '{}' to the storage".format(repr(each_triple)))
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info("Adding '{}' to the storage".format(repr(each_triple)))
 
         else:
             raise self.AnsweroidException(
@@ -95,8 +203,35 @@ class Answeroid(object):
                 'Neither was provided'
             )
 
+        # Save the aliases after the entities they refer to
+        if kwargs.get('aliases'):
+            Entity = self.storage.get_object('entity')
+
+            aliases = [
+                (surface_form, entity if isinstance(entity, Entity) else Entity(name=entity))
+                for surface_form, entity in kwargs['aliases'].items()
+            ]
+
+            created_aliases = self.storage.add_aliases(aliases)
+
+            self.logger.info('Adding {} aliases to the storage'.format(len(created_aliases)))
+
         return knowledge
 
+    async def alearn_knowledge(self, knowledge, **kwargs):
+        """
+        Feed provided valid triple(s) to the storage without blocking the event loop,
+        see ``learn_knowledge()``.
+        """
+        import asyncio
+        import functools
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(
+            self.executor, functools.partial(self.learn_knowledge, knowledge, **kwargs)
+        )
+
     def get_answer(self, question, **kwargs):
         """
         Return the response based on the input.
@@ -105,59 +240,244 @@ class Answeroid(object):
         :returns: An answer or answers to the input.
         :rtype: set(str)
         """
+        return self.get_answers([question], **kwargs)[0]
 
-        if isinstance(question, str) and question:
-            kwargs['text'] = question
-        else:
-            raise self.AnsweroidException(
-                'A not null string object should be provided.'
+    def get_answers(self, questions, **kwargs):
+        """
+        Return the responses based on a batch of inputs, in the input order.
+
+        The questions are given to the tokenizer, the tagger and the recognizer
+        as one batch, which a component may process in bulk, and the linked
+        entities, candidate triples and best matches are shared by the
+        questions of the batch.
+
+        The answers of the questions already answered since the last change
+        of the storage are returned from the answer cache, if configured.
+
+        :param questions: A list of question strings.
+        :returns: An answer or answers to each input.
+        :rtype: list(set(str))
+        """
+        with self.instrument.stage('get_answers'):
+            self.instrument.count('questions', len(questions))
+
+            with self.instrument.stage('preprocess'):
+                input_questions = self._preprocess(questions)
+
+            generation = self.storage.generation
+            cached_answers, missed_questions = self._lookup_answers(input_questions, generation)
+
+            answers = self._answer(missed_questions) if missed_questions else []
+
+            return self._store_answers(
+                input_questions, cached_answers, missed_questions, answers, generation
+            )
+
+    def _answer(self, input_questions):
+        """
+        Return the answers of the preprocessed questions.
+        """
+        input_questions = self._recognize(input_questions)
+
+        # Shared by the questions of this batch
+        linked_entities = {}
+        candidate_triples = {}
+        best_matches = {}
+        relationship_scores = {}
+
+        return [
+            self._respond(
+                input_question, linked_entities, candidate_triples,
+                best_matches, relationship_scores
             )
+            for input_question in input_questions
+        ]
+
+    async def aget_answer(self, question, **kwargs):
+        """
+        Return the response based on the input without blocking the event loop,
+        see ``get_answer()``.
+        """
+        answers = await self.aget_answers([question], **kwargs)
+
+        return answers[0]
+
+    async def aget_answers(self, questions, **kwargs):
+        """
+        Return the responses based on a batch of inputs without blocking
+        the event loop, see ``get_answers()``.
+
+        The CPU bound stages run in the executor. The candidate triples are
+        awaited from a storage providing ``aget_candidate_triples()``, such as
+        the AsyncSQLStorageAdapter, or read in the executor otherwise.
+
+        The storage is used from the threads of the executor,
+        it must be safe to share among threads.
+        """
+        with self.instrument.stage('get_answers'):
+            self.instrument.count('questions', len(questions))
+
+            with self.instrument.stage('preprocess'):
+                input_questions = self._preprocess(questions)
+
+            generation = self.storage.generation
+            cached_answers, missed_questions = self._lookup_answers(input_questions, generation)
+
+            answers = await self._aanswer(missed_questions) if missed_questions else []
+
+            return self._store_answers(
+                input_questions, cached_answers, missed_questions, answers, generation
+            )
+
+    async def _aanswer(self, input_questions):
+        """
+        Return the answers of the preprocessed questions without blocking the event loop.
+        """
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+
+        input_questions = await loop.run_in_executor(self.executor, self._recognize, input_questions)
+
+        # Shared by the questions of this batch
+        linked_entities = {}
+        candidate_triples = {}
+        best_matches = {}
+        relationship_scores = {}
+
+        def link():
+            return [
+                self._link(input_question, linked_entities)
+                for input_question in input_questions
+            ]
+
+        linking_entities = await loop.run_in_executor(self.executor, link)
+
+        # Read the candidate triples of every linked entity concurrently
+        entities = dict(
+            (entity.id, entity) for entities in linking_entities for entity in entities
+        )
+
+        async def read_candidate_triples(entity):
+            if not hasattr(self.storage, 'aget_candidate_triples'):
+                return await loop.run_in_executor(
+                    self.executor, self._get_candidate_triples, entity
+                )
+
+            if self.relationship_pruning and entity.type:
+                entity_triples = await self.storage.aget_candidate_triples(
+                    entity, subject_type = entity.type, object_type = entity.type
+                )
+
+                if entity_triples:
+                    return entity_triples
+
+            return await self.storage.aget_candidate_triples(entity)
+
+        with self.instrument.stage('candidate_triples'):
+            results = await asyncio.gather(*[
+                read_candidate_triples(entity) for entity in entities.values()
+            ])
+        candidate_triples.update(zip(entities, results))
+
+        def respond():
+            return [
+                self._respond(
+                    input_question, linked_entities, candidate_triples,
+                    best_matches, relationship_scores
+                )
+                for input_question in input_questions
+            ]
 
-        input_question = kwargs.pop('text')
+        return await loop.run_in_executor(self.executor, respond)
 
-        # Preprocess the input question
+    def _preprocess(self, questions):
+        """
+        Return the questions transformed by the preprocessors.
+        """
+        for question in questions:
+            if not isinstance(question, str) or not question:
+                raise self.AnsweroidException(
+                    'A not null string object should be provided.'
+                )
+
+        input_questions = list(questions)
+
+        # Preprocess the input questions
         for preprocessor in self.preprocessors:
-            input_question = preprocessor(input_question)
+            input_questions = [
+                preprocessor(input_question) for input_question in input_questions
+            ]
 
-        # Tokenize the input question
-        input_question = self.tokenizer(input_question)
+        return input_questions
 
-        # Tag the input question
-        input_question = self.tagger(input_question)
+    def _lookup_answers(self, input_questions, generation):
+        """
+        Return the cached answers of the preprocessed questions,
+        and the distinct questions missing from the cache.
+        """
+        if self.answer_cache is None:
+            return {}, input_questions
 
-        # Pick out named entities
-        input_question = self.recognizer(input_question)
+        cached_answers = {}
+        missed_questions = []
 
-        contained_entities = [item for item in input_question if item[-1] != '<>']
+        for input_question in input_questions:
+            if input_question in cached_answers or input_question in missed_questions:
+                continue
 
-        # Pick out all storaged entities for scoring
-        Entity = self.storage.get_object('entity')
-        all_entities = self.storage.select(Entity())
+            answer = self.answer_cache.get(input_question, generation)
 
-        
-        import itertools
-        linking_entities = []
-        # Score every mentioned entity and record every best match in linking_entities
-        for entity_name, _, entity_type in contained_entities:
-            best_match = None
-            best_match_score = -1.0
+            if answer is None:
+                missed_questions.append(input_question)
+            else:
+                cached_answers[input_question] = answer
 
-            all_entities, copied_iterator = itertools.tee(all_entities)
+        return cached_answers, missed_questions
 
-            mentioned_entity = Entity(name = entity_name, type = entity_type)
+    def _store_answers(self, input_questions, cached_answers, missed_questions, answers, generation):
+        """
+        Cache the answers of the missed questions as of the storage generation
+        they were answered from, and return the answers in the input order.
+        """
+        if self.answer_cache is None:
+            return answers
+
+        for input_question, answer in zip(missed_questions, answers):
+            self.answer_cache.put(input_question, answer, generation)
+            cached_answers[input_question] = answer
+
+        # Copy the answers, so that the callers can`t alter the cached ones
+        return [set(cached_answers[input_question]) for input_question in input_questions]
+
+    def _recognize(self, input_questions):
+        """
+        Return the (token, pos tag, entity type) tuples of each preprocessed
+        question, by the tokenizer, the tagger and the recognizer.
+        """
+        # Tokenize the input questions
+        with self.instrument.stage('tokenize'):
+            input_questions = self.tokenizer.tokenize_many(input_questions)
+
+        # Tag the input questions
+        with self.instrument.stage('tag'):
+            input_questions = self.tagger.tag_many(input_questions)
 
-            for entity in copied_iterator:
-                name_score = self.word_comparator(entity.name, mentioned_entity.name)
-                type_score = self.word_comparator(entity.type, mentioned_entity.type)
-                average_score = (name_score + type_score) / 2
+        # Pick out named entities
+        with self.instrument.stage('recognize'):
+            return self.recognizer.distinct_many(input_questions)
 
-                if average_score > best_match_score:
-                    best_match = entity
-                    best_match_score = average_score
-            linking_entities.append(best_match)
+    def _respond(self, input_question, linked_entities, candidate_triples,
+                 best_matches, relationship_scores):
+        """
+        Return the answers of a recognized question.
 
-        # Transform from Model to Object
-        linking_entities = [self.storage.model_to_object(entity) for entity in linking_entities]
+        The linked entities are cached by (name, type) of the mentions,
+        the candidate triples by the linked entity ids, the best matches
+        by the linked entity ids and the hollow texts, and the relationship
+        scores by the relationship ids and the hollow texts.
+        """
+        linking_entities = self._link(input_question, linked_entities)
 
         if not linking_entities:
             self.logger.warn(
@@ -166,7 +486,7 @@ class Answeroid(object):
 
         # Construct hollow statement
         hollow_text = []
-        for token, pos_tag, entity_type in input_question:
+        for token, pos_tag, entity_type, *_ in input_question:
             if entity_type == '<>':
                 hollow_text.append(token)
             else:
@@ -176,27 +496,33 @@ class Answeroid(object):
         Statement = self.storage.get_object('statement')
         holding_statement = Statement(text = hollow_text)
 
+        answer_types = self._get_answer_types(input_question) if self.relationship_pruning else None
+
         responsing_answers = []
         # Find the best candidate triple for each linked entity
         # Meanwhile, record responsing answers
         for entity in linking_entities:
-            best_match = None
-            best_match_score = -1.0
-            
-            candidate_triples = self.storage.get_candidate_triples(entity)
-            
-            for triple in candidate_triples:
-                statements = triple.predicate.contexts
-
-                triple_max_score = max(
-                    self.sent_comparator(statement.text, holding_statement.text) 
-                    for statement in statements
-                )
+            if (entity.id, hollow_text) not in best_matches:
+                if entity.id not in candidate_triples:
+                    with self.instrument.stage('candidate_triples'):
+                        candidate_triples[entity.id] = self._get_candidate_triples(entity)
+
+                entity_triples = candidate_triples[entity.id]
+
+                if self.relationship_pruning:
+                    with self.instrument.stage('prune'):
+                        entity_triples = self._prune_triples(entity, entity_triples, answer_types)
+
+                with self.instrument.stage('score'):
+                    best_matches[(entity.id, hollow_text)] = self._search_best_triple(
+                        entity, holding_statement, entity_triples, relationship_scores
+                    )
+
+            best_match = best_matches[(entity.id, hollow_text)]
 
-                if triple_max_score > best_match_score:
-                    best_match = triple
-                    best_match_score = triple_max_score
-                self.logger.info('For {}, the {}`s max score is {:.2f}'.format(repr(entity), repr(triple), triple_max_score))
+            if best_match is None:
+                # No triple is related to this entity
+                continue
 
             if entity.id == best_match.subject.id:
                 # This entity is subject, therefore, record the object`s name as the answer
@@ -206,5 +532,213 @@ class Answeroid(object):
 
         return set(responsing_answers)
 
+    def _get_candidate_triples(self, entity):
+        """
+        Return the candidate triples of a linked entity. With the pruning, the storage
+        reads only those whose relationship expects the type of the entity on its side,
+        and all of them if none does.
+        """
+        if self.relationship_pruning and entity.type:
+            entity_triples = list(self.storage.get_candidate_triples(
+                entity, subject_type = entity.type, object_type = entity.type
+            ))
+
+            if entity_triples:
+                return entity_triples
+
+        return list(self.storage.get_candidate_triples(entity))
+
+    def _link(self, input_question, linked_entities):
+        """
+        Return the stored entities linked to the mentioned entities of a recognized
+        question, the linked entities are cached by (name, type) of the mentions.
+
+        The mentions tagged with a stored entity id by the recognizer are linked
+        to that entity directly.
+        """
+        contained_entities = [item for item in input_question if item[2] != '<>']
+
+        # Link every mentioned entity to its best match in the storage
+        Entity = self.storage.get_object('entity')
+
+        linking_entities = []
+        with self.instrument.stage('link'):
+            for entity_name, _, entity_type, *entity_id in contained_entities:
+                if entity_id:
+                    # Strip the brackets of the tagged type
+                    linking_entities.append(
+                        Entity(id = entity_id[0], name = entity_name, type = entity_type[1:-1])
+                    )
+                    continue
+
+                if (entity_name, entity_type) not in linked_entities:
+                    mentioned_entity = Entity(name = entity_name, type = entity_type)
+
+                    linked_entities[(entity_name, entity_type)] = self.entity_linker(mentioned_entity)
+
+                best_match = linked_entities[(entity_name, entity_type)]
+
+                if best_match is not None:
+                    linking_entities.append(best_match)
+
+        return linking_entities
+
+    def _get_answer_types(self, input_question):
+        """
+        Return the types of the answer asked by the first wh-word or phrase
+        of a recognized question, or None if it asks none of them.
+        """
+        tokens = [token.lower() for token, _, entity_type, *_ in input_question if entity_type == '<>']
+
+        max_length = max((len(phrase.split()) for phrase in self.answer_types), default=0)
+
+        for index in range(len(tokens)):
+            for length in range(max_length, 0, -1):
+                phrase = ' '.join(tokens[index:index + length])
+
+                if phrase in self.answer_types:
+                    return set(self.answer_types[phrase])
+
+        return None
+
+    def _prune_triples(self, entity, candidate_triples, answer_types):
+        """
+        Return the candidate triples whose relationship expects the type of the
+        entity on its side, narrowed to those whose other side, the answer,
+        has one of the answer types. A step pruning every triple is skipped.
+
+        A relationship without a subject type or an object type fits any entity,
+        and an entity without a type fits any relationship.
+        """
+        def fits(expected_type, entity_type):
+            return not expected_type or not entity_type or expected_type == entity_type
+
+        role_triples = [
+            triple for triple in candidate_triples
+            if (triple.subject.id == entity.id and fits(triple.predicate.subject_type, entity.type))
+            or (triple.object.id == entity.id and fits(triple.predicate.object_type, entity.type))
+        ]
+
+        if not role_triples:
+            return candidate_triples
+
+        pruned_triples = role_triples
+
+        if answer_types:
+            answer_triples = []
+
+            for triple in role_triples:
+                if triple.subject.id == entity.id:
+                    answer_type = triple.predicate.object_type or triple.object.type
+                else:
+                    answer_type = triple.predicate.subject_type or triple.subject.type
+
+                if answer_type in answer_types:
+                    answer_triples.append(triple)
+
+            if answer_triples:
+                pruned_triples = answer_triples
+
+        self.instrument.count('candidates_pruned', len(candidate_triples) - len(pruned_triples))
+
+        return pruned_triples
+
+    def _search_best_triple(self, entity, holding_statement, candidate_triples, relationship_scores):
+        """
+        Return the candidate triple whose contexts best match the hollow statement.
+
+        Triples sharing a predicate share its contexts, so each relationship
+        is scored once and the score is reused by the rest of its triples.
+
+        A sentence comparator supporting a score cutoff scores the relationships
+        one by one, given the running best score as the cutoff, so that the contexts
+        which can`t beat it stop early. Only the exact scores are reused.
+        """
+        # Pick out the relationships not scored yet
+        unscored_relationships = {}
+        for triple in candidate_triples:
+            relationship = triple.predicate
+
+            if (relationship.id, holding_statement.text) not in relationship_scores:
+                unscored_relationships[relationship.id] = relationship
+
+        supports_score_cutoff = getattr(self.sent_comparator, 'supports_score_cutoff', False)
+
+        # The best score among the relationships scored already
+        best_score = max((
+            relationship_scores[(triple.predicate.id, holding_statement.text)]
+            for triple in candidate_triples
+            if triple.predicate.id not in unscored_relationships
+        ), default=None)
+
+        # Score their contexts in a single batch, unless the comparator stops early
+        if supports_score_cutoff:
+            batches = [[relationship] for relationship in unscored_relationships.values()]
+        else:
+            batches = [list(unscored_relationships.values())]
+
+        self.instrument.count('candidates_scored', len(candidate_triples))
+
+        # The scores of this search, including those cut below the running best score
+        scores = {}
+
+        for batch in batches:
+            context_texts = [
+                statement.text
+                for relationship in batch
+                for statement in relationship.contexts
+            ]
+
+            if supports_score_cutoff:
+                context_scores = self.sent_comparator.compare_many(
+                    holding_statement.text, context_texts, score_cutoff = best_score
+                )
+            else:
+                context_scores = self.sent_comparator.compare_many(holding_statement.text, context_texts)
+
+            self.instrument.count('contexts_scored', len(context_texts))
+            self.instrument.count('comparator_calls')
+
+            offset = 0
+            for relationship in batch:
+                # A relationship without contexts can`t be asked about
+                scores[relationship.id] = max(
+                    context_scores[offset:offset + len(relationship.contexts)], default=0.0
+                )
+                offset += len(relationship.contexts)
+
+                # A score below the cutoff may have been cut to 0
+                if not supports_score_cutoff or best_score is None or scores[relationship.id] >= best_score:
+                    relationship_scores[(relationship.id, holding_statement.text)] = scores[relationship.id]
+
+                if best_score is None or scores[relationship.id] > best_score:
+                    best_score = scores[relationship.id]
+
+                # Skip the formatting unless it is logged
+                if not self.logger.isEnabledFor(logging.INFO):
+                    continue
+
+                self.logger.info('For {}, the {}`s max score is {:.2f}'.format(
+                    repr(entity), repr(relationship), scores[relationship.id]
+                ))
+
+        best_match = None
+        best_match_score = -1.0
+
+        for triple in candidate_triples:
+            relationship = triple.predicate
+
+            if relationship.id in scores:
+                triple_max_score = scores[relationship.id]
+            else:
+                triple_max_score = relationship_scores[(relationship.id, holding_statement.text)]
+
+            # The first triple wins a tie
+            if triple_max_score > best_match_score:
+                best_match = triple
+                best_match_score = triple_max_score
+
+        return best_match
+
     class AnsweroidException(Exception):
         pass
@@ -0,0 +1,170 @@
+"""
+Bounded caches.
+"""
+import time
+import threading
+from collections import OrderedDict
+
+
+class LRUCache(object):
+    """
+    A bounded mapping evicting the least recently used entries,
+    with an optional time to live and hit/miss statistics.
+
+    An entry is stored with a version, e.g. the generation of the storage,
+    and it is a miss when looked up with another version.
+    It is safe to share among threads.
+
+    :param max_size: The maximum number of entries.
+    :param ttl: The seconds an entry is kept, forever if None.
+    """
+    def __init__(self, max_size, ttl=None):
+        self.max_size = max_size
+        self.ttl = ttl
+
+        # Map the key to (value, version, expiration time)
+        self.entries = OrderedDict()
+
+        self.lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, version=None, default=None):
+        """
+        Return the value of the key, or the default on a miss.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return default
+
+            value, entry_version, expiration_time = entry
+
+            if entry_version != version:
+                del self.entries[key]
+                self.invalidations += 1
+                self.misses += 1
+                return default
+
+            if expiration_time is not None and expiration_time <= time.monotonic():
+                del self.entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self.entries.move_to_end(key)
+            self.hits += 1
+
+            return value
+
+    def put(self, key, value, version=None):
+        """
+        Store the value of the key, evicting the least recently used entry if full.
+        """
+        if self.max_size <= 0:
+            return
+
+        expiration_time = None if self.ttl is None else time.monotonic() + self.ttl
+
+        with self.lock:
+            self.entries[key] = (value, version, expiration_time)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        """
+        Return the statistics of the cache.
+
+        :rtype: dict
+        """
+        with self.lock:
+            lookups = self.hits + self.misses
+
+            return {
+                'size': len(self.entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+            }
+
+
+class StageCaches(object):
+    """
+    The bounded caches of the NLP stages, keyed by the input of each stage,
+    shared by the Answeroid and its comparators.
+
+    :param max_size: The maximum number of entries per stage.
+    """
+    STAGES = ('tokenize', 'tag', 'recognize')
+
+    def __init__(self, max_size):
+        self.caches = dict((stage, LRUCache(max_size)) for stage in self.STAGES)
+
+    def __getitem__(self, stage):
+        return self.caches[stage]
+
+    def clear(self):
+        for cache in self.caches.values():
+            cache.clear()
+
+    def stats(self):
+        """
+        Return the statistics of the cache of each stage.
+
+        :rtype: dict
+        """
+        return dict((stage, cache.stats()) for stage, cache in self.caches.items())
+
+
+def memoize_many(cache, inputs, key, compute_many, version=None):
+    """
+    Return the result of each input, looked up in the cache by the key of the input.
+    The distinct missed inputs are computed by a single call of compute_many,
+    and cached with the given version.
+
+    The results are cached as tuples and returned as lists,
+    so that the callers can`t alter the cached ones.
+    """
+    keys = [key(each_input) for each_input in inputs]
+
+    results = {}
+    missed_inputs = []
+
+    for each_key, each_input in zip(keys, inputs):
+        if each_key in results:
+            continue
+
+        result = cache.get(each_key, version)
+        results[each_key] = result
+
+        if result is None:
+            missed_inputs.append(each_input)
+
+    if missed_inputs:
+        for each_input, result in zip(missed_inputs, compute_many(missed_inputs)):
+            each_key = key(each_input)
+            results[each_key] = tuple(result)
+
+            cache.put(each_key, results[each_key], version)
+
+    return [list(results[each_key]) for each_key in keys]
@@ -0,0 +1,70 @@
+"""
+This module contains the shared methods of the cascade comparators,
+which score with a cheap comparator first, then re-score
+the best of them with an expensive comparator.
+"""
+
+
+class CascadeMixin(object):
+    """
+    This class has shared methods used to cascade two comparators
+    of the same kind, given by dotted paths.
+
+    The kwargs of a cascade are prefixed by the kind of its comparators,
+    e.g. ``sent_cascade_first`` and ``sent_cascade_top_n``:
+
+    - ``<prefix>_first``: The cheap comparator scoring every text.
+    - ``<prefix>_second``: The expensive comparator re-scoring the survivors.
+    - ``<prefix>_top_n``: The number of the best texts surviving, all if None.
+    - ``<prefix>_threshold``: The least first score of a surviving text, if given.
+    """
+    def initialize_stages(self, prefix, first_comparator, second_comparator, **kwargs):
+        from .. import utils
+
+        self.first_comparator = utils.initialize_class(
+            kwargs.get(prefix + '_first', first_comparator), **kwargs
+        )
+        self.second_comparator = utils.initialize_class(
+            kwargs.get(prefix + '_second', second_comparator), **kwargs
+        )
+
+        self.top_n = kwargs.get(prefix + '_top_n', 10)
+        self.threshold = kwargs.get(prefix + '_threshold')
+
+    def compare(self, text, other_text):
+        """
+        A single pair is not pruned, it is scored by the second comparator.
+        """
+        return self.second_comparator.compare(text, other_text)
+
+    def compare_many(self, text, other_texts):
+        """
+        Score every other text by the first comparator, then re-score
+        the survivors by the second comparator. The pruned texts score 0.
+
+        :rtype: numpy.ndarray
+        """
+        import numpy
+
+        first_scores = numpy.asarray(
+            self.first_comparator.compare_many(text, other_texts), dtype=float
+        )
+
+        survivors = numpy.arange(len(other_texts))
+
+        if self.threshold is not None:
+            survivors = survivors[first_scores >= self.threshold]
+
+        if self.top_n is not None and len(survivors) > self.top_n:
+            # The earlier text wins a tie
+            order = numpy.argsort(-first_scores[survivors], kind='stable')
+            survivors = numpy.sort(survivors[order[:self.top_n]])
+
+        scores = numpy.zeros(len(other_texts))
+
+        if len(survivors):
+            scores[survivors] = self.second_comparator.compare_many(
+                text, [other_texts[index] for index in survivors]
+            )
+
+        return scores
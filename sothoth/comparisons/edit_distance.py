@@ -0,0 +1,224 @@
+"""
+This module contains bit-parallel edit distance kernels, and the shared
+methods of the comparators built on them.
+
+Both kernels keep a column of the dynamic programming matrix in the bits
+of a Python integer, so that each character of the other string costs a
+few integer operations whatever the length of the pattern. No C extension
+is required.
+"""
+
+
+def _popcount(number):
+    try:
+        return number.bit_count()
+    except AttributeError:
+        return bin(number).count('1')
+
+
+def pattern_masks(pattern):
+    """
+    Return the mapping of each character of the pattern
+    to the bitmask of its positions.
+    """
+    masks = {}
+
+    for position, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << position)
+
+    return masks
+
+
+def levenshtein_distance(pattern, text, max_distance=None, masks=None):
+    """
+    Return the minimal number of insertions, deletions and substitutions
+    turning the pattern into the text, by Myers/Hyyrö`s algorithm.
+
+    :param max_distance: If given, return ``max_distance + 1`` as soon as
+        the distance is known to exceed it.
+    :param masks: The ``pattern_masks`` of the pattern, if already built.
+    :rtype: int
+    """
+    length, text_length = len(pattern), len(text)
+
+    if max_distance is not None and abs(length - text_length) > max_distance:
+        return max_distance + 1
+
+    if not length:
+        return text_length
+
+    if masks is None:
+        masks = pattern_masks(pattern)
+
+    full_mask = (1 << length) - 1
+    last_bit = 1 << (length - 1)
+
+    # Vertical positive and negative deltas of the current column
+    positive, negative = full_mask, 0
+    distance = length
+
+    for position, char in enumerate(text, 1):
+        match = masks.get(char, 0)
+
+        diagonal = ((((match & positive) + positive) ^ positive) | match | negative)
+
+        horizontal_positive = negative | ~(diagonal | positive)
+        horizontal_negative = diagonal & positive
+
+        if horizontal_positive & last_bit:
+            distance += 1
+        elif horizontal_negative & last_bit:
+            distance -= 1
+
+        # The distance drops by one per remaining character at most
+        if max_distance is not None and distance - (text_length - position) > max_distance:
+            return max_distance + 1
+
+        horizontal_positive = (horizontal_positive << 1) | 1
+        horizontal_negative = horizontal_negative << 1
+
+        positive = (horizontal_negative | ~(diagonal | horizontal_positive)) & full_mask
+        negative = horizontal_positive & diagonal & full_mask
+
+    return distance
+
+
+def indel_distance(pattern, text, max_distance=None, masks=None):
+    """
+    Return the minimal number of insertions and deletions turning the pattern
+    into the text, by the bit-parallel longest common subsequence of Hyyrö.
+
+    :param max_distance: If given, return ``max_distance + 1`` as soon as
+        the distance is known to exceed it.
+    :param masks: The ``pattern_masks`` of the pattern, if already built.
+    :rtype: int
+    """
+    length, text_length = len(pattern), len(text)
+
+    if max_distance is not None and abs(length - text_length) > max_distance:
+        return max_distance + 1
+
+    if not length or not text_length:
+        return length + text_length
+
+    if masks is None:
+        masks = pattern_masks(pattern)
+
+    full_mask = (1 << length) - 1
+
+    # The zero bits mark the matched positions of the pattern
+    row = full_mask
+
+    for position, char in enumerate(text, 1):
+        matched = row & masks.get(char, 0)
+        row = ((row + matched) | (row - matched)) & full_mask
+
+        if max_distance is not None:
+            # The subsequence grows by one per remaining character at most
+            subsequence = length - _popcount(row)
+            best_subsequence = min(length, subsequence + text_length - position)
+
+            if length + text_length - 2 * best_subsequence > max_distance:
+                return max_distance + 1
+
+    subsequence = length - _popcount(row)
+
+    return length + text_length - 2 * subsequence
+
+
+def indel_similarity(pattern, text, score_cutoff=None, masks=None):
+    """
+    Return ``1 - indel_distance / (len(pattern) + len(text))`` rounded to
+    2 decimals, which equals the ratio of python-Levenshtein.
+
+    :param score_cutoff: If given, return 0 as soon as the similarity
+        is known to be below it.
+    :rtype: float
+    """
+    total_length = len(pattern) + len(text)
+
+    if not total_length:
+        return 1.0
+
+    max_distance = None
+    if score_cutoff is not None:
+        # The similarity is rounded to 2 decimals, so one up to 0.005 below the cutoff
+        # may still round up to it, and 1e-9 absorbs the float error of the product.
+        # A looser bound only costs time, the check below decides the score
+        max_distance = int((1 - score_cutoff + 0.005) * total_length + 1e-9)
+
+        if max_distance < 0:
+            return 0
+
+    distance = indel_distance(pattern, text, max_distance, masks)
+
+    similarity = round(1 - distance / total_length, 2)
+
+    if score_cutoff is not None and similarity < score_cutoff:
+        return 0
+
+    return similarity
+
+
+class IndelSimilarityMixin(object):
+    """
+    This class has shared methods used by the word and the sentence
+    comparators scoring the texts by ``indel_similarity``.
+
+    The ``score_cutoff`` given to the constructor applies to
+    the comparisons given none.
+    """
+    supports_score_cutoff = True
+
+    def __init__(self, **kwargs):
+        self.score_cutoff = kwargs.get('score_cutoff')
+
+    def compare(self, text, other_text, score_cutoff=None):
+        """
+        Compare the two input texts.
+
+        :return: The percent of similarity between the texts.
+        :rtype: float
+        """
+        if score_cutoff is None:
+            score_cutoff = self.score_cutoff
+
+        # Return 0 if either text has a falsy text value
+        if not text or not other_text:
+            return 0
+
+        return indel_similarity(
+            str(other_text.lower()), str(text.lower()), score_cutoff
+        )
+
+    def compare_many(self, text, other_texts, score_cutoff=None):
+        """
+        Compare the input text with each of the other texts,
+        the bitmasks of the input text are built once.
+
+        :return: The percent of similarity of each other text.
+        :rtype: numpy.ndarray
+        """
+        import numpy
+
+        if score_cutoff is None:
+            score_cutoff = self.score_cutoff
+
+        scores = numpy.zeros(len(other_texts))
+
+        # Return 0 if either text has a falsy text value
+        if not text:
+            return scores
+
+        text = str(text.lower())
+        masks = pattern_masks(text)
+
+        for index, other_text in enumerate(other_texts):
+            if not other_text:
+                continue
+
+            scores[index] = indel_similarity(
+                text, str(other_text.lower()), score_cutoff, masks
+            )
+
+        return scores
@@ -2,16 +2,60 @@
 This module contains various sentence-comparison algorithms
 designed to compare one sentence to another.
 """
+from .cascades import CascadeMixin
+from .edit_distance import IndelSimilarityMixin
 
 
 class SentComparator:
 
+    # Whether compare() and compare_many() take a score_cutoff,
+    # below which a score may be returned as 0 to stop early
+    supports_score_cutoff = False
+
     def __call__(self, sentence_a, sentence_b):
         return self.compare(sentence_a, sentence_b)
 
     def compare(self, sentence_a, sentence_b):
         return 0
 
+    def compare_many(self, sentence, other_sentences):
+        """
+        Compare the sentence with each of the other sentences.
+
+        :return: The similarity of each other sentence, as ``compare(other_sentence, sentence)``.
+        :rtype: numpy.ndarray
+        """
+        import numpy
+
+        return numpy.array(
+            [self.compare(other_sentence, sentence) for other_sentence in other_sentences],
+            dtype=float
+        )
+
+    def fit(self, storage):
+        """
+        Learn from the storaged contexts before comparing.
+        Comparators which don`t need the storage leave it unused.
+        """
+        pass
+
+    def initialize_tokenizer(self, **kwargs):
+        """
+        Return the tokenizer of the comparator, memoized by
+        the stage caches shared by the Answeroid, if given.
+        """
+        from .. import utils
+        tokenizer = kwargs.get('tokenizer', 'sothoth.tokenizers.TreebankTokenizer')
+
+        tokenizer = utils.initialize_class(tokenizer, **kwargs)
+
+        if kwargs.get('stage_caches') is not None:
+            from ..tokenizers import MemoizedTokenizer
+
+            tokenizer = MemoizedTokenizer(tokenizer, kwargs['stage_caches']['tokenize'])
+
+        return tokenizer
+
 
 class LevenshteinSimilarity(SentComparator):
     """
@@ -58,6 +102,38 @@ class LevenshteinSimilarity(SentComparator):
 
         return percent
 
+    def compare_many(self, sentence, other_sentences):
+        """
+        Compare the input sentence with each of the other sentences.
+
+        A single sequence matcher is kept for the input sentence,
+        so that its lookup table is built once.
+
+        :return: The percent of similarity of each other sentence.
+        :rtype: numpy.ndarray
+        """
+        import numpy
+
+        scores = numpy.zeros(len(other_sentences))
+
+        # Return 0 if either sentence has a falsy sentence value
+        if not sentence:
+            return scores
+
+        similarity = self.sequence_matcher(None)
+        similarity.set_seq2(str(sentence.lower()))
+
+        for index, other_sentence in enumerate(other_sentences):
+            if not other_sentence:
+                continue
+
+            similarity.set_seq1(str(other_sentence.lower()))
+
+            # Calculate a decimal percent of the similarity
+            scores[index] = round(similarity.ratio(), 2)
+
+        return scores
+
 class JaccardSimilarity(SentComparator):
     """
     Calculates the similarity of two sentences based on the Jaccard index.
@@ -78,10 +154,7 @@ class JaccardSimilarity(SentComparator):
     .. _`Jaccard similarity index`: https://en.wikipedia.org/wiki/Jaccard_index
     """
     def __init__(self, **kwargs):
-    	from .. import utils
-    	tokenizer = kwargs.get('tokenizer', 'sothoth.tokenizers.TreebankTokenizer')
-
-    	self.tokenizer = utils.initialize_class(tokenizer, **kwargs)
+    	self.tokenizer = self.initialize_tokenizer(**kwargs)
 
     def compare(self, sentence, other_sentence):
     	# Tokenize the sentences
@@ -98,6 +171,22 @@ class JaccardSimilarity(SentComparator):
 
     	return ratio
 
+    def compare_many(self, sentence, other_sentences):
+    	import numpy
+
+    	# Tokenize the input sentence once
+    	set_a = set(self.tokenizer(sentence))
+
+    	scores = numpy.zeros(len(other_sentences))
+
+    	for index, other_tokenized_sentence in enumerate(self.tokenizer.tokenize_many(other_sentences)):
+    		set_b = set(other_tokenized_sentence)
+
+    		# Calculate Jaccard similarity
+    		scores[index] = len(set_a & set_b) / float(len(set_a | set_b))
+
+    	return scores
+
 
 class CosineSimilarity(SentComparator):
     """
@@ -113,10 +202,7 @@ class CosineSimilarity(SentComparator):
     So we highly recommand you customize your own cosine similarity with global vocabulary
     """
     def __init__(self, **kwargs):
-        from .. import utils
-        tokenizer = kwargs.get('tokenizer', 'sothoth.tokenizers.TreebankTokenizer')
-
-        self.tokenizer = utils.initialize_class(tokenizer, **kwargs)
+        self.tokenizer = self.initialize_tokenizer(**kwargs)
 
     def compare(self, sentence, other_sentence):
         from scipy import spatial
@@ -149,4 +235,362 @@ class CosineSimilarity(SentComparator):
 
         similarity = 1 - spatial.distance.cosine(vec_a, vec_b)
 
-        return similarity
\ No newline at end of file
+        return similarity
+
+    def compare_many(self, sentence, other_sentences):
+        """
+        Compare the input sentence with each of the other sentences by
+        a single sparse matrix product over the vocabulary of them all.
+
+        The score is 0 instead of nan when a sentence has no token.
+        """
+        import numpy
+        from scipy import sparse
+        from collections import Counter
+
+        vocabulary = {}
+
+        def vectorize(tokenized_sentence):
+            counter = Counter(tokenized_sentence)
+
+            indices = [vocabulary.setdefault(token, len(vocabulary)) for token in counter]
+            data = numpy.array(list(counter.values()), dtype=float)
+
+            norm = numpy.linalg.norm(data)
+            if norm:
+                data /= norm
+
+            return indices, data
+
+        vector_indices, vector_data = vectorize(self.tokenizer(sentence))
+
+        indptr, indices, data = [0], [], []
+        for other_tokenized_sentence in self.tokenizer.tokenize_many(other_sentences):
+            row_indices, row_data = vectorize(other_tokenized_sentence)
+            indices.extend(row_indices)
+            data.extend(row_data)
+            indptr.append(len(indices))
+
+        matrix = sparse.csr_matrix(
+            (data, indices, indptr), shape=(len(other_sentences), len(vocabulary))
+        )
+
+        vector = numpy.zeros(len(vocabulary))
+        vector[vector_indices] = vector_data
+
+        return matrix.dot(vector)
+
+
+class GlobalCosineSimilarity(SentComparator):
+    """
+    Calculates the similarity of two sentences based on Cosine similarity
+    over a global vocabulary of the storaged contexts.
+
+    Every context is a row of an L2-normalised sparse matrix, fitted from the
+    storage and appended as new contexts are learned. The row of a context no
+    statement has any more is dropped from the lookup, and the matrix is rebuilt
+    once most of its rows are dropped. A sentence compared
+    with the contexts is vectorized once, then scored against every context
+    by a single sparse matrix product, which is kept for the next comparisons.
+
+    The matrix and the kept products are guarded by a lock, a comparator
+    can be shared among threads.
+    """
+    def __init__(self, **kwargs):
+        import threading
+        from collections import OrderedDict
+
+        self.tokenizer = self.initialize_tokenizer(**kwargs)
+
+        # The maximum number of sentences whose products are kept
+        self.max_products = kwargs.get('cosine_cached_products', 128)
+
+        self.storage = None
+
+        self.vocabulary = {}
+
+        # Map the context text to its row and its number of statements,
+        # and the statement id to its text
+        self.rows = {}
+        self.counts = {}
+        self.statements = {}
+
+        self.matrix = None
+
+        # Vectorized rows not yet appended to the matrix
+        self.pending_rows = []
+
+        # The rows of the matrix and the pending rows, including the dropped ones
+        self.row_count = 0
+
+        self.products = OrderedDict()
+
+        self.lock = threading.RLock()
+
+    def fit(self, storage):
+        """
+        Build the matrix from every storaged statement,
+        then follow the changes of the storage.
+        """
+        with self.lock:
+            if self.storage is None:
+                storage.add_listener(self.on_storage_changed)
+            elif self.storage is not storage:
+                self.storage.remove_listener(self.on_storage_changed)
+                storage.add_listener(self.on_storage_changed)
+
+            self.storage = storage
+
+            self.vocabulary = {}
+            self.rows = {}
+            self.counts = {}
+            self.statements = {}
+            self.matrix = None
+            self.pending_rows = []
+            self.row_count = 0
+            self.products.clear()
+
+            Statement = storage.get_object('statement')
+
+            for statement in storage.select(Statement()):
+                self.add(statement)
+
+    def on_storage_changed(self, event, elements):
+        with self.lock:
+            if event == 'drop':
+                self.fit(self.storage)
+                return
+
+            Statement = self.storage.get_object('statement')
+
+            for element in elements:
+                if not isinstance(element, Statement):
+                    continue
+
+                if event == 'remove':
+                    self.discard(element.id)
+                else:
+                    self.add(element)
+
+    def add(self, statement):
+        """
+        Add the text of a statement as a context,
+        an updated statement leaves its previous text.
+        """
+        if self.statements.get(statement.id) == statement.text:
+            return
+
+        self.discard(statement.id)
+
+        self.statements[statement.id] = statement.text
+        self.counts[statement.text] = self.counts.get(statement.text, 0) + 1
+
+        if statement.text not in self.rows:
+            self.add_row(statement.text)
+
+    def add_row(self, text):
+        self.rows[text] = self.row_count
+        self.row_count += 1
+        self.pending_rows.append(self.vectorize(text, grow=True))
+
+    def discard(self, statement_id):
+        """
+        Discard a statement, and the context of its text if no other statement has it.
+        """
+        text = self.statements.pop(statement_id, None)
+
+        if text is None:
+            return
+
+        self.counts[text] -= 1
+
+        if not self.counts[text]:
+            del self.counts[text]
+            del self.rows[text]
+
+    def vectorize(self, sentence, grow=False):
+        """
+        Return the column indices and the L2-normalised counts of the tokens.
+
+        Tokens out of the vocabulary are added if grow is set, otherwise
+        they only count in the norm, since they match no context.
+        """
+        from collections import Counter
+
+        counter = Counter(self.tokenizer(sentence))
+
+        norm = sum(count * count for count in counter.values()) ** 0.5
+
+        indices, data = [], []
+
+        for token, count in counter.items():
+            if token not in self.vocabulary:
+                if not grow:
+                    continue
+                self.vocabulary[token] = len(self.vocabulary)
+
+            indices.append(self.vocabulary[token])
+            data.append(count / norm)
+
+        return indices, data
+
+    def get_matrix(self):
+        """
+        Return the context matrix, appending the pending rows,
+        or rebuilt from the contexts if most of its rows are dropped.
+        """
+        from scipy import sparse
+
+        if len(self.rows) * 2 < self.row_count:
+            texts = sorted(self.rows, key=self.rows.get)
+
+            self.vocabulary = {}
+            self.rows = {}
+            self.matrix = None
+            self.pending_rows = []
+            self.row_count = 0
+
+            for text in texts:
+                self.add_row(text)
+
+            self.products.clear()
+
+        if self.pending_rows:
+            indptr, indices, data = [0], [], []
+            for row_indices, row_data in self.pending_rows:
+                indices.extend(row_indices)
+                data.extend(row_data)
+                indptr.append(len(indices))
+
+            shape = (len(self.pending_rows), len(self.vocabulary))
+            new_rows = sparse.csr_matrix((data, indices, indptr), shape=shape)
+
+            if self.matrix is None:
+                self.matrix = new_rows
+            else:
+                # The vocabulary might have grown with the new rows
+                self.matrix.resize((self.matrix.shape[0], len(self.vocabulary)))
+                self.matrix = sparse.vstack([self.matrix, new_rows], format='csr')
+
+            self.pending_rows = []
+
+            # The products miss the new rows
+            self.products.clear()
+
+        return self.matrix
+
+    def compare_contexts(self, sentence):
+        """
+        Return the similarities between the sentence and every context,
+        indexed by the rows of the contexts.
+
+        :rtype: numpy.ndarray
+        """
+        import numpy
+
+        with self.lock:
+            matrix = self.get_matrix()
+
+            if matrix is None:
+                return numpy.zeros(0)
+
+            if sentence in self.products:
+                self.products.move_to_end(sentence)
+                return self.products[sentence]
+
+            indices, data = self.vectorize(sentence)
+
+            vector = numpy.zeros(matrix.shape[1])
+            vector[indices] = data
+
+            product = matrix.dot(vector)
+
+            self.products[sentence] = product
+            if len(self.products) > self.max_products:
+                self.products.popitem(last=False)
+
+            return product
+
+    def compare(self, sentence, other_sentence):
+        """
+        Compare the two input sentences.
+
+        :return: The cosine of the angle between the sentences.
+        :rtype: float
+        """
+        with self.lock:
+            if sentence in self.rows:
+                return float(self.compare_contexts(other_sentence)[self.rows[sentence]])
+
+            if other_sentence in self.rows:
+                return float(self.compare_contexts(sentence)[self.rows[other_sentence]])
+
+            # Neither sentence is a context
+            from collections import Counter
+
+            counter, other_counter = (
+                Counter(self.tokenizer(sentence)), Counter(self.tokenizer(other_sentence))
+            )
+
+            dot_product = sum(count * other_counter[token] for token, count in counter.items())
+
+            norm = sum(count * count for count in counter.values()) ** 0.5
+            other_norm = sum(count * count for count in other_counter.values()) ** 0.5
+
+            if not norm or not other_norm:
+                return 0
+
+            return dot_product / (norm * other_norm)
+
+    def compare_many(self, sentence, other_sentences):
+        """
+        Compare the input sentence with each of the other sentences,
+        the contexts among them are looked up in a single product.
+        """
+        import numpy
+
+        with self.lock:
+            product = self.compare_contexts(sentence)
+
+            return numpy.array([
+                product[self.rows[other_sentence]]
+                if other_sentence in self.rows else self.compare(other_sentence, sentence)
+                for other_sentence in other_sentences
+            ], dtype=float)
+
+
+
+class BitParallelLevenshteinSimilarity(IndelSimilarityMixin, SentComparator):
+    """
+    Compare two sentences based on the insertions and deletions turning
+    one sentence into the other, computed by a bit-parallel kernel in pure Python.
+
+    The similarity equals the ratio of python-Levenshtein,
+    ``1 - distance / (len(a) + len(b))``, without the C extension.
+    A comparison given a score cutoff stops as soon as it can`t reach
+    the cutoff, and scores 0.
+    """
+    pass
+
+
+class CascadeSimilarity(CascadeMixin, SentComparator):
+    """
+    Score every sentence by a cheap comparator, then re-score the top N
+    of them, or those above a threshold, by an expensive comparator.
+
+    The comparators are given by dotted paths, ``sent_cascade_first`` is
+    ``JaccardSimilarity`` and ``sent_cascade_second`` is ``CosineSimilarity``
+    by default, ``sent_cascade_top_n`` is 10 and ``sent_cascade_threshold``
+    is unset. Both comparators are fitted to the storage.
+    """
+    def __init__(self, **kwargs):
+        self.initialize_stages(
+            'sent_cascade',
+            'sothoth.comparisons.sent_comparators.JaccardSimilarity',
+            'sothoth.comparisons.sent_comparators.CosineSimilarity',
+            **kwargs
+        )
+
+    def fit(self, storage):
+        self.first_comparator.fit(storage)
+        self.second_comparator.fit(storage)
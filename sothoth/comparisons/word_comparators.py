@@ -2,15 +2,34 @@
 This module contains various word-comparison algorithms
 designed to compare one word to another.
 """
+from .cascades import CascadeMixin
+from .edit_distance import IndelSimilarityMixin
 
 class WordComparator:
 
+    # Whether compare() and compare_many() take a score_cutoff,
+    # below which a score may be returned as 0 to stop early
+    supports_score_cutoff = False
+
     def __call__(self, word_a, word_b):
         return self.compare(word_a, word_b)
 
     def compare(self, word_a, word_b):
         return 0
 
+    def compare_many(self, word, other_words):
+        """
+        Compare the word with each of the other words.
+
+        :return: The similarity of each other word, as ``compare(other_word, word)``.
+        :rtype: numpy.ndarray
+        """
+        import numpy
+
+        return numpy.array(
+            [self.compare(other_word, word) for other_word in other_words], dtype=float
+        )
+
 
 class LevenshteinSimilarity(WordComparator):
     """
@@ -51,4 +70,72 @@ class LevenshteinSimilarity(WordComparator):
         # Calculate a decimal percent of the similarity
         percent = round(similarity.ratio(), 2)
 
-        return percent
\ No newline at end of file
+        return percent
+
+    def compare_many(self, word, other_words):
+        """
+        Compare the input word with each of the other words.
+
+        A single sequence matcher is kept for the input word,
+        so that its lookup table is built once.
+
+        :return: The percent of similarity of each other word.
+        :rtype: numpy.ndarray
+        """
+        import numpy
+
+        scores = numpy.zeros(len(other_words))
+
+        # Return 0 if either word has a falsy word value
+        if not word:
+            return scores
+
+        similarity = self.sequence_matcher(None)
+        similarity.set_seq2(str(word.lower()))
+
+        for index, other_word in enumerate(other_words):
+            if not other_word:
+                continue
+
+            similarity.set_seq1(str(other_word.lower()))
+
+            # Calculate a decimal percent of the similarity
+            scores[index] = round(similarity.ratio(), 2)
+
+        return scores
+
+
+
+class BitParallelLevenshteinSimilarity(IndelSimilarityMixin, WordComparator):
+    """
+    Compare two words based on the insertions and deletions turning
+    one word into the other, computed by a bit-parallel kernel in pure Python.
+
+    The similarity equals the ratio of python-Levenshtein,
+    ``1 - distance / (len(a) + len(b))``, without the C extension.
+    A comparison given a score cutoff stops as soon as it can`t reach
+    the cutoff, and scores 0.
+    """
+    pass
+
+
+class CascadeSimilarity(CascadeMixin, WordComparator):
+    """
+    Score every word by a cheap comparator, then re-score the top N
+    of them, or those above a threshold, by an expensive comparator.
+
+    The comparators are given by dotted paths, ``word_cascade_first`` is
+    ``BitParallelLevenshteinSimilarity`` and ``word_cascade_second`` is
+    ``LevenshteinSimilarity`` by default, ``word_cascade_top_n`` is 10
+    and ``word_cascade_threshold`` is unset.
+
+    The pruning applies to the full scan of the ``ExhaustiveEntityLinker``,
+    the ``BKTreeEntityLinker`` bounds its search by the Levenshtein ratio.
+    """
+    def __init__(self, **kwargs):
+        self.initialize_stages(
+            'word_cascade',
+            'sothoth.comparisons.word_comparators.BitParallelLevenshteinSimilarity',
+            'sothoth.comparisons.word_comparators.LevenshteinSimilarity',
+            **kwargs
+        )
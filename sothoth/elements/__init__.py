@@ -1,9 +1,12 @@
+from .alias import Alias, AliasMixin
 from .entity import Entity, EntityMixin
 from .relationship import Relationship, RelationshipMixin
 from .statement import Statement, StatementMixin
 from .triple import Triple, TripleMixin
 
 __all__ = (
+	'Alias',
+	'AliasMixin',
 	'Entity',
 	'EntityMixin',
 	'Relationship',
@@ -0,0 +1,64 @@
+class AliasMixin(object):
+    """
+    This class has shared methods used to
+    normalize different alias models.
+    """
+
+    alias_field_names = [
+        'id',
+        'name',
+        'entity_id',
+    ]
+
+    def get_alias_field_names(self):
+        """
+        Return the list of fields for this alias.
+        """
+        return self.alias_field_names
+
+    def serialize(self):
+        """
+        :returns: A dictionary representation of the alias object.
+        :rtype: dict
+        """
+        data = {}
+
+        for field_name in self.get_alias_field_names():
+            format_method = getattr(self, 'get_{}'.format(
+                field_name
+            ), None)
+
+            if format_method:
+                data[field_name] = format_method()
+            else:
+                data[field_name] = getattr(self, field_name, None)
+
+        return data
+
+class Alias(AliasMixin):
+    """
+    An alias is another surface form of a stored entity,
+    such as a nickname or an abbreviation, kept normalized
+    to be looked up exactly.
+    """
+
+    __slots__ = (
+        'id',
+        'name',
+        'entity_id',
+        'storage',
+    )
+
+    def __init__(self, **kwargs):
+
+        self.id = kwargs.get('id')
+        self.name = kwargs.get('name')
+        self.entity_id = kwargs.get('entity_id')
+
+        self.storage = None
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return '<Alias(name:%s entity_id:%s)>' % (self.name, self.entity_id)
@@ -2,7 +2,7 @@ from sqlalchemy import Table, Column, Integer, String, ForeignKey, UniqueConstra
 from sqlalchemy.orm import relationship, backref
 from sqlalchemy.ext.declarative import declared_attr, declarative_base
 
-from ...elements import EntityMixin, RelationshipMixin, StatementMixin, TripleMixin
+from ...elements import AliasMixin, EntityMixin, RelationshipMixin, StatementMixin, TripleMixin
 from ... import constants
 
 class ModelBase(object):
@@ -40,14 +40,44 @@ class Entity(Base, EntityMixin):
 
     name = Column(
         String(constants.ATTR_MAX_LENGTH),
-        nullable=False
+        nullable=False,
+        index=True
     )
 
     type = Column(
-        String(constants.ATTR_MAX_LENGTH)
+        String(constants.ATTR_MAX_LENGTH),
+        index=True
     )
 
 
+class Alias(Base, AliasMixin):
+    """
+    An alias is another surface form of a stored entity,
+    kept normalized to be looked up exactly.
+    """
+
+    __tablename__ = 'aliases'
+    __table_args__ = (
+        UniqueConstraint('name', 'entity_id'),
+    )
+
+    name = Column(
+        String(constants.ATTR_MAX_LENGTH),
+        nullable=False,
+        index=True
+    )
+
+    entity_id = Column(
+        Integer,
+        ForeignKey('entities.id'),
+        nullable = False,
+        index = True
+    )
+
+    entity = relationship(
+        'Entity',
+        backref = backref("aliases", cascade="all,delete")
+    )
 
 
 class Statement(Base, StatementMixin):
@@ -70,7 +100,8 @@ class Statement(Base, StatementMixin):
     relationship_id = Column(
         Integer,
         ForeignKey('relationships.id'),
-        nullable = False
+        nullable = False,
+        index = True
     )
 
 
@@ -132,19 +163,22 @@ class Triple(Base, TripleMixin):
     subject_id = Column(
         Integer,
         ForeignKey('entities.id'),
-        nullable = False
+        nullable = False,
+        index = True
     )
 
     predicate_id = Column(
         Integer,
         ForeignKey('relationships.id'),
-        nullable = False
+        nullable = False,
+        index = True
     )
 
     object_id = Column(
         Integer,
         ForeignKey('entities.id'),
-        nullable = False
+        nullable = False,
+        index = True
     )
 
     subject = relationship(
@@ -0,0 +1,138 @@
+"""
+Instruments recording the timings of the answering stages
+and the counts of the work done.
+"""
+import time
+import threading
+from collections import defaultdict, deque
+
+
+class _NullStage(object):
+    """
+    A context manager doing nothing, shared by every stage of the null instrument.
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class Instrument(object):
+    """
+    A processing interface for recording the answering pipeline,
+    it records nothing by default.
+
+    A stage is timed by ``with instrument.stage('tokenize'): ...``,
+    and the work is counted by ``instrument.count('sql_statements')``.
+    """
+    def __init__(self, **kwargs):
+        pass
+
+    def stage(self, name):
+        """
+        Return a context manager timing the stage of the given name.
+        """
+        return _NULL_STAGE
+
+    def timing(self, name, seconds):
+        """
+        Record the seconds spent by a run of the stage.
+        """
+        pass
+
+    def count(self, name, value=1):
+        """
+        Add the value to the counter of the given name.
+        """
+        pass
+
+
+class _Stage(object):
+    """
+    A context manager recording the monotonic time spent in its block.
+    """
+    __slots__ = ('instrument', 'name', 'start_time')
+
+    def __init__(self, instrument, name):
+        self.instrument = instrument
+        self.name = name
+
+    def __enter__(self):
+        self.start_time = time.monotonic()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.instrument.timing(self.name, time.monotonic() - self.start_time)
+        return False
+
+
+class HistogramInstrument(Instrument):
+    """
+    Keep the latest timings of every stage in process, and report
+    their percentiles with the counters by ``report()``.
+
+    It is safe to share among threads.
+
+    :keyword instrument_samples: The number of the latest timings kept per stage.
+    """
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, **kwargs):
+        self.max_samples = kwargs.get('instrument_samples', 10000)
+
+        self.timings = defaultdict(lambda: deque(maxlen=self.max_samples))
+        self.runs = defaultdict(int)
+        self.counts = defaultdict(int)
+
+        self.lock = threading.Lock()
+
+    def stage(self, name):
+        return _Stage(self, name)
+
+    def timing(self, name, seconds):
+        with self.lock:
+            self.timings[name].append(seconds)
+            self.runs[name] += 1
+
+    def count(self, name, value=1):
+        with self.lock:
+            self.counts[name] += value
+
+    def reset(self):
+        with self.lock:
+            self.timings.clear()
+            self.runs.clear()
+            self.counts.clear()
+
+    def report(self):
+        """
+        Return the runs, the mean, the percentiles and the maximum of the kept
+        timings of each stage in milliseconds, and the counters.
+
+        :rtype: dict
+        """
+        with self.lock:
+            timings = dict((name, sorted(samples)) for name, samples in self.timings.items())
+            runs = dict(self.runs)
+            counts = dict(self.counts)
+
+        stages = {}
+        for name, samples in timings.items():
+            stage = {
+                'runs': runs[name],
+                'mean_ms': sum(samples) / len(samples) * 1000,
+                'max_ms': samples[-1] * 1000,
+            }
+
+            for percentile in self.PERCENTILES:
+                # Nearest rank
+                rank = max(1, -(-percentile * len(samples) // 100))
+                stage['p{}_ms'.format(percentile)] = samples[rank - 1] * 1000
+
+            stages[name] = stage
+
+        return {'stages': stages, 'counts': counts}
@@ -0,0 +1,558 @@
+"""
+Entity linkers.
+"""
+from .comparisons.edit_distance import levenshtein_distance
+
+
+class EntityLinker(object):
+    """
+    A processing interface for linking a mentioned entity to the stored entities.
+    Subclasses must define ``rank()``
+
+    The score of a stored entity is the average of the word comparator`s
+    score on both the name and the type of the mentioned entity.
+
+    Unless ``exact_linking`` is False, a mention is first looked up in a hash table
+    of the normalized stored names and aliases, and ranked only on a miss.
+    The table is built from the storage on the first use, then kept up to date
+    by the storage change notifications. It is guarded by a lock, a linker
+    can be shared among threads.
+    """
+    def __init__(self, storage, comparator, **kwargs):
+        import threading
+
+        self.storage = storage
+        self.comparator = comparator
+
+        self.top_k = kwargs.get('linking_top_k', 1)
+
+        # Record the scanned entities, nothing is recorded by default
+        from .instruments import Instrument
+
+        self.instrument = kwargs.get('instrument') or Instrument()
+
+        self.lock = threading.RLock()
+
+        self.exact_linking = kwargs.get('exact_linking', True)
+
+        # Map the normalized surface form to the {entity id: count} of its sources
+        self.surface_forms = None
+
+        # Map the source, ('entity', id) or ('alias', id), to its (surface form, entity id)
+        self.sources = {}
+
+        # The entities reachable from the table
+        self.exact_entities = {}
+
+        self.exact_hits = 0
+        self.exact_misses = 0
+
+        if self.exact_linking:
+            self.storage.add_listener(self.on_surface_forms_changed)
+
+    def __call__(self, mention):
+        return self.link(mention)
+
+    def link(self, mention):
+        """
+        Return the best matching stored entity of the mentioned entity,
+        or None if there is no entity in the storage.
+
+        :param mention: An entity object built from the recognized mention.
+        :rtype: Entity
+        """
+        if self.exact_linking:
+            exact_match = self.lookup(mention)
+
+            if exact_match is not None:
+                self.instrument.count('exact_link_hits')
+                return exact_match
+
+            self.instrument.count('exact_link_misses')
+
+        ranking = self.rank(mention, self.top_k)
+
+        if not ranking:
+            return None
+
+        best_match, _ = ranking[0]
+
+        return best_match
+
+    def rank(self, mention, top_k):
+        """
+        Return the top k stored entities of the mentioned entity, in the
+        descending order of the scores. Equal scores are ordered by the ids
+        of the stored entities.
+
+        :param mention: An entity object built from the recognized mention.
+        :param top_k: The maximum number of the returned entities.
+        :returns: A list of (entity, score) pairs.
+        :rtype: list(tuple(Entity, float))
+        """
+        raise self.LinkerMethodNotImplementedError(
+            'The `rank` method is not implemented by this linker.'
+        )
+
+    def lookup(self, mention):
+        """
+        Return the stored entity whose normalized name or alias equals the
+        normalized name of the mentioned entity, or None on a miss.
+        Among several entities, the one of the mentioned type wins,
+        then the smallest id.
+
+        :param mention: An entity object built from the recognized mention.
+        :rtype: Entity
+        """
+        from . import utils
+
+        with self.lock:
+            if self.surface_forms is None:
+                self.build_surface_forms()
+
+            entity_ids = self.surface_forms.get(utils.normalize_alias(mention.name or ''), ())
+
+            entities = [
+                self.exact_entities[entity_id] for entity_id in sorted(entity_ids)
+                if entity_id in self.exact_entities
+            ]
+
+            if not entities:
+                self.exact_misses += 1
+                return None
+
+            self.exact_hits += 1
+
+            # Strip the brackets of the tagged type
+            mention_type = (mention.type or '').strip('<>')
+
+            for entity in entities:
+                if entity.type == mention_type:
+                    return entity
+
+            return entities[0]
+
+    def link_stats(self):
+        """
+        Return the hits and misses of the exact lookups, and the share of the hits.
+        """
+        with self.lock:
+            lookups = self.exact_hits + self.exact_misses
+
+            return {
+                'hits': self.exact_hits,
+                'misses': self.exact_misses,
+                'hit_rate': self.exact_hits / lookups if lookups else None,
+            }
+
+    def build_surface_forms(self):
+        """
+        Build the table from every stored entity and alias.
+        """
+        Entity = self.storage.get_object('entity')
+
+        self.surface_forms = {}
+        self.sources = {}
+        self.exact_entities = {}
+
+        for entity in self.storage.select(Entity()):
+            self.add_surface_form(entity)
+
+        for alias in self.storage.get_aliases():
+            self.add_surface_form(alias)
+
+    def add_surface_form(self, element):
+        from . import utils
+
+        Entity = self.storage.get_object('entity')
+
+        if isinstance(element, Entity):
+            source, entity_id = ('entity', element.id), element.id
+            self.exact_entities[element.id] = element
+        else:
+            source, entity_id = ('alias', element.id), element.entity_id
+
+        self.discard_surface_form(source)
+
+        surface_form = utils.normalize_alias(element.name or '')
+
+        counts = self.surface_forms.setdefault(surface_form, {})
+        counts[entity_id] = counts.get(entity_id, 0) + 1
+
+        self.sources[source] = (surface_form, entity_id)
+
+    def discard_surface_form(self, source):
+        location = self.sources.pop(source, None)
+
+        if location is None:
+            return
+
+        surface_form, entity_id = location
+
+        counts = self.surface_forms[surface_form]
+        counts[entity_id] -= 1
+
+        if not counts[entity_id]:
+            del counts[entity_id]
+
+            if not counts:
+                del self.surface_forms[surface_form]
+
+    def on_surface_forms_changed(self, event, elements):
+        """
+        Apply the changed entities and aliases to the built table.
+        """
+        with self.lock:
+            if self.surface_forms is None:
+                # Not built yet, the storage will be read on the first use
+                return
+
+            if event == 'drop':
+                self.surface_forms = None
+                return
+
+            Entity = self.storage.get_object('entity')
+            Alias = self.storage.get_object('alias')
+
+            for element in elements:
+                if not isinstance(element, (Entity, Alias)):
+                    continue
+
+                if event != 'remove':
+                    self.add_surface_form(element)
+                elif isinstance(element, Entity):
+                    self.discard_surface_form(('entity', element.id))
+                    self.exact_entities.pop(element.id, None)
+                else:
+                    self.discard_surface_form(('alias', element.id))
+
+    class LinkerMethodNotImplementedError(NotImplementedError):
+        """
+        An exception to be raised when a linker method has not been implemented.
+        Typically this indicates that the method should be implement in a subclass.
+        """
+        pass
+
+
+class _Ranking(object):
+    """
+    A bounded collection keeping the top k (entity, score) pairs.
+    """
+    def __init__(self, top_k):
+        self.top_k = top_k
+        self.heap = []
+
+    def is_full(self):
+        return len(self.heap) >= self.top_k
+
+    def lowest_score(self):
+        """
+        Return the k-th best score, or None if there are less than k entries.
+        """
+        if not self.is_full():
+            return None
+
+        score, _, _ = self.heap[0]
+
+        return score
+
+    def push(self, entity, score):
+        import heapq
+
+        # A smaller id wins a tie, as the full scan of the storage does
+        item = (score, -entity.id, entity)
+
+        if not self.is_full():
+            heapq.heappush(self.heap, item)
+        elif item[:2] > self.heap[0][:2]:
+            heapq.heapreplace(self.heap, item)
+
+    def result(self):
+        return [
+            (entity, score)
+            for score, _, entity in sorted(self.heap, key=lambda item: item[:2], reverse=True)
+        ]
+
+
+class ExhaustiveEntityLinker(EntityLinker):
+    """
+    Score every stored entity for each mentioned entity.
+
+    The cost is linear in the number of stored entities, it is kept as the
+    reference behaviour of the indexed linkers.
+    """
+    def rank(self, mention, top_k):
+        Entity = self.storage.get_object('entity')
+
+        entities = list(self.storage.select(Entity()))
+
+        name_scores = self.comparator.compare_many(
+            mention.name, [entity.name for entity in entities]
+        )
+        type_scores = self.comparator.compare_many(
+            mention.type, [entity.type for entity in entities]
+        )
+
+        self.instrument.count('entities_scanned', len(entities))
+
+        ranking = _Ranking(top_k)
+
+        for entity, name_score, type_score in zip(entities, name_scores, type_scores):
+            ranking.push(entity, float(name_score + type_score) / 2)
+
+        return ranking.result()
+
+
+class BKTree(object):
+    """
+    A Burkhard-Keller tree over a discrete metric, each node holds a key
+    and the items sharing the key.
+
+    Discarded items leave their node in place to keep the tree routable,
+    a node without items is never reported.
+
+    The distance takes a ``max_distance`` keyword as ``levenshtein_distance``
+    does, a search stops measuring a node beyond the farthest distance
+    of its children it can still visit.
+    """
+    def __init__(self, distance=levenshtein_distance):
+        self.distance = distance
+
+        # A node is a list of [key, items, children]
+        self.root = None
+        self.nodes = {}
+
+    def __len__(self):
+        return sum(len(items) for _, items, _ in self.nodes.values())
+
+    def add(self, key, item_id, item):
+        """
+        Add an item with the given key.
+        """
+        if key in self.nodes:
+            self.nodes[key][1][item_id] = item
+            return
+
+        new_node = [key, {item_id: item}, {}]
+        self.nodes[key] = new_node
+
+        if self.root is None:
+            self.root = new_node
+            return
+
+        node = self.root
+        while True:
+            distance = self.distance(key, node[0])
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = new_node
+                return
+            node = child
+
+    def discard(self, key, item_id):
+        """
+        Discard an item with the given key if present.
+        """
+        node = self.nodes.get(key)
+
+        if node is not None:
+            node[1].pop(item_id, None)
+
+    def search(self, key, radius):
+        """
+        Yield (distance, key, items) of every node within the radius of the key.
+
+        The radius is a callable evaluated on each visit, so that a search
+        can be narrowed by the results it has yielded. Closer subtrees
+        are visited first.
+        """
+        if self.root is None:
+            return
+
+        stack = [self.root]
+
+        while stack:
+            node = stack.pop()
+            limit = radius()
+
+            if limit == float('inf'):
+                distance = self.distance(key, node[0])
+            else:
+                # Beyond the bound, the node is out of the radius and so are its children
+                distance = self.distance(
+                    key, node[0], max_distance=int(limit) + max(node[2], default=0)
+                )
+
+            if node[1] and distance <= limit:
+                yield distance, node[0], node[1]
+                limit = radius()
+
+            # Push the farther children first to pop the closer ones first
+            children = [
+                (abs(edge - distance), child) for edge, child in node[2].items()
+                if distance - limit <= edge <= distance + limit
+            ]
+            children.sort(key=lambda item: item[0], reverse=True)
+            stack.extend(child for _, child in children)
+
+
+class BKTreeEntityLinker(EntityLinker):
+    """
+    Link the mentioned entity with BK-trees of the lowercased stored names,
+    one tree per stored type.
+
+    The index is built from the storage on the first use, then kept up to date
+    by the storage change notifications.
+
+    The ranking equals the one of ``ExhaustiveEntityLinker`` as long as
+    the word comparator is a ratio of matched characters, such as
+    ``LevenshteinSimilarity``, whose score is bounded by the edit distance:
+    ``ratio <= 1 - distance / (len(a) + len(b))``. The types are scored once
+    per tree, the trees are searched in the descending order of their type
+    scores, and each search is narrowed to the distance below which
+    a name can still enter the top k.
+
+    The index is guarded by a lock, a linker can be shared among threads.
+    """
+    # Tolerance of the comparators rounding their scores to 2 decimals
+    ROUNDING_TOLERANCE = 0.0051
+
+    def __init__(self, storage, comparator, **kwargs):
+        super().__init__(storage, comparator, **kwargs)
+
+        self.trees = None
+
+        # Map the entity id to the (type, key) of its tree node
+        self.locations = {}
+
+        self.storage.add_listener(self.on_storage_changed)
+
+    def build(self):
+        """
+        Build the trees from every stored entity.
+        """
+        Entity = self.storage.get_object('entity')
+
+        self.trees = {}
+        self.locations = {}
+
+        for entity in self.storage.select(Entity()):
+            self.add(entity)
+
+    def add(self, entity):
+        if entity.id in self.locations:
+            self.discard(entity)
+
+        key = (entity.name or '').lower()
+
+        tree = self.trees.get(entity.type)
+        if tree is None:
+            tree = self.trees[entity.type] = BKTree()
+
+        tree.add(key, entity.id, entity)
+        self.locations[entity.id] = (entity.type, key)
+
+    def discard(self, entity):
+        location = self.locations.pop(entity.id, None)
+
+        if location is not None:
+            entity_type, key = location
+            self.trees[entity_type].discard(key, entity.id)
+
+    def on_storage_changed(self, event, elements):
+        """
+        Apply the changed entities to the built index.
+        """
+        with self.lock:
+            if self.trees is None:
+                # Not built yet, the storage will be read on the first use
+                return
+
+            if event == 'drop':
+                self.trees = None
+                return
+
+            Entity = self.storage.get_object('entity')
+
+            for element in elements:
+                if not isinstance(element, Entity):
+                    continue
+
+                if event == 'remove':
+                    self.discard(element)
+                else:
+                    self.add(element)
+
+    def rank(self, mention, top_k):
+        with self.lock:
+            if self.trees is None:
+                self.build()
+
+            key = (mention.name or '').lower()
+
+            # Score each type once
+            entity_types = list(self.trees)
+
+            type_scores = sorted(
+                zip(self.comparator.compare_many(mention.type, entity_types), entity_types),
+                key=lambda item: item[0],
+                reverse=True
+            )
+
+            ranking = _Ranking(top_k)
+
+            scanned_entities = 0
+
+            for type_score, entity_type in type_scores:
+                lowest_score = ranking.lowest_score()
+
+                # A name scores 1 at most, the following trees can`t enter the top k
+                if lowest_score is not None and (1 + type_score) / 2 < lowest_score:
+                    break
+
+                def radius():
+                    return self.radius(len(key), type_score, ranking.lowest_score())
+
+                for _, name, items in self.trees[entity_type].search(key, radius):
+                    # The comparator is case insensitive, the items share the name score
+                    name_score = self.name_score(name, mention.name, type_score, ranking.lowest_score())
+
+                    for entity in items.values():
+                        ranking.push(entity, float(name_score + type_score) / 2)
+
+                    scanned_entities += len(items)
+
+            self.instrument.count('entities_scanned', scanned_entities)
+
+            return ranking.result()
+
+    def name_score(self, name, mention_name, type_score, lowest_score):
+        """
+        Return the score of the name, given the least name score tying the lowest
+        score of the ranking as the cutoff, if the comparator supports it.
+        A name which can`t enter the ranking may be scored 0.
+        """
+        if lowest_score is None or not getattr(self.comparator, 'supports_score_cutoff', False):
+            return self.comparator(name, mention_name)
+
+        # Below the exact least score, a smaller id can still win a tie
+        return self.comparator.compare(
+            name, mention_name, score_cutoff=2 * lowest_score - type_score - 1e-9
+        )
+
+    def radius(self, length, type_score, lowest_score):
+        """
+        Return the largest edit distance of a name which can still score
+        the lowest score of the ranking within a tree of the given type score.
+        """
+        if lowest_score is None or not length:
+            return float('inf')
+
+        # The least name score to reach the lowest score
+        least_score = 2 * lowest_score - type_score - self.ROUNDING_TOLERANCE
+
+        if least_score <= 0:
+            return float('inf')
+
+        # ratio <= 1 - d / (2 * length + d), since the other name is d longer at most
+        return int(2 * length * (1 - least_score) / least_score)
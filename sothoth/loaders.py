@@ -0,0 +1,364 @@
+"""
+Streaming knowledge loaders.
+
+A file is read lazily line by line, each line is parsed to a triple, and the
+triples are grouped into bounded batches for the storage. Every batch carries
+the byte offset following its last line, so that a crashed load can resume
+from the last stored batch.
+
+Supported formats:
+
+- ``jsonl``: One serialized triple per line, e.g.
+  ``{"subject": {"name": "Obama", "type": "PERSON"},
+  "predicate": {"type": "AGE", "contexts": ["How old is <PERSON>"]},
+  "object": {"name": "58", "type": "NUMBER"}}``
+- ``csv``: A header line and the columns ``subject``, ``subject_type``,
+  ``predicate``, ``object``, ``object_type`` and ``contexts`` separated by ``|``.
+  A quoted field can`t span lines.
+- ``ntriples``: RDF N-Triples, the names are the local names of the IRIs and
+  the lexical values of the literals, the literal types are their datatypes.
+  The relationships have no contexts.
+
+The subject type and the object type of a relationship default to the types
+of its subject and object.
+"""
+import re
+import logging
+
+
+FORMATS = {
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.csv': 'csv',
+    '.nt': 'ntriples',
+}
+
+
+def guess_format(path):
+    """
+    Return the format of the file by its extension.
+    """
+    import os
+
+    _, extension = os.path.splitext(path)
+
+    if extension.lower() not in FORMATS:
+        raise LoaderException(
+            'Unknown format of {}, one of {} is expected.'.format(path, sorted(FORMATS))
+        )
+
+    return FORMATS[extension.lower()]
+
+
+def read_lines(path, offset=0):
+    """
+    Yield (line, end_offset) of every line of the file from the byte offset.
+    """
+    with open(path, 'rb') as file:
+        file.seek(offset)
+
+        for line in file:
+            offset += len(line)
+            yield line.decode('utf-8'), offset
+
+
+def build_triple(subject, predicate, object):
+    """
+    Return a triple from the dictionaries of its subject, predicate and object.
+    """
+    from .elements import Triple, Entity, Relationship, Statement
+
+    contexts = [
+        Statement(text=context['text'] if isinstance(context, dict) else context)
+        for context in predicate.get('contexts') or []
+    ]
+
+    return Triple(
+        subject=Entity(name=subject['name'], type=subject.get('type')),
+        predicate=Relationship(
+            type=predicate['type'],
+            subject_type=predicate.get('subject_type', subject.get('type')),
+            object_type=predicate.get('object_type', object.get('type')),
+            contexts=contexts
+        ),
+        object=Entity(name=object['name'], type=object.get('type'))
+    )
+
+
+def parse_jsonl(lines):
+    """
+    Yield (triple, end_offset) of every JSON line.
+    """
+    import json
+
+    for line, offset in lines:
+        if not line.strip():
+            continue
+
+        record = json.loads(line)
+
+        yield build_triple(record['subject'], record['predicate'], record['object']), offset
+
+
+def parse_csv(lines, header):
+    """
+    Yield (triple, end_offset) of every CSV line, with the given header fields.
+    """
+    import csv
+
+    for line, offset in lines:
+        if not line.strip():
+            continue
+
+        record = dict(zip(header, next(csv.reader([line]))))
+
+        yield build_triple(
+            {'name': record['subject'], 'type': record.get('subject_type') or None},
+            {
+                'type': record['predicate'],
+                'contexts': [
+                    context for context in (record.get('contexts') or '').split('|') if context
+                ],
+            },
+            {'name': record['object'], 'type': record.get('object_type') or None},
+        ), offset
+
+
+_NTRIPLE_TERM = r'<[^>]*>|_:\S+|"(?:[^"\\]|\\.)*"(?:@[\w-]+|\^\^<[^>]*>)?'
+
+_NTRIPLE = re.compile(
+    r'^\s*({0})\s+({0})\s+({0})\s*\.\s*$'.format(_NTRIPLE_TERM)
+)
+
+_NTRIPLE_ESCAPE = re.compile(r'\\(u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|.)')
+
+_NTRIPLE_ESCAPES = {'t': '\t', 'b': '\b', 'n': '\n', 'r': '\r', 'f': '\f'}
+
+
+def _local_name(iri):
+    return re.split(r'[/#]', iri)[-1] or iri
+
+
+def _unescape(match):
+    escape = match.group(1)
+
+    if escape[0] in 'uU':
+        return chr(int(escape[1:], 16))
+
+    return _NTRIPLE_ESCAPES.get(escape, escape)
+
+
+def parse_ntriples_term(term):
+    """
+    Return the (name, type) of an N-Triples term.
+    """
+    if term.startswith('<'):
+        return _local_name(term[1:-1]), None
+
+    if term.startswith('_:'):
+        return term[2:], None
+
+    # A literal, with a language tag or a datatype
+    value, _, suffix = term[1:].rpartition('"')
+    value = _NTRIPLE_ESCAPE.sub(_unescape, value)
+
+    if suffix.startswith('^^'):
+        return value, _local_name(suffix[3:-1])
+
+    return value, None
+
+
+def parse_ntriples(lines):
+    """
+    Yield (triple, end_offset) of every N-Triples statement.
+    """
+    for line, offset in lines:
+        if not line.strip() or line.lstrip().startswith('#'):
+            continue
+
+        match = _NTRIPLE.match(line)
+        if not match:
+            raise LoaderException('Illegal N-Triples line: {}'.format(line.strip()))
+
+        subject, predicate, object = match.groups()
+
+        subject_name, subject_type = parse_ntriples_term(subject)
+        predicate_name, _ = parse_ntriples_term(predicate)
+        object_name, object_type = parse_ntriples_term(object)
+
+        yield build_triple(
+            {'name': subject_name, 'type': subject_type},
+            {'type': predicate_name},
+            {'name': object_name, 'type': object_type},
+        ), offset
+
+
+def parse(path, format=None, offset=0):
+    """
+    Return a generator of (triple, end_offset) of every record of the file
+    from the byte offset.
+    """
+    format = format or guess_format(path)
+
+    if format == 'jsonl':
+        return parse_jsonl(read_lines(path, offset))
+
+    if format == 'csv':
+        import csv
+
+        # The header is read from the beginning whatever the offset
+        header_lines = read_lines(path)
+        header_line, header_offset = next(header_lines, ('', 0))
+        header_lines.close()
+
+        header = next(csv.reader([header_line]), [])
+
+        return parse_csv(read_lines(path, max(offset, header_offset)), header)
+
+    if format == 'ntriples':
+        return parse_ntriples(read_lines(path, offset))
+
+    raise LoaderException('Unknown format {}.'.format(format))
+
+
+def batch(records, batch_size):
+    """
+    Yield (triples, end_offset) of every batch of at most batch_size records.
+    """
+    triples, end_offset = [], None
+
+    for triple, offset in records:
+        triples.append(triple)
+        end_offset = offset
+
+        if len(triples) >= batch_size:
+            yield triples, end_offset
+            triples = []
+
+    if triples:
+        yield triples, end_offset
+
+
+def load_knowledge(storage, path, **kwargs):
+    """
+    Stream the triples of a file to the storage by batches.
+
+    :keyword format: One of 'jsonl', 'csv' or 'ntriples', guessed by the extension by default.
+    :keyword batch_size: The maximum number of triples held in memory and
+        created per transaction.
+    :keyword offset: The byte offset to start reading from.
+    :keyword checkpoint: A file path where the byte offset following the last
+        stored batch is written. An existing checkpoint is resumed from,
+        unless an offset is given.
+    :returns: The byte offset following the last stored batch.
+    :rtype: int
+    """
+    logger = kwargs.get('logger', logging.getLogger(__name__))
+
+    batch_size = kwargs.get('batch_size', 1000)
+    checkpoint = kwargs.get('checkpoint')
+
+    offset = kwargs.get('offset')
+    if offset is None:
+        offset = read_checkpoint(checkpoint) if checkpoint else 0
+
+    if offset:
+        logger.info('Resuming {} from byte {}'.format(path, offset))
+
+    import time
+
+    records = parse(path, kwargs.get('format'), offset)
+
+    loaded_count = 0
+    start_time = time.monotonic()
+
+    for triples, offset in batch(records, batch_size):
+        storage.create_many(triples, chunk_size=batch_size)
+
+        if checkpoint:
+            write_checkpoint(checkpoint, offset)
+
+        loaded_count += len(triples)
+        elapsed_time = time.monotonic() - start_time
+
+        logger.info('Loaded {} triples of {} up to byte {}, {:.0f} triples/sec'.format(
+            loaded_count, path, offset, loaded_count / elapsed_time if elapsed_time else float('inf')
+        ))
+
+    return offset
+
+
+def read_checkpoint(checkpoint):
+    """
+    Return the byte offset written in the checkpoint, or 0 if there is none.
+    """
+    try:
+        with open(checkpoint) as file:
+            return int(file.read().strip() or 0)
+    except FileNotFoundError:
+        return 0
+
+
+def write_checkpoint(checkpoint, offset):
+    """
+    Replace the byte offset of the checkpoint atomically.
+    """
+    import os
+
+    temporary = checkpoint + '.tmp'
+    with open(temporary, 'w') as file:
+        file.write(str(offset))
+
+    os.replace(temporary, checkpoint)
+
+
+def main(argv=None):
+    """
+    Command-line entry point, ``python -m sothoth.loaders --help`` for usage.
+    """
+    import argparse
+    from . import utils
+
+    parser = argparse.ArgumentParser(
+        prog='python -m sothoth.loaders',
+        description='Stream the triples of JSON Lines, CSV or N-Triples files to a storage.'
+    )
+    parser.add_argument('paths', nargs='+', help='files to load')
+    parser.add_argument('--format', choices=sorted(set(FORMATS.values())),
+                        help='format of the files, guessed by their extensions by default')
+    parser.add_argument('--storage-adapter', default='sothoth.storage.SQLStorageAdapter',
+                        help='dotted path of the storage adapter')
+    parser.add_argument('--database-uri', default=False,
+                        help='database uri of the storage adapter')
+    parser.add_argument('--batch-size', type=int, default=1000,
+                        help='triples held in memory and created per transaction')
+    parser.add_argument('--offset', type=int,
+                        help='byte offset to start reading the first file from')
+    parser.add_argument('--resume', action='store_true',
+                        help='keep the byte offset of the last stored batch of each file '
+                             'in <file>.offset, and resume from it')
+
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+
+    storage = utils.initialize_class(args.storage_adapter, database_uri=args.database_uri)
+
+    offset = args.offset
+    for path in args.paths:
+        load_knowledge(
+            storage, path,
+            format=args.format,
+            batch_size=args.batch_size,
+            offset=offset,
+            checkpoint='{}.offset'.format(path) if args.resume else None
+        )
+        offset = None
+
+
+class LoaderException(Exception):
+    pass
+
+
+if __name__ == '__main__':
+    main()
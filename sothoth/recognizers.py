@@ -16,6 +16,8 @@ class Recognizer(object):
         Detect entity for the given tagged tokens sequence, and return a 
         list of NER tagged tuples.  A tagged tuple is encoded as a 
         tuple ``(entity, pos tag, '<entity_type>') or (token, pos tag, '<>')``.
+        A recognizer linking the entity to a stored one appends its id,
+        ``(entity, pos tag, '<entity_type>', entity_id)``.
 
         :param tokens: A list of tagged tokens.
         :returns: A list of (entity, pos_tag, entity_type) pairs.
@@ -25,6 +27,29 @@ class Recognizer(object):
             'The `tag` method is not implemented by this recognizer.'
         )
 
+    def distinct_many(self, tagged_sentences):
+        """
+        Return a list of NER tagged tuples for each tagged tokens sequence.
+
+        :param tagged_sentences: A list of tagged token lists.
+        :rtype list(list(tuple(str, str, str)))
+        """
+        return [self.distinct(tagged_tokens) for tagged_tokens in tagged_sentences]
+
+    def fit(self, storage):
+        """
+        Learn from the storaged entities before recognizing.
+        Recognizers which don`t need the storage leave it unused.
+        """
+        pass
+
+    def get_version(self):
+        """
+        Return the version of the knowledge the recognition depends on,
+        the memoized results of another version are recognized again.
+        """
+        return None
+
     class RecognizerMethodNotImplementedError(NotImplementedError):
         """
         An exception to be raised when a tagger method has not been implemented.
@@ -32,19 +57,81 @@ class Recognizer(object):
         """
         pass
 
+class MemoizedRecognizer(Recognizer):
+    """
+    Recognize by the given recognizer, memoizing the NER tagged tuples
+    of each tagged tokens sequence in the cache.
+    """
+    def __init__(self, recognizer, cache):
+        self.recognizer = recognizer
+        self.cache = cache
+
+    def distinct(self, tagged_tokens):
+        return self.distinct_many([tagged_tokens])[0]
+
+    def distinct_many(self, tagged_sentences):
+        from .caches import memoize_many
+
+        return memoize_many(
+            self.cache, tagged_sentences,
+            lambda tagged_tokens: tuple(map(tuple, tagged_tokens)),
+            self.recognizer.distinct_many,
+            version=self.recognizer.get_version()
+        )
+
+    def fit(self, storage):
+        self.recognizer.fit(storage)
+
+    def get_version(self):
+        return self.recognizer.get_version()
+
 class MaximumEntropyRecognizer(Recognizer):
     """
     Maximum entropy named entity recognizer from nltk module.
+
+    The trained chunker is loaded once per process, on the first use.
     """
     def __init__(self, **kwargs):
-        import nltk
-        self.maxent_distinct = nltk.ne_chunk
+        pass
+
+    def get_model(self):
+        """
+        Return the multiclass named entity chunker of the process.
+        """
+        from . import registry
+
+        def load():
+            try:
+                from nltk.chunk import ne_chunker
+            except ImportError:
+                # Before nltk 3.9
+                import nltk.data
+                from nltk.chunk import _MULTICLASS_NE_CHUNKER
+                return nltk.data.load(_MULTICLASS_NE_CHUNKER)
+
+            return ne_chunker()
+
+        return registry.get_model('nltk.ne_chunker', load)
 
     def distinct(self, tagged_tokens):
+        # Equals nltk.ne_chunk
+        result_tree = self.get_model().parse(tagged_tokens)
+
+        return self.format_tree(result_tree)
+
+    def distinct_many(self, tagged_sentences):
+        return [
+            self.format_tree(result_tree)
+            for result_tree in self.get_model().parse_sents(tagged_sentences)
+        ]
+
+    def format_tree(self, result_tree):
+        """
+        Flatten a chunked tree to a list of NER tagged tuples.
+        """
         import nltk.tree
         from collections import Counter
-        result_tree = self.maxent_distinct(tagged_tokens)
-        
+
         # Format the result
         result_list = []
         for item in result_tree:
@@ -68,3 +155,331 @@ class MaximumEntropyRecognizer(Recognizer):
                 result_list.append((item[0], item[1], '<>'))
 
         return result_list
+
+
+class AhoCorasick(object):
+    """
+    An Aho-Corasick automaton over token sequences, each keyword holds
+    the items sharing it.
+
+    Keywords are added incrementally, the failure links are linked again
+    on the next search after new states were added. Discarded items leave
+    their states in place.
+    """
+    def __init__(self):
+        # A state is a list of [transitions, failure, output, depth, items],
+        # the output is the nearest keyword state along the failure links
+        # and the items are None unless a keyword ends in the state
+        self.states = [[{}, 0, 0, 0, None]]
+
+        self.linked = True
+
+    def add(self, keyword, item_id, item):
+        """
+        Add an item with the given keyword, a sequence of tokens.
+        """
+        state = 0
+
+        for token in keyword:
+            transitions = self.states[state][0]
+
+            if token not in transitions:
+                transitions[token] = len(self.states)
+                self.states.append([{}, 0, 0, self.states[state][3] + 1, None])
+                self.linked = False
+
+            state = transitions[token]
+
+        if self.states[state][4] is None:
+            self.states[state][4] = {}
+            self.linked = False
+
+        self.states[state][4][item_id] = item
+
+    def discard(self, keyword, item_id):
+        """
+        Discard an item with the given keyword if present.
+        """
+        state = 0
+
+        for token in keyword:
+            state = self.states[state][0].get(token)
+
+            if state is None:
+                return
+
+        if self.states[state][4] is not None:
+            self.states[state][4].pop(item_id, None)
+
+    def link(self):
+        """
+        Link the failure and the output of every state, breadth first.
+        """
+        from collections import deque
+
+        queue = deque()
+
+        for child in self.states[0][0].values():
+            self.states[child][1] = self.states[child][2] = 0
+            queue.append(child)
+
+        while queue:
+            state = queue.popleft()
+
+            for token, child in self.states[state][0].items():
+                failure = self.states[state][1]
+
+                while failure and token not in self.states[failure][0]:
+                    failure = self.states[failure][1]
+
+                failure = self.states[failure][0].get(token, 0)
+
+                self.states[child][1] = failure
+                self.states[child][2] = (
+                    failure if self.states[failure][4] is not None else self.states[failure][2]
+                )
+
+                queue.append(child)
+
+        self.linked = True
+
+    def search(self, tokens):
+        """
+        Yield (start, end, items) of every keyword occurring in the tokens,
+        in a single pass.
+        """
+        if not self.linked:
+            self.link()
+
+        state = 0
+
+        for index, token in enumerate(tokens):
+            while state and token not in self.states[state][0]:
+                state = self.states[state][1]
+
+            state = self.states[state][0].get(token, 0)
+
+            match = state if self.states[state][4] is not None else self.states[state][2]
+
+            while match:
+                _, _, output, depth, items = self.states[match]
+
+                if items:
+                    yield index + 1 - depth, index + 1, items
+
+                match = output
+
+
+class GazetteerRecognizer(Recognizer):
+    """
+    Recognize the mentions of the stored entities by their names.
+
+    The lowercased tokens of every stored name, of the stored aliases of its
+    entity, and of the aliases of the name, are compiled into an Aho-Corasick
+    automaton, which finds the mentions in a single pass over the tokens.
+    The longest of the mentions starting first wins an overlap. A mention
+    is tagged by the stored type and id of its entity, so that it is linked
+    without searching, and the entity of the smallest id wins a name shared
+    by several entities.
+
+    The automaton is built from the storage on the first use, then kept up
+    to date by the storage change notifications, of the aliases too.
+
+    :keyword tokenizer: The tokenizer of the stored names, which should be
+        the one of the questions.
+    :keyword gazetteer_aliases: A dictionary mapping other surface forms
+        to the stored names, e.g. ``{'Barack Obama': 'Obama'}``.
+    """
+    def __init__(self, **kwargs):
+        import threading
+        from . import utils
+        from collections import defaultdict
+        tokenizer = kwargs.get('tokenizer', 'sothoth.tokenizers.TreebankTokenizer')
+
+        self.tokenizer = utils.initialize_class(tokenizer, **kwargs)
+
+        # Map the stored name to its aliases
+        self.aliases = defaultdict(list)
+        for alias, name in kwargs.get('gazetteer_aliases', {}).items():
+            self.aliases[name].append(alias)
+
+        self.storage = None
+
+        self.automaton = None
+
+        # Map the entity id to the keywords of its name and aliases
+        self.keywords = {}
+
+        # The entities of the automaton, and the stored aliases
+        # as {entity id: {alias id: name}}
+        self.entities = {}
+        self.stored_aliases = defaultdict(dict)
+
+        # Increased by every change of the automaton
+        self.version = 0
+
+        self.lock = threading.RLock()
+
+    def fit(self, storage):
+        """
+        Follow the changes of the storage, the automaton is built on the first use.
+        """
+        with self.lock:
+            if self.storage is None:
+                storage.add_listener(self.on_storage_changed)
+            elif self.storage is not storage:
+                self.storage.remove_listener(self.on_storage_changed)
+                storage.add_listener(self.on_storage_changed)
+
+            self.storage = storage
+
+            self.automaton = None
+            self.version += 1
+
+    def get_version(self):
+        return self.version
+
+    def build(self):
+        """
+        Build the automaton from every stored entity and alias.
+        """
+        Entity = self.storage.get_object('entity')
+
+        self.automaton = AhoCorasick()
+        self.keywords = {}
+        self.entities = {}
+        self.stored_aliases.clear()
+
+        for alias in self.storage.get_aliases():
+            self.stored_aliases[alias.entity_id][alias.id] = alias.name
+
+        self.add_many(list(self.storage.select(Entity())))
+
+    def add_many(self, entities):
+        entities = [entity for entity in entities if entity.name]
+
+        for entity in entities:
+            self.discard(entity)
+
+        # Tokenize the names and the aliases in a single batch
+        surface_forms = [
+            [entity.name] + self.aliases.get(entity.name, [])
+            + list(self.stored_aliases.get(entity.id, {}).values())
+            for entity in entities
+        ]
+        tokenized_forms = iter(self.tokenizer.tokenize_many(
+            [form for forms in surface_forms for form in forms]
+        ))
+
+        for entity, forms in zip(entities, surface_forms):
+            keywords = set()
+
+            for _ in forms:
+                keyword = tuple(token.lower() for token in next(tokenized_forms))
+
+                if keyword:
+                    keywords.add(keyword)
+
+            for keyword in keywords:
+                self.automaton.add(keyword, entity.id, (entity.name, entity.type))
+
+            self.keywords[entity.id] = keywords
+            self.entities[entity.id] = entity
+
+    def discard(self, entity):
+        for keyword in self.keywords.pop(entity.id, ()):
+            self.automaton.discard(keyword, entity.id)
+
+        self.entities.pop(entity.id, None)
+
+    def on_storage_changed(self, event, elements):
+        """
+        Apply the changed entities and aliases to the built automaton.
+        """
+        with self.lock:
+            if self.automaton is None:
+                # Not built yet, the storage will be read on the first use
+                return
+
+            if event == 'drop':
+                self.automaton = None
+                self.version += 1
+                return
+
+            Entity = self.storage.get_object('entity')
+            Alias = self.storage.get_object('alias')
+
+            entities = [element for element in elements if isinstance(element, Entity)]
+            aliases = [element for element in elements if isinstance(element, Alias)]
+
+            if not entities and not aliases:
+                return
+
+            if event == 'remove':
+                for entity in entities:
+                    self.discard(entity)
+                    self.stored_aliases.pop(entity.id, None)
+
+                for alias in aliases:
+                    self.stored_aliases.get(alias.entity_id, {}).pop(alias.id, None)
+
+                changed_entities = {}
+            else:
+                for alias in aliases:
+                    self.stored_aliases[alias.entity_id][alias.id] = alias.name
+
+                changed_entities = dict((entity.id, entity) for entity in entities)
+
+            # Add the entities again with their changed aliases
+            for alias in aliases:
+                if alias.entity_id in self.entities:
+                    changed_entities.setdefault(alias.entity_id, self.entities[alias.entity_id])
+
+            self.add_many(list(changed_entities.values()))
+
+            self.version += 1
+
+    def distinct(self, tagged_tokens):
+        from collections import Counter
+
+        tagged_tokens = list(tagged_tokens)
+
+        with self.lock:
+            if self.automaton is None:
+                self.build()
+
+            matches = [
+                (start, end, dict(items))
+                for start, end, items in self.automaton.search(
+                    [token.lower() for token, _ in tagged_tokens]
+                )
+            ]
+
+        # Keep the longest of the mentions starting first
+        matches.sort(key=lambda match: (match[0], -match[1]))
+
+        result_list = []
+        position = 0
+
+        for start, end, items in matches:
+            if start < position:
+                continue
+
+            result_list.extend(
+                (token, pos_tag, '<>') for token, pos_tag in tagged_tokens[position:start]
+            )
+
+            entity_id = min(items)
+            entity_name, entity_type = items[entity_id]
+
+            # Get the most common pos tag as the entity pos tag
+            counter = Counter(pos_tag for _, pos_tag in tagged_tokens[start:end])
+            most_common_tag, _ = counter.most_common(1)[0]
+
+            result_list.append((entity_name, most_common_tag, '<%s>' % entity_type, entity_id))
+
+            position = end
+
+        result_list.extend((token, pos_tag, '<>') for token, pos_tag in tagged_tokens[position:])
+
+        return result_list
@@ -0,0 +1,50 @@
+"""
+A process-wide registry of the loaded NLP models.
+
+A model is loaded once per process on its first request, then shared by every
+component asking for it by the same name, whichever Answeroid holds them.
+"""
+import threading
+
+
+_models = {}
+
+_lock = threading.Lock()
+
+
+def get_model(name, loader):
+    """
+    Return the model registered by the name, loading it by calling
+    the loader on the first request.
+
+    :param name: The name of the model, e.g. 'nltk.perceptron_tagger'.
+    :param loader: A callable without arguments returning the model.
+    """
+    try:
+        return _models[name]
+    except KeyError:
+        pass
+
+    with _lock:
+        # Another thread might have loaded it meanwhile
+        if name not in _models:
+            _models[name] = loader()
+
+        return _models[name]
+
+
+def loaded_models():
+    """
+    Return the names of the loaded models.
+
+    :rtype: list(str)
+    """
+    return sorted(_models)
+
+
+def clear():
+    """
+    Forget every loaded model, the following requests load them again.
+    """
+    with _lock:
+        _models.clear()
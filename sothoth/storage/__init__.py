@@ -1,7 +1,11 @@
 from .storage_adapter import StorageAdapter
 from .sql_storage import SQLStorageAdapter
+from .async_sql_storage import AsyncSQLStorageAdapter
+from .memory_storage import MemoryStorageAdapter
 
 __all__ = (
 	'StorageAdapter',
 	'SQLStorageAdapter',
+	'AsyncSQLStorageAdapter',
+	'MemoryStorageAdapter',
 )
\ No newline at end of file
@@ -0,0 +1,76 @@
+from .sql_storage import SQLStorageAdapter
+
+
+class AsyncSQLStorageAdapter(SQLStorageAdapter):
+    """
+    The AsyncSQLStorageAdapter provides coroutines of the SQLStorageAdapter
+    methods for asyncio applications, prefixed by 'a', e.g. ``aselect()``.
+
+    The coroutines wait for a thread pool of the adapter, sized as the
+    connection pool, so that the database waits never block the event loop.
+    The adapter is always thread safe, an in-memory sqlite database is
+    not supported.
+
+    :keyword pool_size: The number of connections kept by the pool and
+        the number of threads running the database calls.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs['thread_safe'] = True
+
+        super().__init__(**kwargs)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.executor = ThreadPoolExecutor(
+            max_workers=kwargs.get('pool_size', 5), thread_name_prefix='sothoth-storage'
+        )
+
+    async def _run(self, function, *args, **kwargs):
+        import asyncio
+        import functools
+
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(self.executor, functools.partial(function, *args, **kwargs))
+
+    async def aselect(self, element):
+        """
+        Return a list of objects that matches the given element object.
+        """
+        return await self._run(lambda: list(self.select(element)))
+
+    async def aget_candidate_triples(self, entity, **kwargs):
+        """
+        Return a list of the candidate triples of the entity,
+        see ``get_candidate_triples()``.
+        """
+        return await self._run(lambda: list(self.get_candidate_triples(entity, **kwargs)))
+
+    async def acreate(self, triple):
+        return await self._run(self.create, triple)
+
+    async def acreate_many(self, triples, **kwargs):
+        return await self._run(self.create_many, triples, **kwargs)
+
+    async def aupdate(self, element):
+        return await self._run(self.update, element)
+
+    async def aremove(self, element):
+        return await self._run(self.remove, element)
+
+    async def aadd_aliases(self, aliases):
+        return await self._run(self.add_aliases, aliases)
+
+    async def aremove_aliases(self, aliases):
+        return await self._run(self.remove_aliases, aliases)
+
+    async def adrop(self):
+        return await self._run(self.drop)
+
+    def close(self):
+        """
+        Wait for the running database calls, then close the connections.
+        """
+        self.executor.shutdown(wait=True)
+        self.engine.dispose()
@@ -0,0 +1,757 @@
+from . import StorageAdapter
+
+
+class MemoryStorageAdapter(StorageAdapter):
+    """
+    The MemoryStorageAdapter keeps the knowledge graph in the memory of the
+    process, for serving read-heavy workloads without any SQL on the hot path.
+
+    The elements are indexed by hash tables on the entity id, name and type,
+    and on the relationship id and type, and every entity holds the adjacency
+    lists of the triples it is the subject or the object of.
+
+    The selected elements and aliases are copies, changing them leaves the graph
+    until they are given to ``update()``. The candidate triples are the stored
+    objects, shared among the callers to keep the answering free of copies,
+    they must not be changed. Changes are not written back to the database
+    the adapter is loaded from.
+
+    :keyword database_uri: eg: sqlite:///database_test.db',
+        The SQL database to bulk-load at startup, an empty graph by default.
+    :type database_uri: str
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.reset()
+
+        self.database_uri = kwargs.get('database_uri')
+
+        if self.database_uri:
+            self.load(self.database_uri)
+
+    def reset(self):
+        """
+        Empty the graph and its indexes.
+        """
+        self.entities = {}
+        self.relationships = {}
+        self.statements = {}
+        self.triples = {}
+        self.aliases = {}
+
+        # Map the unique keys to the ids
+        self.entity_keys = {}
+        self.relationship_keys = {}
+        self.statement_keys = {}
+        self.triple_keys = {}
+        self.alias_keys = {}
+
+        # Map the indexed attributes to the sets of ids
+        self.entities_by_name = {}
+        self.entities_by_type = {}
+        self.relationships_by_type = {}
+        self.statements_by_text = {}
+
+        # Map the statement id to the id of its relationship
+        self.statement_parents = {}
+
+        # Adjacency lists, map the entity or relationship id to the set of triple ids
+        self.triples_by_subject = {}
+        self.triples_by_predicate = {}
+        self.triples_by_object = {}
+
+        # Map the entity id to the set of its alias ids
+        self.aliases_by_entity = {}
+
+        self.last_ids = {'entity': 0, 'relationship': 0, 'statement': 0, 'triple': 0, 'alias': 0}
+
+    def load(self, database_uri):
+        """
+        Bulk-load every row of an SQL database created by the SQLStorageAdapter,
+        by a single select per table.
+        """
+        import time
+        from sqlalchemy import create_engine, select
+        from ..ext.sqlalchemy_app.models import Alias, Entity, Relationship, Statement, Triple
+
+        start_time = time.monotonic()
+
+        self.reset()
+
+        engine = create_engine(database_uri)
+
+        with engine.connect() as connection:
+            for row in connection.execute(select([Entity.__table__]).order_by(Entity.id)):
+                self._add_entity(row.id, row.type, row.name)
+
+            for row in connection.execute(select([Relationship.__table__]).order_by(Relationship.id)):
+                self._add_relationship(row.id, row.type, row.subject_type, row.object_type)
+
+            for row in connection.execute(select([Statement.__table__]).order_by(Statement.id)):
+                self._add_statement(row.id, row.text, row.relationship_id)
+
+            for row in connection.execute(select([Triple.__table__]).order_by(Triple.id)):
+                self._add_triple(row.id, row.subject_id, row.predicate_id, row.object_id)
+
+            # The databases created before the aliases have no alias table
+            if engine.dialect.has_table(connection, Alias.__tablename__):
+                for row in connection.execute(select([Alias.__table__]).order_by(Alias.id)):
+                    if row.entity_id in self.entities:
+                        self._add_alias(row.id, row.name, row.entity_id)
+
+        engine.dispose()
+
+        self.logger.info('Loaded {} entities, {} relationships and {} triples in {:.2f} s'.format(
+            len(self.entities), len(self.relationships), len(self.triples), time.monotonic() - start_time
+        ))
+
+    def _next_id(self, name):
+        self.last_ids[name] += 1
+        return self.last_ids[name]
+
+    def _add_entity(self, id, type, name):
+        Entity = self.get_object('entity')
+
+        entity = Entity(id=id, type=type, name=name)
+
+        self.entities[id] = entity
+        self.entity_keys[(type, name)] = id
+        self.entities_by_name.setdefault(name, set()).add(id)
+        self.entities_by_type.setdefault(type, set()).add(id)
+        self.triples_by_subject.setdefault(id, set())
+        self.triples_by_object.setdefault(id, set())
+
+        self.last_ids['entity'] = max(self.last_ids['entity'], id)
+
+        return entity
+
+    def _add_relationship(self, id, type, subject_type, object_type):
+        Relationship = self.get_object('relationship')
+
+        relationship = Relationship(
+            id=id, type=type, subject_type=subject_type, object_type=object_type, contexts=[]
+        )
+
+        self.relationships[id] = relationship
+        self.relationship_keys[(type, subject_type, object_type)] = id
+        self.relationships_by_type.setdefault(type, set()).add(id)
+        self.triples_by_predicate.setdefault(id, set())
+
+        self.last_ids['relationship'] = max(self.last_ids['relationship'], id)
+
+        return relationship
+
+    def _add_statement(self, id, text, relationship_id):
+        Statement = self.get_object('statement')
+
+        statement = Statement(id=id, text=text)
+
+        self.statements[id] = statement
+        self.statement_keys[(text, relationship_id)] = id
+        self.statements_by_text.setdefault(text, set()).add(id)
+        self.statement_parents[id] = relationship_id
+        self.relationships[relationship_id].contexts.append(statement)
+
+        self.last_ids['statement'] = max(self.last_ids['statement'], id)
+
+        return statement
+
+    def _add_triple(self, id, subject_id, predicate_id, object_id):
+        Triple = self.get_object('triple')
+
+        triple = Triple(
+            id=id,
+            subject=self.entities[subject_id],
+            predicate=self.relationships[predicate_id],
+            object=self.entities[object_id]
+        )
+
+        self.triples[id] = triple
+        self.triple_keys[(subject_id, predicate_id, object_id)] = id
+        self.triples_by_subject[subject_id].add(id)
+        self.triples_by_predicate[predicate_id].add(id)
+        self.triples_by_object[object_id].add(id)
+
+        self.last_ids['triple'] = max(self.last_ids['triple'], id)
+
+        return triple
+
+    def _add_alias(self, id, name, entity_id):
+        Alias = self.get_object('alias')
+
+        alias = Alias(id=id, name=name, entity_id=entity_id)
+
+        self.aliases[id] = alias
+        self.alias_keys[(name, entity_id)] = id
+        self.aliases_by_entity.setdefault(entity_id, set()).add(id)
+
+        self.last_ids['alias'] = max(self.last_ids['alias'], id)
+
+        return alias
+
+    def _discard_alias(self, alias):
+        del self.aliases[alias.id]
+        del self.alias_keys[(alias.name, alias.entity_id)]
+        self.aliases_by_entity[alias.entity_id].discard(alias.id)
+
+    def _discard_entity(self, entity):
+        del self.entities[entity.id]
+        del self.entity_keys[(entity.type, entity.name)]
+        self.entities_by_name[entity.name].discard(entity.id)
+        self.entities_by_type[entity.type].discard(entity.id)
+        del self.triples_by_subject[entity.id]
+        del self.triples_by_object[entity.id]
+
+    def _discard_relationship(self, relationship):
+        del self.relationships[relationship.id]
+        del self.relationship_keys[
+            (relationship.type, relationship.subject_type, relationship.object_type)
+        ]
+        self.relationships_by_type[relationship.type].discard(relationship.id)
+        del self.triples_by_predicate[relationship.id]
+
+    def _discard_statement(self, statement):
+        relationship_id = self.statement_parents.pop(statement.id)
+
+        del self.statements[statement.id]
+        del self.statement_keys[(statement.text, relationship_id)]
+        self.statements_by_text[statement.text].discard(statement.id)
+
+        contexts = self.relationships[relationship_id].contexts
+        contexts[:] = [context for context in contexts if context.id != statement.id]
+
+    def _discard_triple(self, triple):
+        subject_id, predicate_id, object_id = triple.subject.id, triple.predicate.id, triple.object.id
+
+        del self.triples[triple.id]
+        del self.triple_keys[(subject_id, predicate_id, object_id)]
+        self.triples_by_subject[subject_id].discard(triple.id)
+        self.triples_by_predicate[predicate_id].discard(triple.id)
+        self.triples_by_object[object_id].discard(triple.id)
+
+    def _query(self, element):
+        """
+        Return the list of the stored elements matching the given element, in the order of their ids.
+
+        Like the SQLStorageAdapter, the empty attributes match anything, the contexts
+        of a relationship must share their relationship, and the subject, predicate
+        and object of a triple are matched as elements themselves.
+        """
+        from ..elements import Entity, Relationship, Statement, Triple
+
+        if isinstance(element, Entity):
+            candidates = self._candidates(self.entities, element.id, [
+                (self.entities_by_name, element.name),
+                (self.entities_by_type, element.type),
+            ])
+
+            return [
+                entity for entity in candidates
+                if self._matches(entity, element, ['name', 'type'])
+            ]
+
+        if isinstance(element, Relationship):
+            candidates = self._candidates(self.relationships, element.id, [
+                (self.relationships_by_type, element.type),
+            ])
+
+            # Filter the empty statements
+            contexts = [
+                context for context in element.contexts or []
+                if context.id or context.text
+            ]
+
+            if contexts:
+                parent_ids = set()
+                for context in contexts:
+                    result = self._query(context)
+                    if not result:
+                        # Cannot find the parent
+                        return []
+                    parent_ids.update(self.statement_parents[statement.id] for statement in result)
+
+                # Parent ids are not identical
+                if len(parent_ids) != 1:
+                    return []
+
+                parent_id, = parent_ids
+                candidates = [item for item in candidates if item.id == parent_id]
+
+            return [
+                relationship for relationship in candidates
+                if self._matches(relationship, element, ['type', 'subject_type', 'object_type'])
+            ]
+
+        if isinstance(element, Statement):
+            candidates = self._candidates(self.statements, element.id, [
+                (self.statements_by_text, element.text),
+            ])
+
+            return [
+                statement for statement in candidates
+                if self._matches(statement, element, ['text'])
+            ]
+
+        if isinstance(element, Triple):
+            triple_ids = None
+
+            # Narrow the triples by the adjacency lists of the matched nested elements
+            for nested, adjacency in [
+                (element.subject, self.triples_by_subject),
+                (element.predicate, self.triples_by_predicate),
+                (element.object, self.triples_by_object),
+            ]:
+                if not nested:
+                    continue
+
+                matched_ids = set()
+                for item in self._query(nested):
+                    matched_ids.update(adjacency[item.id])
+
+                triple_ids = matched_ids if triple_ids is None else triple_ids & matched_ids
+
+            if element.id:
+                triple_ids = set([element.id]) if triple_ids is None else triple_ids & set([element.id])
+
+            if triple_ids is None:
+                return list(self.triples.values())
+
+            return [self.triples[id] for id in sorted(triple_ids) if id in self.triples]
+
+        return []
+
+    def _candidates(self, table, id, indexes):
+        """
+        Return the stored elements of the id, or of the first given
+        (index, value) pair with a value, or all the stored elements.
+        """
+        if id:
+            return [table[id]] if id in table else []
+
+        for index, value in indexes:
+            if value:
+                return [table[id] for id in sorted(index.get(value, ()))]
+
+        return list(table.values())
+
+    def _matches(self, stored, element, field_names):
+        return all(
+            getattr(stored, field_name) == getattr(element, field_name)
+            for field_name in field_names if getattr(element, field_name)
+        )
+
+    def remove(self, element):
+        """
+        Removes the element(entity/relationship/statement/triple) that matches
+        the given element object and relatives.
+        Removes every fuzzy matched items if only given insufficient arguments.
+        """
+        from ..elements import Entity, Relationship, Statement, Triple
+
+        removed_elements = []
+
+        def remove_triples(triple_ids):
+            for triple_id in sorted(triple_ids):
+                triple = self.triples[triple_id]
+                self._discard_triple(triple)
+                removed_elements.append(triple)
+
+        def remove_relationship(relationship):
+            remove_triples(set(self.triples_by_predicate[relationship.id]))
+
+            for statement in list(relationship.contexts):
+                self._discard_statement(statement)
+                removed_elements.append(statement)
+
+            self._discard_relationship(relationship)
+            removed_elements.append(relationship)
+
+        def remove_entity(entity):
+            remove_triples(self.triples_by_subject[entity.id] | self.triples_by_object[entity.id])
+
+            for alias_id in sorted(self.aliases_by_entity.get(entity.id, ())):
+                alias = self.aliases[alias_id]
+                self._discard_alias(alias)
+                removed_elements.append(alias)
+
+            self._discard_entity(entity)
+            removed_elements.append(entity)
+
+        def remove_orphan_entities():
+            for entity in list(self.entities.values()):
+                if not self.triples_by_subject[entity.id] and not self.triples_by_object[entity.id]:
+                    remove_entity(entity)
+
+        def remove_orphan_relationships():
+            for relationship in list(self.relationships.values()):
+                if not self.triples_by_predicate[relationship.id]:
+                    remove_relationship(relationship)
+
+        matches = self._query(element)
+
+        if isinstance(element, Statement):
+            # Delete statement(s) only
+            for statement in matches:
+                self._discard_statement(statement)
+                removed_elements.append(statement)
+
+        elif isinstance(element, Relationship):
+            # Delete relationship(s) and coressponding triples,then clear the orphan entities
+            for relationship in matches:
+                remove_relationship(relationship)
+
+            remove_orphan_entities()
+
+        elif isinstance(element, Entity):
+            # Delete entity or entities, and relative triples,then clear the orphans
+            for entity in matches:
+                remove_entity(entity)
+
+            remove_orphan_relationships()
+            remove_orphan_entities()
+
+        elif isinstance(element, Triple):
+            # Delete the triple(s),then clear the orphans
+            remove_triples(triple.id for triple in matches)
+
+            remove_orphan_relationships()
+            remove_orphan_entities()
+
+        if removed_elements:
+            self._notify('remove', removed_elements)
+
+    def get_candidate_triples(self, entity, **kwargs):
+        """
+        Return a list of triples like <entity, ?, ?> and <?, ?, entity> by the entity id,
+        If entity.id is not existed, then return triples like <entity.type, ?, ?>
+        and <?, ?, entity.type>, or <entity.name, ?, ?> and <?, ?, entity.name>.
+
+        The triples are read from the adjacency lists of the entities.
+
+        :keyword subject_type: Only return the triples <entity, ?, ?> whose predicate
+            expects this subject type, or no subject type.
+        :keyword object_type: Only return the triples <?, ?, entity> whose predicate
+            expects this object type, or no object type.
+        """
+        if entity.id:
+            entity_ids = [entity.id] if entity.id in self.entities else []
+        elif entity.type:
+            entity_ids = self.entities_by_type.get(entity.type, ())
+        else:
+            entity_ids = self.entities_by_name.get(entity.name, ())
+
+        triples = {}
+        for entity_id in entity_ids:
+            for key, adjacency in [
+                ('subject_type', self.triples_by_subject), ('object_type', self.triples_by_object)
+            ]:
+                for triple_id in adjacency[entity_id]:
+                    if triple_id in triples:
+                        continue
+
+                    triple = self.triples[triple_id]
+                    expected_type = getattr(triple.predicate, key)
+
+                    # A relationship without the type on the side of the entity fits any
+                    if not kwargs.get(key) or not expected_type or expected_type == kwargs[key]:
+                        triples[triple_id] = triple
+
+        for triple_id in sorted(triples):
+            yield triples[triple_id]
+
+    def create(self, triple):
+        """
+        Create a triple given an Triple object.
+        Return the created triple.
+
+        The existing subject, predicate, contexts and triple are reused,
+        as the unique constraints of the SQLStorageAdapter do.
+        """
+        created_elements = []
+
+        subject, object = [
+            self._get_or_add_entity(entity, created_elements)
+            for entity in [triple.subject, triple.object]
+        ]
+
+        predicate = self._get_or_add_relationship(triple.predicate, created_elements)
+
+        key = (subject.id, predicate.id, object.id)
+
+        if key in self.triple_keys:
+            stored_triple = self.triples[self.triple_keys[key]]
+        else:
+            stored_triple = self._add_triple(self._next_id('triple'), *key)
+            created_elements.append(stored_triple)
+
+        if created_elements:
+            self._notify('create', created_elements)
+
+        return stored_triple
+
+    def _get_or_add_entity(self, entity, created_elements):
+        key = (entity.type, entity.name)
+
+        if key in self.entity_keys:
+            return self.entities[self.entity_keys[key]]
+
+        stored_entity = self._add_entity(self._next_id('entity'), *key)
+        created_elements.append(stored_entity)
+
+        return stored_entity
+
+    def _get_or_add_relationship(self, relationship, created_elements):
+        key = (relationship.type, relationship.subject_type, relationship.object_type)
+
+        if key in self.relationship_keys:
+            stored_relationship = self.relationships[self.relationship_keys[key]]
+        else:
+            stored_relationship = self._add_relationship(self._next_id('relationship'), *key)
+            created_elements.append(stored_relationship)
+
+        self._add_contexts(stored_relationship, relationship.contexts, created_elements)
+
+        return stored_relationship
+
+    def _add_contexts(self, relationship, contexts, created_elements):
+        """
+        Add the contexts a stored relationship does not have yet.
+        """
+        for context in contexts or []:
+            if context.text and (context.text, relationship.id) not in self.statement_keys:
+                created_elements.append(self._add_statement(
+                    self._next_id('statement'), context.text, relationship.id
+                ))
+
+    def select(self, element):
+        """
+        Returns a list of objects that matches the given element object.
+        """
+        for item in self._query(element):
+            yield self._copy(item)
+
+    def _copy(self, element):
+        """
+        Return a copy of a stored element and its nested elements.
+        """
+        Entity = self.get_object('entity')
+        Relationship = self.get_object('relationship')
+        Statement = self.get_object('statement')
+        Triple = self.get_object('triple')
+        Alias = self.get_object('alias')
+
+        if isinstance(element, Entity):
+            return Entity(id=element.id, type=element.type, name=element.name)
+
+        if isinstance(element, Relationship):
+            return Relationship(
+                id=element.id, type=element.type,
+                subject_type=element.subject_type, object_type=element.object_type,
+                contexts=[self._copy(context) for context in element.contexts]
+            )
+
+        if isinstance(element, Statement):
+            return Statement(id=element.id, text=element.text)
+
+        if isinstance(element, Triple):
+            return Triple(
+                id=element.id,
+                subject=self._copy(element.subject),
+                predicate=self._copy(element.predicate),
+                object=self._copy(element.object)
+            )
+
+        return Alias(id=element.id, name=element.name, entity_id=element.entity_id)
+
+    def update(self, element):
+        """
+        Modifies an entry in the database.
+        Creates an entry if one does not exist.
+        """
+        from ..elements import Entity, Relationship, Statement, Triple
+
+        if element.id:
+            table = {
+                Entity: self.entities,
+                Relationship: self.relationships,
+                Statement: self.statements,
+                Triple: self.triples,
+            }[type(element)]
+            record = table.get(element.id)
+        else:
+            records = self._query(element)
+            record = records[0] if records else None
+
+        created_elements = []
+        updated_elements = []
+
+        if not record:
+            # No record found, Create a new one
+            if isinstance(element, Entity):
+                self._get_or_add_entity(element, created_elements)
+
+            elif isinstance(element, Relationship):
+                self._get_or_add_relationship(element, created_elements)
+
+            elif isinstance(element, Triple):
+                self.create(element)
+
+            else:
+                self.logger.warning('A statement can`t be created without a relationship: {}'.format(element))
+
+        elif isinstance(record, Entity):
+            if self._reindex(
+                record, ['type', 'name'], element, self.entity_keys,
+                [(self.entities_by_type, 'type'), (self.entities_by_name, 'name')]
+            ):
+                updated_elements.append(record)
+
+        elif isinstance(record, Relationship):
+            if self._reindex(
+                record, ['type', 'subject_type', 'object_type'], element, self.relationship_keys,
+                [(self.relationships_by_type, 'type')]
+            ):
+                updated_elements.append(record)
+
+            # Update nested part
+            self._add_contexts(record, element.contexts, created_elements)
+
+        elif isinstance(record, Statement):
+            relationship_id = self.statement_parents[record.id]
+
+            def statement_key(statement):
+                return (statement.text, relationship_id)
+
+            if self._reindex(
+                record, ['text'], element, self.statement_keys,
+                [(self.statements_by_text, 'text')], statement_key
+            ):
+                updated_elements.append(record)
+
+        elif isinstance(record, Triple):
+            # Update nested part
+            if element.predicate:
+                self._add_contexts(record.predicate, element.predicate.contexts, created_elements)
+
+        if created_elements:
+            self._notify('create', created_elements)
+
+        if updated_elements:
+            self._notify('update', updated_elements)
+
+    def _reindex(self, record, field_names, element, keys, indexes, key=None):
+        """
+        Fill the non-empty attributes of the element to the record in place,
+        and move the record between the unique keys and the indexes.
+
+        :returns: False if another record has the new unique key,
+            the record is left unchanged then.
+        """
+        if key is None:
+            def key(item):
+                return tuple(getattr(item, field_name) for field_name in field_names)
+
+        old_key = key(record)
+        old_values = dict((field_name, getattr(record, field_name)) for field_name in field_names)
+
+        for field_name in field_names:
+            if getattr(element, field_name):
+                setattr(record, field_name, getattr(element, field_name))
+
+        new_key = key(record)
+
+        if new_key != old_key and new_key in keys:
+            # Unique constraint conflicts
+            for field_name, value in old_values.items():
+                setattr(record, field_name, value)
+
+            self.logger.warning('{} conflicts with an existing element'.format(element))
+            return False
+
+        del keys[old_key]
+        keys[new_key] = record.id
+
+        for index, field_name in indexes:
+            index[old_values[field_name]].discard(record.id)
+            index.setdefault(getattr(record, field_name), set()).add(record.id)
+
+        return True
+
+    def add_aliases(self, aliases):
+        """
+        Create aliases given an iterable of (surface form, entity) pairs.
+        The entity is looked up by its id, or else by its name and type,
+        a name shared by several types gets the alias on each of them.
+        Return the created Alias objects, the existing ones are skipped.
+        """
+        created_aliases = []
+
+        for name, entity_id in self._alias_targets(aliases):
+            if (name, entity_id) not in self.alias_keys:
+                created_aliases.append(self._add_alias(self._next_id('alias'), name, entity_id))
+
+        if created_aliases:
+            self._notify('create', created_aliases)
+
+        return created_aliases
+
+    def get_aliases(self):
+        """
+        Return a list of every stored Alias object.
+        """
+        return [self._copy(self.aliases[alias_id]) for alias_id in sorted(self.aliases)]
+
+    def remove_aliases(self, aliases):
+        """
+        Remove the aliases given an iterable of (surface form, entity) pairs,
+        the entities are looked up as by ``add_aliases()``.
+        """
+        removed_aliases = []
+
+        for target in self._alias_targets(aliases):
+            alias_id = self.alias_keys.get(target)
+
+            if alias_id is not None:
+                alias = self.aliases[alias_id]
+                self._discard_alias(alias)
+                removed_aliases.append(alias)
+
+        if removed_aliases:
+            self._notify('remove', removed_aliases)
+
+    def _alias_targets(self, aliases):
+        """
+        Return the distinct (normalized name, entity id) pairs
+        of the (surface form, entity) pairs.
+        """
+        from .. import utils
+
+        targets = []
+
+        for surface_form, entity in aliases:
+            name = utils.normalize_alias(surface_form)
+
+            if not name:
+                continue
+
+            if entity.id:
+                entity_ids = [entity.id] if entity.id in self.entities else []
+            else:
+                entity_ids = sorted(
+                    entity_id for entity_id in self.entities_by_name.get(entity.name, ())
+                    if not entity.type or self.entities[entity_id].type == entity.type
+                )
+
+            targets.extend((name, entity_id) for entity_id in entity_ids)
+
+        return list(dict.fromkeys(targets))
+
+    def drop(self):
+        """
+        Drop the database attached to a given adapter.
+        """
+        self.reset()
+
+        self._notify('drop', [])
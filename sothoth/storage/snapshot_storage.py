@@ -0,0 +1,527 @@
+"""
+Compiled snapshots of the knowledge graph.
+
+A snapshot is a single file of little-endian int32 arrays and an interned
+string table, opened by ``mmap``. Nothing is parsed at startup, the elements
+are built on access, and the processes opening the same snapshot share its
+pages through the page cache.
+
+Compile a snapshot of an SQL database by
+``python -m sothoth.storage.snapshot_storage sqlite:///db.sqlite3 graph.snapshot``.
+"""
+import sys
+import bisect
+from collections.abc import Mapping
+
+from .memory_storage import MemoryStorageAdapter
+
+
+MAGIC = b'SOTHSNAP'
+
+VERSION = 2
+
+# The sections of a snapshot in the order of the header, a row is the
+# position of an element in the arrays sorted by the element ids, the strings
+# are sorted by their utf-8 bytes and an absent string is -1
+SECTIONS = [
+    'string_offsets',                # n_strings + 1 byte offsets in string_data
+    'string_data',                   # utf-8 bytes
+    'entity_ids',
+    'entity_names',                  # string index
+    'entity_types',                  # string index
+    'relationship_ids',
+    'relationship_types',            # string index
+    'relationship_subject_types',    # string index
+    'relationship_object_types',     # string index
+    'context_offsets',               # n_relationships + 1 offsets in context_statements
+    'context_statements',            # statement rows
+    'statement_ids',
+    'statement_texts',               # string index
+    'statement_relationships',       # relationship ids
+    'triple_ids',
+    'triple_subjects',               # entity ids
+    'triple_predicates',             # relationship ids
+    'triple_objects',                # entity ids
+    'subject_offsets',               # n_entities + 1 offsets in subject_triples
+    'subject_triples',               # triple ids
+    'object_offsets',                # n_entities + 1 offsets in object_triples
+    'object_triples',                # triple ids
+    'predicate_offsets',             # n_relationships + 1 offsets in predicate_triples
+    'predicate_triples',             # triple ids
+    'name_offsets',                  # n_strings + 1 offsets in name_entities
+    'name_entities',                 # entity ids
+    'type_offsets',                  # n_strings + 1 offsets in type_entities
+    'type_entities',                 # entity ids
+    'alias_ids',
+    'alias_names',                   # string index
+    'alias_entities',                # entity ids
+]
+
+
+def compile_snapshot(storage, path):
+    """
+    Write the graph of a MemoryStorageAdapter to a snapshot file.
+    """
+    import struct
+    from array import array
+
+    entities = [storage.entities[id] for id in sorted(storage.entities)]
+    relationships = [storage.relationships[id] for id in sorted(storage.relationships)]
+    statements = [storage.statements[id] for id in sorted(storage.statements)]
+    triples = [storage.triples[id] for id in sorted(storage.triples)]
+    aliases = storage.get_aliases()
+
+    # Intern the strings
+    strings = set()
+    for entity in entities:
+        strings.update([entity.name, entity.type])
+    for relationship in relationships:
+        strings.update([relationship.type, relationship.subject_type, relationship.object_type])
+    for statement in statements:
+        strings.add(statement.text)
+    for alias in aliases:
+        strings.add(alias.name)
+    strings.discard(None)
+
+    encoded_strings = sorted(string.encode('utf-8') for string in strings)
+    string_indexes = dict(
+        (string.decode('utf-8'), index) for index, string in enumerate(encoded_strings)
+    )
+    string_indexes[None] = -1
+
+    def offsets(groups):
+        result = [0]
+        for group in groups:
+            result.append(result[-1] + len(group))
+        return result
+
+    def flatten(groups):
+        return [item for group in groups for item in group]
+
+    statement_rows = dict((statement.id, row) for row, statement in enumerate(statements))
+
+    contexts = [
+        sorted(statement_rows[context.id] for context in relationship.contexts)
+        for relationship in relationships
+    ]
+    subject_triples = [sorted(storage.triples_by_subject[entity.id]) for entity in entities]
+    object_triples = [sorted(storage.triples_by_object[entity.id]) for entity in entities]
+    predicate_triples = [sorted(storage.triples_by_predicate[relationship.id]) for relationship in relationships]
+
+    name_entities = [[] for _ in encoded_strings]
+    type_entities = [[] for _ in encoded_strings]
+    for entity in entities:
+        # A nameless entity is not indexed by name, as the absent type is not by type
+        if entity.name is not None:
+            name_entities[string_indexes[entity.name]].append(entity.id)
+        if entity.type is not None:
+            type_entities[string_indexes[entity.type]].append(entity.id)
+
+    sections = {
+        'string_offsets': offsets(encoded_strings),
+        'string_data': b''.join(encoded_strings),
+        'entity_ids': [entity.id for entity in entities],
+        'entity_names': [string_indexes[entity.name] for entity in entities],
+        'entity_types': [string_indexes[entity.type] for entity in entities],
+        'relationship_ids': [relationship.id for relationship in relationships],
+        'relationship_types': [string_indexes[relationship.type] for relationship in relationships],
+        'relationship_subject_types': [string_indexes[relationship.subject_type] for relationship in relationships],
+        'relationship_object_types': [string_indexes[relationship.object_type] for relationship in relationships],
+        'context_offsets': offsets(contexts),
+        'context_statements': flatten(contexts),
+        'statement_ids': [statement.id for statement in statements],
+        'statement_texts': [string_indexes[statement.text] for statement in statements],
+        'statement_relationships': [storage.statement_parents[statement.id] for statement in statements],
+        'triple_ids': [triple.id for triple in triples],
+        'triple_subjects': [triple.subject.id for triple in triples],
+        'triple_predicates': [triple.predicate.id for triple in triples],
+        'triple_objects': [triple.object.id for triple in triples],
+        'subject_offsets': offsets(subject_triples),
+        'subject_triples': flatten(subject_triples),
+        'object_offsets': offsets(object_triples),
+        'object_triples': flatten(object_triples),
+        'predicate_offsets': offsets(predicate_triples),
+        'predicate_triples': flatten(predicate_triples),
+        'name_offsets': offsets(name_entities),
+        'name_entities': flatten(name_entities),
+        'type_offsets': offsets(type_entities),
+        'type_entities': flatten(type_entities),
+        'alias_ids': [alias.id for alias in aliases],
+        'alias_names': [string_indexes[alias.name] for alias in aliases],
+        'alias_entities': [alias.entity_id for alias in aliases],
+    }
+
+    header_size = len(MAGIC) + struct.calcsize('<II') + struct.calcsize('<QQ') * len(SECTIONS)
+
+    with open(path, 'wb') as file:
+        file.write(b'\0' * header_size)
+
+        table = []
+        for name in SECTIONS:
+            data = sections[name]
+
+            if not isinstance(data, bytes):
+                data = array('i', data)
+                if sys.byteorder == 'big':
+                    data.byteswap()
+                data = data.tobytes()
+
+            # Keep the arrays aligned
+            file.write(b'\0' * (-file.tell() % 8))
+
+            table.append((file.tell(), len(data)))
+            file.write(data)
+
+        file.seek(0)
+        file.write(MAGIC)
+        file.write(struct.pack('<II', VERSION, len(SECTIONS)))
+        for offset, length in table:
+            file.write(struct.pack('<QQ', offset, length))
+
+
+class SnapshotStorageAdapter(MemoryStorageAdapter):
+    """
+    The SnapshotStorageAdapter answers from a compiled snapshot file,
+    opened by mmap. It is read-only.
+
+    The elements, the candidate triples included, are built on access,
+    none of them is shared among the callers.
+
+    :keyword snapshot_path: The path of a file written by ``compile_snapshot``.
+    :type snapshot_path: str
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.snapshot_path = kwargs.get('snapshot_path')
+
+        if not self.snapshot_path:
+            raise self.SnapshotException('A snapshot_path is required.')
+
+        self.open(self.snapshot_path)
+
+    def open(self, path):
+        """
+        Map the snapshot file and view its sections.
+        """
+        import mmap
+        import struct
+
+        if sys.byteorder == 'big':
+            raise self.SnapshotException('Snapshots can only be opened on little-endian machines.')
+
+        with open(path, 'rb') as file:
+            self.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.mmap[:len(MAGIC)] != MAGIC:
+            raise self.SnapshotException('{} is not a snapshot.'.format(path))
+
+        version, section_count = struct.unpack_from('<II', self.mmap, len(MAGIC))
+
+        if version != VERSION or section_count != len(SECTIONS):
+            raise self.SnapshotException(
+                'The snapshot version {} of {} is not supported.'.format(version, path)
+            )
+
+        buffer = memoryview(self.mmap)
+
+        sections = {}
+        for position, name in enumerate(SECTIONS):
+            offset, length = struct.unpack_from(
+                '<QQ', self.mmap, len(MAGIC) + struct.calcsize('<II') + struct.calcsize('<QQ') * position
+            )
+            section = buffer[offset:offset + length]
+            sections[name] = section if name == 'string_data' else section.cast('i')
+
+        strings = _Strings(sections['string_offsets'], sections['string_data'])
+
+        self.sections = sections
+        self.strings = strings
+
+        Entity = self.get_object('entity')
+        Relationship = self.get_object('relationship')
+        Statement = self.get_object('statement')
+        Triple = self.get_object('triple')
+        Alias = self.get_object('alias')
+
+        def build_entity(row):
+            return Entity(
+                id=sections['entity_ids'][row],
+                name=strings[sections['entity_names'][row]],
+                type=strings[sections['entity_types'][row]]
+            )
+
+        def build_statement(row):
+            return Statement(id=sections['statement_ids'][row], text=strings[sections['statement_texts'][row]])
+
+        def build_relationship(row):
+            offsets = sections['context_offsets']
+            return Relationship(
+                id=sections['relationship_ids'][row],
+                type=strings[sections['relationship_types'][row]],
+                subject_type=strings[sections['relationship_subject_types'][row]],
+                object_type=strings[sections['relationship_object_types'][row]],
+                contexts=[
+                    build_statement(statement_row)
+                    for statement_row in sections['context_statements'][offsets[row]:offsets[row + 1]]
+                ]
+            )
+
+        def build_triple(row):
+            return Triple(
+                id=sections['triple_ids'][row],
+                subject=self.entities[sections['triple_subjects'][row]],
+                predicate=self.relationships[sections['triple_predicates'][row]],
+                object=self.entities[sections['triple_objects'][row]]
+            )
+
+        def build_alias(row):
+            return Alias(
+                id=sections['alias_ids'][row],
+                name=strings[sections['alias_names'][row]],
+                entity_id=sections['alias_entities'][row]
+            )
+
+        # Read-only views in place of the dictionaries of the MemoryStorageAdapter
+        self.entities = _Table(sections['entity_ids'], build_entity)
+        self.relationships = _Table(sections['relationship_ids'], build_relationship)
+        self.statements = _Table(sections['statement_ids'], build_statement)
+        self.triples = _Table(sections['triple_ids'], build_triple)
+        self.aliases = _Table(sections['alias_ids'], build_alias)
+
+        self.statement_parents = _Table(
+            sections['statement_ids'], sections['statement_relationships'].__getitem__
+        )
+
+        self.entities_by_name = _Index(
+            strings.find, sections['name_offsets'], sections['name_entities']
+        )
+        self.entities_by_type = _Index(
+            strings.find, sections['type_offsets'], sections['type_entities']
+        )
+
+        # Relationships and statements are few, they are scanned
+        self.relationships_by_type = _Scan(self.relationships, 'type')
+        self.statements_by_text = _Scan(self.statements, 'text')
+
+        self.triples_by_subject = _Adjacency(
+            sections['entity_ids'], sections['subject_offsets'], sections['subject_triples']
+        )
+        self.triples_by_object = _Adjacency(
+            sections['entity_ids'], sections['object_offsets'], sections['object_triples']
+        )
+        self.triples_by_predicate = _Adjacency(
+            sections['relationship_ids'], sections['predicate_offsets'], sections['predicate_triples']
+        )
+
+        self.logger.info('Opened the snapshot {} of {} entities, {} relationships and {} triples'.format(
+            path, len(self.entities), len(self.relationships), len(self.triples)
+        ))
+
+    def _copy(self, element):
+        # Built on access, the element is not shared
+        return element
+
+    def load(self, database_uri):
+        raise self.ReadOnlyException('A snapshot can`t load a database, compile a new snapshot instead.')
+
+    def create(self, triple):
+        raise self.ReadOnlyException('A snapshot can`t create a triple, compile a new snapshot instead.')
+
+    def create_many(self, triples, **kwargs):
+        raise self.ReadOnlyException('A snapshot can`t create triples, compile a new snapshot instead.')
+
+    def update(self, element):
+        raise self.ReadOnlyException('A snapshot can`t update an element, compile a new snapshot instead.')
+
+    def remove(self, element):
+        raise self.ReadOnlyException('A snapshot can`t remove an element, compile a new snapshot instead.')
+
+    def add_aliases(self, aliases):
+        raise self.ReadOnlyException('A snapshot can`t create aliases, compile a new snapshot instead.')
+
+    def remove_aliases(self, aliases):
+        raise self.ReadOnlyException('A snapshot can`t remove aliases, compile a new snapshot instead.')
+
+    def drop(self):
+        raise self.ReadOnlyException('A snapshot can`t be dropped, compile a new snapshot instead.')
+
+    class SnapshotException(Exception):
+        pass
+
+    class ReadOnlyException(Exception):
+        pass
+
+
+class _Strings(object):
+    """
+    The interned string table, sorted by the utf-8 bytes of the strings.
+    """
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            return None
+
+        return str(self.data[self.offsets[index]:self.offsets[index + 1]], 'utf-8')
+
+    def find(self, string):
+        """
+        Return the index of the string, or -1 if it is not interned.
+        """
+        if string is None:
+            return -1
+
+        encoded = string.encode('utf-8')
+
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if self.data[self.offsets[middle]:self.offsets[middle + 1]].tobytes() < encoded:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < len(self) and self.data[self.offsets[low]:self.offsets[low + 1]].tobytes() == encoded:
+            return low
+
+        return -1
+
+
+class _Table(Mapping):
+    """
+    A read-only mapping of the sorted ids to the values built from their rows.
+    """
+    def __init__(self, ids, build):
+        self.ids = ids
+        self.build = build
+
+    def row(self, id):
+        row = bisect.bisect_left(self.ids, id)
+
+        if row < len(self.ids) and self.ids[row] == id:
+            return row
+
+        return None
+
+    def __getitem__(self, id):
+        row = self.row(id)
+
+        if row is None:
+            raise KeyError(id)
+
+        return self.build(row)
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def values(self):
+        return (self.build(row) for row in range(len(self.ids)))
+
+
+class _Index(Mapping):
+    """
+    A read-only mapping of the strings to the ids of the elements holding them.
+    """
+    def __init__(self, find, offsets, ids):
+        self.find = find
+        self.offsets = offsets
+        self.ids = ids
+
+    def __getitem__(self, string):
+        index = self.find(string)
+
+        if index < 0 or self.offsets[index] == self.offsets[index + 1]:
+            raise KeyError(string)
+
+        return self.ids[self.offsets[index]:self.offsets[index + 1]].tolist()
+
+    def __iter__(self):
+        raise TypeError('A snapshot index can`t be iterated.')
+
+    def __len__(self):
+        raise TypeError('A snapshot index has no length.')
+
+
+class _Scan(Mapping):
+    """
+    A read-only mapping of the values of an attribute to the ids
+    of the elements holding them, by scanning the elements.
+    """
+    def __init__(self, table, attribute):
+        self.table = table
+        self.attribute = attribute
+
+    def __getitem__(self, value):
+        ids = [
+            element.id for element in self.table.values()
+            if getattr(element, self.attribute) == value
+        ]
+
+        if not ids:
+            raise KeyError(value)
+
+        return ids
+
+    def __iter__(self):
+        raise TypeError('A snapshot scan can`t be iterated.')
+
+    def __len__(self):
+        raise TypeError('A snapshot scan has no length.')
+
+
+class _Adjacency(Mapping):
+    """
+    A read-only mapping of the sorted element ids to the ids of their triples.
+    """
+    def __init__(self, ids, offsets, triple_ids):
+        self.ids = ids
+        self.offsets = offsets
+        self.triple_ids = triple_ids
+
+    def __getitem__(self, id):
+        row = bisect.bisect_left(self.ids, id)
+
+        if row >= len(self.ids) or self.ids[row] != id:
+            raise KeyError(id)
+
+        return self.triple_ids[self.offsets[row]:self.offsets[row + 1]].tolist()
+
+    def __iter__(self):
+        return iter(self.ids)
+
+    def __len__(self):
+        return len(self.ids)
+
+
+def main(argv=None):
+    """
+    Command-line entry point, compile a snapshot of an SQL database.
+    """
+    import argparse
+    import logging
+
+    parser = argparse.ArgumentParser(
+        prog='python -m sothoth.storage.snapshot_storage',
+        description='Compile a snapshot of an SQL database for the SnapshotStorageAdapter.'
+    )
+    parser.add_argument('database_uri', help='database uri of the SQLStorageAdapter')
+    parser.add_argument('snapshot_path', help='snapshot file to write')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+
+    compile_snapshot(MemoryStorageAdapter(database_uri=args.database_uri), args.snapshot_path)
+
+
+if __name__ == '__main__':
+    main()
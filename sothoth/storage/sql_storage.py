@@ -14,13 +14,23 @@ class SQLStorageAdapter(StorageAdapter):
     :keyword database_uri: eg: sqlite:///database_test.db',
         The database_uri can be specified to choose database driver.
     :type database_uri: str
+
+    :keyword thread_safe: Share the adapter among threads, each thread
+        gets its own session from a scoped session registry, and the
+        sqlite connections may be used by any thread of the pool.
+        An in-memory sqlite database is not supported.
+    :type thread_safe: bool
+
+    :keyword pool_size: The number of connections kept by the pool.
+    :keyword max_overflow: The number of connections opened beyond the pool size.
+    :keyword pool_timeout: The seconds to wait for a connection of the pool.
     """
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        from sqlalchemy import create_engine
-        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy import create_engine, event
+        from sqlalchemy.orm import sessionmaker, scoped_session
 
         self.database_uri = kwargs.get('database_uri', False)
 
@@ -32,22 +42,64 @@ class SQLStorageAdapter(StorageAdapter):
         if not self.database_uri:
             self.database_uri = 'sqlite:///db.sqlite3'
 
-        self.engine = create_engine(self.database_uri, convert_unicode=True)
+        self.thread_safe = kwargs.get('thread_safe', False)
+
+        engine_options = dict(
+            (key, kwargs[key]) for key in ['pool_size', 'max_overflow', 'pool_timeout'] if key in kwargs
+        )
+
+        is_sqlite = self.database_uri.startswith('sqlite://')
+
+        if is_sqlite and self.thread_safe:
+            from sqlalchemy.pool import QueuePool
+
+            # Let any thread of the pool use a connection
+            engine_options['connect_args'] = {'check_same_thread': False}
+
+            if self.database_uri in ('sqlite://', 'sqlite:///:memory:'):
+                # Every connection would open a distinct in-memory database,
+                # and a single connection can`t be used by concurrent threads
+                raise self.UnsupportedDatabaseException(
+                    'An in-memory sqlite database can`t be shared among threads, use a file database.'
+                )
+
+            engine_options['poolclass'] = QueuePool
+
+        elif is_sqlite and engine_options:
+            from sqlalchemy.pool import QueuePool
+
+            # The file databases are not pooled by default
+            engine_options['poolclass'] = QueuePool
 
-        if self.database_uri.startswith('sqlite://'):
-            from sqlalchemy.engine import Engine
-            from sqlalchemy import event
+        self.engine = create_engine(self.database_uri, convert_unicode=True, **engine_options)
 
-            @event.listens_for(Engine, 'connect')
+        if is_sqlite:
+            # Scoped to the engine of this adapter, rather than every engine of the process
+            @event.listens_for(self.engine, 'connect')
             def set_sqlite_pragma(dbapi_connection, connection_record):
                 dbapi_connection.execute('PRAGMA journal_mode=WAL')
                 dbapi_connection.execute('PRAGMA synchronous=NORMAL')
 
-        if not self.engine.dialect.has_table(self.engine, 'Statement'):
-            self.create_database()
+        # Count the statements issued to the database
+        @event.listens_for(self.engine, 'before_cursor_execute')
+        def count_statement(connection, cursor, statement, parameters, context, executemany):
+            self.instrument.count('sql_statements')
+
+        # Create the missing tables and indexes
+        self.create_database()
 
         self.Session = sessionmaker(bind=self.engine, expire_on_commit=True)
 
+        if self.thread_safe:
+            # Session() returns the session of the calling thread
+            self.Session = scoped_session(self.Session)
+
+        # Record the flushed changes of every session,
+        # then notify the listeners once they are committed
+
+        event.listen(self.Session, 'after_flush', self._record_changes)
+        event.listen(self.Session, 'after_commit', self._dispatch_changes)
+        event.listen(self.Session, 'after_rollback', self._discard_changes)
 
     def get_entity_model(self):
         """
@@ -77,15 +129,52 @@ class SQLStorageAdapter(StorageAdapter):
         from ..ext.sqlalchemy_app.models import Triple
         return Triple
 
+    def get_alias_model(self):
+        """
+        Return the alias model.
+        """
+        from ..ext.sqlalchemy_app.models import Alias
+        return Alias
+
     def get_object_name(self, object):
         return object.__class__.__name__
 
     def get_model_name(self, model):
         return model.__class__.__name__
 
-    def model_to_object(self, model):
+    def model_to_object(self, model, identity_map=None):
+        """
+        Transform a model to an object with its nested models.
+
+        :param identity_map: A dictionary of the objects already transformed,
+            keyed by the model name and id. Models sharing an id within a result
+            set are transformed once and share the object.
+        """
         from ..ext.sqlalchemy_app.models import Entity, Relationship, Statement, Triple
 
+        if identity_map is not None and model.id is not None:
+            identity = (self.get_model_name(model), model.id)
+
+            if identity in identity_map:
+                return identity_map[identity]
+
+            object = self.get_object(self.get_model_name(model))(**model.serialize())
+            identity_map[identity] = object
+
+            # Transform the nested models through the identity map
+            if isinstance(model, Relationship):
+                object.contexts = [
+                    self.model_to_object(context, identity_map) for context in model.contexts
+                ]
+
+            elif isinstance(model, Triple):
+                for item in ['subject', 'predicate', 'object']:
+                    nested_model = getattr(model, item)
+                    if nested_model:
+                        setattr(object, item, self.model_to_object(nested_model, identity_map))
+
+            return object
+
         serialization = model.serialize()
 
         if isinstance(model, Relationship) and model.contexts:
@@ -320,116 +409,240 @@ class SQLStorageAdapter(StorageAdapter):
 
         self._session_finish(session)
 
-    def get_candidate_triples(self, entity):
+    def get_candidate_triples(self, entity, **kwargs):
         """
-        Return a list of triples like <entity.type, ?, ?> and <?, ?, entity.type>,
-        If entity.type is not existed,then return <entity.name, ?, ?> and <?, ?, entity.name>.
+        Return a list of triples like <entity, ?, ?> and <?, ?, entity> by the entity id,
+        If entity.id is not existed, then return triples like <entity.type, ?, ?>
+        and <?, ?, entity.type>, or <entity.name, ?, ?> and <?, ?, entity.name>.
+
+        Each list is a union of the lookups on the subject and on the object.
+
+        :keyword subject_type: Only return the triples <entity, ?, ?> whose predicate
+            expects this subject type, or no subject type.
+        :keyword object_type: Only return the triples <?, ?, entity> whose predicate
+            expects this object type, or no object type.
         """
         session = self.Session()
 
         TripleModel = self.get_model('triple')
         EntityModel = self.get_model('entity')
+        RelationshipModel = self.get_model('relationship')
 
-        if entity.type:
-            # <entity.type, ?, ?> and <?, ?, entity.type>
-            query = session.query(TripleModel).filter(
-                entity.type == EntityModel.type
-            ).filter(
-                TripleModel.subject_id == EntityModel.id | 
-                TripleModel.object_id == EntityModel.id
-            )
+        from sqlalchemy import or_
+
+        def lookup(id_column, type_column, expected_type):
+            query = session.query(TripleModel)
+
+            if entity.id:
+                # <entity, ?, ?> or <?, ?, entity>
+                query = query.filter(id_column == entity.id)
+
+            else:
+                query = query.join(EntityModel, id_column == EntityModel.id)
+
+                if entity.type:
+                    # <entity.type, ?, ?> or <?, ?, entity.type>
+                    query = query.filter(EntityModel.type == entity.type)
+                else:
+                    # <entity.name, ?, ?> or <?, ?, entity.name>
+                    query = query.filter(EntityModel.name == entity.name)
+
+            # Let the database narrow the relationships by the type on the side of the entity
+            if expected_type:
+                query = query.join(
+                    RelationshipModel, TripleModel.predicate_id == RelationshipModel.id
+                ).filter(or_(type_column == expected_type, type_column.is_(None)))
+
+            return query
+
+        query = lookup(
+            TripleModel.subject_id, RelationshipModel.subject_type, kwargs.get('subject_type')
+        ).union(
+            lookup(TripleModel.object_id, RelationshipModel.object_type, kwargs.get('object_type'))
+        ).order_by(TripleModel.id).options(*self._eager_loading(TripleModel))
 
-        else:
-            # <entity.name, ?, ?> and <?, ?, entity.name>
-            query = session.query(TripleModel).filter(
-                entity.name == EntityModel.name
-            ).filter(
-                TripleModel.subject_id == EntityModel.id | 
-                TripleModel.object_id == EntityModel.id
-            )
-        
         all_relative_triples = query.all()
 
-        for triple in all_relative_triples:
-            yield self.model_to_object(triple)
+        # Share the entities and relationships among the triples
+        identity_map = {}
+
+        with self.instrument.stage('hydrate'):
+            objects = [self.model_to_object(triple, identity_map) for triple in all_relative_triples]
 
+        # Release the connection before the caller iterates
         session.close()
 
+        for object in objects:
+            yield object
+
     def create(self, triple):
         """
         Create a triple given an Triple object.
-        Return the created triple.
+
+        The entities, the relationship and its contexts are resolved by their
+        unique keys as by ``create_many()``, the existing ones are reused,
+        so that both paths store the same rows. The triple is not modified.
         """
-        session = self.Session()
+        self._create_chunk([triple])
 
-        
-        from sqlalchemy.exc import IntegrityError
-        
-        try:
-            # Every entry is unique
-            session.add(self.object_to_model(triple))
-
-            self._session_finish(session)
-
-        except IntegrityError:
-
-            # Unique Constaint conflicts
-            serialization = triple.serialize()
-
-            # Check if exists identical subject
-            candidate_subjects = self._query(serialization['subject'], session = session).all()
-            if len(candidate_subjects) == 1: 
-                serialization['subject_id'] = candidate_subjects[0].id
-                serialization['subject'] = None
-
-            # Check if exists identical predicate or just a contexts update
-            contexts = serialization['predicate'].contexts
-            candidate_predicates = self._query(serialization['predicate'], session = session).all()
-            serialization['predicate'].contexts = None
-            nc_candidate_predicates = self._query(serialization['predicate'], session = session).all()
-            # 'nc' means 'no-contexts'
-            if len(candidate_predicates) == 1:
-                serialization['predicate_id'] = candidate_predicates[0].id
-                serialization['predicate'] = None
-            
-            if not candidate_predicates and nc_candidate_predicates:
-                # No result for contexts-contained predicate but has result for non-contexts predicate
-                # Therefore, just a contexts update
-                is_contexts_changed = False
-                for context in contexts:
-                    result = self._query(context, session = session).first()
-                    if not result:
-                        nc_candidate_predicates[0].contexts.append(self.object_to_model(context))
-                        is_contexts_changed = True
-                if is_contexts_changed:
-                    session.add(nc_candidate_predicates[0])
-                    serialization['predicate_id'] = nc_candidate_predicates[0].id
-                    serialization['predicate'] = None
-            elif serialization['predicate']:
-                # Predicate adding, refill the contexts
-                serialization['predicate'].contexts = contexts
-
-            # Check if exists identical object
-            candidate_objects = self._query(serialization['object'], session = session).all()
-            if len(candidate_objects) == 1: 
-                serialization['object_id'] = candidate_objects[0].id
-                serialization['object'] = None
+    def create_many(self, triples, **kwargs):
+        """
+        Create triples given an iterable of Triple objects,
+        with the same result as creating them one by one.
 
-            for item in ['subject', 'predicate', 'object']:
-                if serialization[item]: 
-                    serialization[item] = self.object_to_model(serialization[item])
+        Each chunk deduplicates its entities, relationships, statements and
+        triples in memory, resolves the existing ones by a few set-based queries
+        and inserts the new ones by executemany, in a transaction.
 
-            filter_condition = dict([(key, value) for key, value in serialization.items() if value])
+        :keyword chunk_size: The number of triples created per transaction.
+        """
+        import time
+        import itertools
 
+        chunk_size = kwargs.get('chunk_size', 1000)
 
-            TripleModel = self.get_model('triple')
-            triple = TripleModel(**filter_condition)
+        triples = iter(triples)
+        created_count = 0
+        start_time = time.monotonic()
 
-            candidate_triple = self._query(self.model_to_object(triple)).all()
-            if not candidate_triple:
-                session.add(triple)
+        while True:
+            chunk = list(itertools.islice(triples, chunk_size))
+            if not chunk:
+                break
 
-            self._session_finish(session)
+            self._create_chunk(chunk)
+
+            created_count += len(chunk)
+            elapsed_time = time.monotonic() - start_time
+
+            self.logger.info('Created {} triples, {:.0f} triples/sec'.format(
+                created_count, created_count / elapsed_time if elapsed_time else float('inf')
+            ))
+
+    def _create_chunk(self, triples):
+        EntityModel = self.get_model('entity')
+        RelationshipModel = self.get_model('relationship')
+        StatementModel = self.get_model('statement')
+        TripleModel = self.get_model('triple')
+
+        session = self.Session()
+
+        def resolve(Model, key_columns, filter_column, keys):
+            """
+            Return the mapping of the existing keys to their ids, looking up
+            the filter column by chunks to stay below the bound parameter limits.
+            """
+            key_index = key_columns.index(filter_column)
+            filter_values = list(set(key[key_index] for key in keys))
+
+            columns = [getattr(Model, column) for column in key_columns]
+
+            ids = {}
+            for start in range(0, len(filter_values), 500):
+                query = session.query(Model.id, *columns).filter(
+                    getattr(Model, filter_column).in_(filter_values[start:start + 500])
+                )
+                for id, *key in query:
+                    if tuple(key) in keys:
+                        ids[tuple(key)] = id
+
+            return ids
+
+        def insert(Model, key_columns, filter_column, keys):
+            """
+            Insert the missing keys, return the mapping of every key to its id
+            and the keys inserted.
+            """
+            ids = resolve(Model, key_columns, filter_column, keys)
+
+            missing_keys = [key for key in keys if key not in ids]
+            if missing_keys:
+                session.execute(
+                    Model.__table__.insert(),
+                    [dict(zip(key_columns, key)) for key in missing_keys]
+                )
+                ids.update(resolve(Model, key_columns, filter_column, set(missing_keys)))
+
+            return ids, missing_keys
+
+        # Roll back the chunk on any failure, a scoped session
+        # is reused by the later calls of the thread
+        try:
+            # Deduplicate the elements in memory, in the order of appearance
+            entity_keys = {}
+            relationship_keys = {}
+            for triple in triples:
+                for entity in [triple.subject, triple.object]:
+                    entity_keys.setdefault((entity.type, entity.name), None)
+
+                predicate = triple.predicate
+                relationship_keys.setdefault(
+                    (predicate.type, predicate.subject_type, predicate.object_type), None
+                )
+
+            entity_ids, new_entities = insert(
+                EntityModel, ['type', 'name'], 'name', entity_keys
+            )
+            relationship_ids, new_relationships = insert(
+                RelationshipModel, ['type', 'subject_type', 'object_type'], 'type', relationship_keys
+            )
+
+            statement_keys = {}
+            triple_keys = {}
+            for triple in triples:
+                predicate = triple.predicate
+                relationship_id = relationship_ids[
+                    (predicate.type, predicate.subject_type, predicate.object_type)
+                ]
+
+                for context in predicate.contexts or []:
+                    statement_keys.setdefault((context.text, relationship_id), None)
+
+                triple_keys.setdefault((
+                    entity_ids[(triple.subject.type, triple.subject.name)],
+                    relationship_id,
+                    entity_ids[(triple.object.type, triple.object.name)],
+                ), None)
+
+            statement_ids, new_statements = insert(
+                StatementModel, ['text', 'relationship_id'], 'relationship_id', statement_keys
+            )
+            triple_ids, new_triples = insert(
+                TripleModel, ['subject_id', 'predicate_id', 'object_id'], 'subject_id', triple_keys
+            )
+
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        # The inserts bypass the flushes, notify the listeners of them
+        Entity = self.get_object('entity')
+        Relationship = self.get_object('relationship')
+        Statement = self.get_object('statement')
+        Triple = self.get_object('triple')
+
+        created_elements = [
+            Entity(id=entity_ids[key], type=key[0], name=key[1])
+            for key in new_entities
+        ] + [
+            Relationship(id=relationship_ids[key], type=key[0], subject_type=key[1], object_type=key[2])
+            for key in new_relationships
+        ] + [
+            Statement(id=statement_ids[key], text=key[0])
+            for key in new_statements
+        ] + [
+            Triple(
+                id=triple_ids[key],
+                subject=Entity(id=key[0]), predicate=Relationship(id=key[1]), object=Entity(id=key[2])
+            )
+            for key in new_triples
+        ]
+
+        if created_elements:
+            self._notify('create', created_elements)
 
     def select(self, element):
         """
@@ -437,13 +650,26 @@ class SQLStorageAdapter(StorageAdapter):
         """
         session = self.Session()
 
-        query = self._query(element, session = session).all()
+        query = self._query(element, session = session)
+
+        Model = self.get_model(self.get_object_name(element))
+        if query.column_descriptions[0]['entity'] is Model:
+            query = query.options(*self._eager_loading(Model))
 
-        for item in query:
-            yield self.model_to_object(item)
+        # Share the nested elements among the result set
+        identity_map = {}
 
+        items = query.all()
+
+        with self.instrument.stage('hydrate'):
+            objects = [self.model_to_object(item, identity_map) for item in items]
+
+        # Release the connection before the caller iterates
         self._session_finish(session)
 
+        for object in objects:
+            yield object
+
     def update(self, element):
         """
         Modifies an entry in the database.
@@ -470,7 +696,8 @@ class SQLStorageAdapter(StorageAdapter):
                     if value and attr not in excluding:
                         setattr(fill_to, attr, value)
             
-            serialization = self.object_to_model(element).serialize()
+            model = self.object_to_model(element)
+            serialization = model.serialize()
 
             if isinstance(element, Relationship) and element.contexts:
                 
@@ -501,17 +728,114 @@ class SQLStorageAdapter(StorageAdapter):
 
         self._session_finish(session)
 
+    def add_aliases(self, aliases):
+        """
+        Create aliases given an iterable of (surface form, entity) pairs.
+        The entity is looked up by its id, or else by its name and type,
+        a name shared by several types gets the alias on each of them.
+        Return the created Alias objects, the existing ones are skipped.
+        """
+        session = self.Session()
+
+        AliasModel = self.get_model('alias')
+
+        targets = self._alias_targets(session, aliases)
+
+        existing_targets = set(
+            session.query(AliasModel.name, AliasModel.entity_id).filter(
+                AliasModel.name.in_(set(name for name, _ in targets))
+            )
+        ) if targets else set()
+
+        models = [
+            AliasModel(name=name, entity_id=entity_id)
+            for name, entity_id in targets if (name, entity_id) not in existing_targets
+        ]
+
+        session.add_all(models)
+        session.flush()
+
+        created_aliases = [self.model_to_object(model) for model in models]
+
+        self._session_finish(session)
+
+        return created_aliases
+
+    def get_aliases(self):
+        """
+        Return a list of every stored Alias object.
+        """
+        session = self.Session()
+
+        AliasModel = self.get_model('alias')
+
+        aliases = [
+            self.model_to_object(model) for model in session.query(AliasModel).order_by(AliasModel.id)
+        ]
+
+        session.close()
+
+        return aliases
+
+    def remove_aliases(self, aliases):
+        """
+        Remove the aliases given an iterable of (surface form, entity) pairs,
+        the entities are looked up as by ``add_aliases()``.
+        """
+        session = self.Session()
+
+        AliasModel = self.get_model('alias')
+
+        for name, entity_id in self._alias_targets(session, aliases):
+            for model in session.query(AliasModel).filter_by(name=name, entity_id=entity_id):
+                session.delete(model)
+
+        self._session_finish(session)
+
+    def _alias_targets(self, session, aliases):
+        """
+        Return the distinct (normalized name, entity id) pairs
+        of the (surface form, entity) pairs.
+        """
+        from .. import utils
+
+        EntityModel = self.get_model('entity')
+
+        targets = []
+
+        for surface_form, entity in aliases:
+            name = utils.normalize_alias(surface_form)
+
+            if not name:
+                continue
+
+            if entity.id:
+                entity_ids = [entity.id]
+            else:
+                query = session.query(EntityModel.id).filter(EntityModel.name == entity.name)
+
+                if entity.type:
+                    query = query.filter(EntityModel.type == entity.type)
+
+                entity_ids = [entity_id for entity_id, in query.order_by(EntityModel.id)]
+
+            targets.extend((name, entity_id) for entity_id in entity_ids)
+
+        return list(dict.fromkeys(targets))
+
     def drop(self):
         """
         Drop the database attached to a given adapter.
         """
-        EntityModel = self.get_model('statement')
+        AliasModel = self.get_model('alias')
+        EntityModel = self.get_model('entity')
         RelationshipModel = self.get_model('relationship')
         StatementModel = self.get_model('statement')
         TripleModel = self.get_model('triple')
 
         session = self.Session()
 
+        session.query(AliasModel).delete()
         session.query(EntityModel).delete()
         session.query(RelationshipModel).delete()
         session.query(StatementModel).delete()
@@ -520,13 +844,89 @@ class SQLStorageAdapter(StorageAdapter):
         session.commit()
         session.close()
 
+        self._notify('drop', [])
+
     def create_database(self):
         """
         Populate the database with the tables.
+
+        The tables of an existing database are migrated
+        by adding the indexes they miss.
         """
+        from sqlalchemy import inspect
         from ..ext.sqlalchemy_app.models import Base
         Base.metadata.create_all(self.engine)
 
+        inspector = inspect(self.engine)
+
+        for table in Base.metadata.sorted_tables:
+            existing_indexes = set(index['name'] for index in inspector.get_indexes(table.name))
+
+            for index in table.indexes:
+                if index.name not in existing_indexes:
+                    self.logger.info('Creating index {} on {}'.format(index.name, table.name))
+                    index.create(self.engine)
+
+    def _eager_loading(self, Model):
+        """
+        Return the loader options fetching the nested models of the given model
+        along with the result set, instead of a lazy load per nested model.
+        """
+        from sqlalchemy.orm import joinedload, selectinload
+
+        TripleModel = self.get_model('triple')
+        RelationshipModel = self.get_model('relationship')
+
+        if Model is TripleModel:
+            return [
+                joinedload(TripleModel.subject),
+                joinedload(TripleModel.object),
+                joinedload(TripleModel.predicate).selectinload(RelationshipModel.contexts),
+            ]
+
+        if Model is RelationshipModel:
+            return [selectinload(RelationshipModel.contexts)]
+
+        return []
+
+    def _snapshot(self, model):
+        """
+        Return a non-nested object holding the loaded columns of the model,
+        without loading anything from the database.
+        """
+        from sqlalchemy import inspect
+
+        state = inspect(model)
+
+        columns = dict(
+            (key, state.dict.get(key)) for key in state.mapper.column_attrs.keys()
+        )
+
+        object = self.get_object(self.get_model_name(model))
+
+        return object(**columns)
+
+    def _record_changes(self, session, flush_context):
+        changes = session.info.setdefault('changes', [])
+
+        for event, models in [
+            ('create', session.new),
+            ('update', session.dirty),
+            ('remove', session.deleted),
+        ]:
+            elements = [self._snapshot(model) for model in models]
+            if elements:
+                changes.append((event, elements))
+
+    def _dispatch_changes(self, session):
+        changes = session.info.pop('changes', [])
+
+        for event, elements in changes:
+            self._notify(event, elements)
+
+    def _discard_changes(self, session):
+        session.info.pop('changes', None)
+
     def _session_finish(self, session, element=None):
         from sqlalchemy.exc import InvalidRequestError
         try:
@@ -536,3 +936,6 @@ class SQLStorageAdapter(StorageAdapter):
             self.logger.exception(element)
         finally:
             session.close()
+
+    class UnsupportedDatabaseException(Exception):
+        pass
@@ -13,6 +13,37 @@ class StorageAdapter(object):
         """
         self.logger = kwargs.get('logger', logging.getLogger(__name__))
 
+        # Record the work of the storage, nothing is recorded by default
+        from ..instruments import Instrument
+
+        self.instrument = kwargs.get('instrument') or Instrument()
+
+        self.listeners = []
+
+        # Incremented by every committed change
+        self.generation = 0
+
+    def add_listener(self, listener):
+        """
+        Register a callable to be notified of the committed changes as
+        ``listener(event, elements)``, where the event is one of 'create',
+        'update', 'remove' or 'drop', and the elements are the changed
+        entity/relationship/statement/triple/alias objects.
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        """
+        Unregister a callable registered by ``add_listener``.
+        """
+        self.listeners.remove(listener)
+
+    def _notify(self, event, elements):
+        self.generation += 1
+
+        for listener in self.listeners:
+            listener(event, elements)
+
     def get_model(self, model_name):
         """
         Return the model class for a given model name.
@@ -53,6 +84,10 @@ class StorageAdapter(object):
         from ..elements.triple import Triple
         return Triple
 
+    def get_alias_object(self):
+        from ..elements.alias import Alias
+        return Alias
+
     def remove(self, element):
         """
         Removes the element(entity/relationship/statment/triple) that matches 
@@ -63,10 +98,16 @@ class StorageAdapter(object):
             'The `remove` method is not implemented by this adapter.'
         )
 
-    def get_candidate_triples(self, entity):
+    def get_candidate_triples(self, entity, **kwargs):
         """
-        Return a list of triples like <entity.type, ?, ?> and <?, ?, entity.type>,
-        If entity.type is not existed,then return <entity, ?, ?> and <?, ?, entity>.
+        Return a list of triples like <entity, ?, ?> and <?, ?, entity> by the entity id,
+        If entity.id is not existed, then return triples like <entity.type, ?, ?>
+        and <?, ?, entity.type>, or <entity.name, ?, ?> and <?, ?, entity.name>.
+
+        :keyword subject_type: Only return the triples <entity, ?, ?> whose predicate
+            expects this subject type, or no subject type.
+        :keyword object_type: Only return the triples <?, ?, entity> whose predicate
+            expects this object type, or no object type.
         """
         raise self.AdapterMethodNotImplementedError(
             'The `get_candidate_triples` method is not implemented by this adapter.'
@@ -81,6 +122,16 @@ class StorageAdapter(object):
             'The `create` method is not implemented by this adapter.'
         )
 
+    def create_many(self, triples, **kwargs):
+        """
+        Create triples given an iterable of Triple objects,
+        with the same result as creating them one by one.
+
+        :keyword chunk_size: The number of triples created per transaction.
+        """
+        for triple in triples:
+            self.create(triple)
+
     def select(self, element):
         """
         Returns a list of objects that matches the given element object.
@@ -98,6 +149,35 @@ class StorageAdapter(object):
             'The `update` method is not implemented by this adapter.'
         )
 
+    def add_aliases(self, aliases):
+        """
+        Create aliases given an iterable of (surface form, entity) pairs.
+        The entity is looked up by its id, or else by its name and type,
+        a name shared by several types gets the alias on each of them.
+        The surface forms are normalized by ``utils.normalize_alias``.
+        Return the created Alias objects, the existing ones are skipped.
+        """
+        raise self.AdapterMethodNotImplementedError(
+            'The `add_aliases` method is not implemented by this adapter.'
+        )
+
+    def get_aliases(self):
+        """
+        Return a list of every stored Alias object.
+        """
+        raise self.AdapterMethodNotImplementedError(
+            'The `get_aliases` method is not implemented by this adapter.'
+        )
+
+    def remove_aliases(self, aliases):
+        """
+        Remove the aliases given an iterable of (surface form, entity) pairs,
+        the entities are looked up as by ``add_aliases()``.
+        """
+        raise self.AdapterMethodNotImplementedError(
+            'The `remove_aliases` method is not implemented by this adapter.'
+        )
+
     def drop(self):
         """
         Drop the database attached to a given adapter.
@@ -25,6 +25,15 @@ class Tagger(object):
             'The `tag` method is not implemented by this tagger.'
         )
 
+    def tag_many(self, sentences):
+        """
+        Return a list of tagged tokens for each token sequence.
+
+        :param sentences: A list of token lists.
+        :rtype list(list(tuple(str, str)))
+        """
+        return [self.tag(tokens) for tokens in sentences]
+
     class TaggerMethodNotImplementedError(NotImplementedError):
         """
         An exception to be raised when a tagger method has not been implemented.
@@ -32,13 +41,49 @@ class Tagger(object):
         """
         pass
 
+class MemoizedTagger(Tagger):
+	"""
+	Tag by the given tagger, memoizing the tags of each token sequence in the cache.
+	"""
+	def __init__(self, tagger, cache):
+		self.tagger = tagger
+		self.cache = cache
+
+	def tag(self, tokens):
+		return self.tag_many([tokens])[0]
+
+	def tag_many(self, sentences):
+		from .caches import memoize_many
+
+		return memoize_many(self.cache, sentences, tuple, self.tagger.tag_many)
+
 class PerceptronTagger(Tagger):
 	"""
 	Perceptron tagger from nltk module.
+
+	The trained tagger is loaded once per process, on the first use.
 	"""
 	def __init__(self, **kwargs):
-		import nltk
-		self.perceptron_tag = nltk.pos_tag
+		pass
+
+	def get_model(self):
+		"""
+		Return the english perceptron tagger of the process.
+		"""
+		from . import registry
+		from nltk.tag import PerceptronTagger
+
+		return registry.get_model('nltk.perceptron_tagger', PerceptronTagger)
 
 	def tag(self, tokens):
-		return self.perceptron_tag(tokens)
\ No newline at end of file
+		# Equals nltk.pos_tag
+		return self.get_model().tag(tokens)
+
+	def tag_many(self, sentences):
+		"""
+		The perceptron tags each sentence on its own, as nltk.pos_tag_sents does,
+		the sentences of a batch only share the lookup of the model.
+		"""
+		model = self.get_model()
+
+		return [model.tag(tokens) for tokens in sentences]
\ No newline at end of file
@@ -1,6 +1,7 @@
 """
 Text tokenizers.
 """
+import re
 
 
 class Tokenizer(object):
@@ -23,6 +24,15 @@ class Tokenizer(object):
             'The `tokenize` method is not implemented by this tokenizer.'
         )
 
+    def tokenize_many(self, texts):
+        """
+        Return a list of tokenized substrings for each string.
+
+        :param texts: A list of strings.
+        :rtype list(list(str))
+        """
+        return [self.tokenize(text) for text in texts]
+
     class TokenizerMethodNotImplementedError(NotImplementedError):
         """
         An exception to be raised when a tokenizer method has not been implemented.
@@ -30,13 +40,153 @@ class Tokenizer(object):
         """
         pass
 
+class MemoizedTokenizer(Tokenizer):
+	"""
+	Tokenize by the given tokenizer, memoizing the tokens of each text in the cache.
+	"""
+	def __init__(self, tokenizer, cache):
+		self.tokenizer = tokenizer
+		self.cache = cache
+
+	def tokenize(self, text):
+		return self.tokenize_many([text])[0]
+
+	def tokenize_many(self, texts):
+		from .caches import memoize_many
+
+		return memoize_many(self.cache, texts, lambda text: text, self.tokenizer.tokenize_many)
+
 class TreebankTokenizer(Tokenizer):
 	"""
 	Treebank word tokenizer from nltk module.
+
+	The punkt sentence tokenizer is loaded once per process,
+	on the first use.
 	"""
 	def __init__(self, **kwargs):
-		import nltk
-		self.treebank_tokenize = nltk.word_tokenize
+		from nltk.tokenize import NLTKWordTokenizer
+		self.word_tokenizer = NLTKWordTokenizer()
+
+	def get_sentence_tokenizer(self):
+		"""
+		Return the english punkt sentence tokenizer of the process.
+		"""
+		from . import registry
+
+		def load():
+			try:
+				from nltk.tokenize import PunktTokenizer
+			except ImportError:
+				# Before nltk 3.8.2
+				import nltk.data
+				return nltk.data.load('tokenizers/punkt/english.pickle')
+
+			return PunktTokenizer('english')
+
+		return registry.get_model('nltk.punkt_tokenizer', load)
 
 	def tokenize(self, text):
-		return self.treebank_tokenize(text)
\ No newline at end of file
+		# Equals nltk.word_tokenize
+		return [
+			token
+			for sentence in self.get_sentence_tokenizer().tokenize(text)
+			for token in self.word_tokenizer.tokenize(sentence)
+		]
+
+class RegexTreebankTokenizer(Tokenizer):
+	"""
+	Treebank word tokenizer reproducing ``nltk.word_tokenize`` on a single
+	sentence, such as a question, without the nltk module.
+
+	The regexes of the nltk tokenizer are precompiled in the same order,
+	and each one only runs if the text holds the characters it can match,
+	most of them are skipped on a plain question. Unlike nltk, the text is
+	not split into sentences first, so a period ending an inner sentence
+	is kept in its token.
+	"""
+	# (trigger, regex, substitution), a rule runs if the text
+	# holds a character of the trigger, or always if None
+	RULES = [
+		# Starting quotes
+		('«“‘„`', re.compile('([«“‘„]|[`]+)'), r' \1 '),
+		('"', re.compile(r'^\"'), r'``'),
+		('`', re.compile(r'(``)'), r' \1 '),
+		('"\'', re.compile(r'([ \(\[{<])(\"|\'{2})'), r'\1 `` '),
+		('\'', re.compile(r'(?i)(?<!\w)(\')(?!(?:re|ve|ll|m|t|s|d|n)\b)(?=\w)'), r'\1 '),
+		# Punctuation
+		('.', re.compile(r'([^\.])(\.)([\]\)}>"\'' '»”’ ' r']*)\s*$'), r'\1 \2 \3 '),
+		(':,', re.compile(r'([:,])([^\d])'), r' \1 \2'),
+		(':,', re.compile(r'([:,])$'), r' \1 '),
+		('.', re.compile(r'\.{2,}'), r' \g<0> '),
+		(';@#$%&', re.compile(r'[;@#$%&]'), r' \g<0> '),
+		('\u2012\u2013\u2014\u2015', re.compile(r'[\u2012-\u2015]'), r' \g<0> '),
+		('.', re.compile(r'([^\.])(\.)([\]\)}>"\']*)\s*$'), r'\1 \2\3 '),
+		('?!', re.compile(r'[?!]'), r' \g<0> '),
+		('\'', re.compile(r"([^'])' "), r"\1 ' "),
+		('*', re.compile(r'[*]'), r' \g<0> '),
+		# Parentheses, brackets and double dashes
+		('[](){}<>', re.compile(r'[\]\[\(\)\{\}\<\>]'), r' \g<0> '),
+		('-', re.compile(r'--'), r' -- '),
+	]
+
+	ENDING_RULES = [
+		# Ending quotes
+		('»”’', re.compile('([»”’])'), r' \1 '),
+		('\'', re.compile(r"''"), " '' "),
+		('"', re.compile(r'"'), " '' "),
+		(None, re.compile(r'\s+'), ' '),
+		('\'', re.compile(r"([^' ])('[sS]|'[mM]|'[dD]|') "), r'\1 \2 '),
+		('\'', re.compile(r"([^' ])('ll|'LL|'re|'RE|'ve|'VE|n't|N'T) "), r'\1 \2 '),
+	]
+
+	# The contractions of Robert MacIntyre`s tokenizer
+	CONTRACTIONS_TRIGGER = re.compile(r"(?i)cannot|d'ye|gimme|gonna|gotta|lemme|more'n|wanna|'tis|'twas")
+
+	CONTRACTIONS = [
+		re.compile(pattern) for pattern in [
+			r"(?i)\b(can)(?#X)(not)\b",
+			r"(?i)\b(d)(?#X)('ye)\b",
+			r"(?i)\b(gim)(?#X)(me)\b",
+			r"(?i)\b(gon)(?#X)(na)\b",
+			r"(?i)\b(got)(?#X)(ta)\b",
+			r"(?i)\b(lem)(?#X)(me)\b",
+			r"(?i)\b(more)(?#X)('n)\b",
+			r"(?i)\b(wan)(?#X)(na)(?=\s)",
+			r"(?i) ('t)(?#X)(is)\b",
+			r"(?i) ('t)(?#X)(was)\b",
+		]
+	]
+
+	def __init__(self, **kwargs):
+		# Search the characters of each trigger by a precompiled class
+		def compile_triggers(rules):
+			return [
+				(trigger and re.compile('[%s]' % re.escape(trigger)).search, regex, substitution)
+				for trigger, regex, substitution in rules
+			]
+
+		self.rules = compile_triggers(self.RULES)
+		self.ending_rules = compile_triggers(self.ENDING_RULES)
+
+	def substitute(self, rules, text):
+		for trigger, regex, substitution in rules:
+			if trigger is None or trigger(text):
+				text = regex.sub(substitution, text)
+
+		return text
+
+	def tokenize(self, text):
+		text = self.substitute(self.rules, text)
+
+		text = self.substitute(self.ending_rules, ' ' + text + ' ')
+
+		if self.CONTRACTIONS_TRIGGER.search(text):
+			for regex in self.CONTRACTIONS:
+				text = regex.sub(r' \1 \2 ', text)
+
+		return text.split()
+
+	def tokenize_many(self, texts):
+		tokenize = self.tokenize
+
+		return [tokenize(text) for text in texts]
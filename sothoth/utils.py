@@ -22,6 +22,8 @@ def initialize_class(data, *args, **kwargs):
     :param data: A string or dictionary containing a import_path attribute.
     """
     if isinstance(data, dict):
+        # Copy the configuration, which may be shared by several instances
+        data = dict(data)
         import_path = data.get('import_path')
         data.update(kwargs)
         Class = import_module(import_path)
@@ -30,4 +32,12 @@ def initialize_class(data, *args, **kwargs):
     else:
         Class = import_module(data)
 
-        return Class(*args, **kwargs)
\ No newline at end of file
+        return Class(*args, **kwargs)
+
+
+def normalize_alias(text):
+    """
+    Return the surface form of an entity as looked up exactly,
+    lowercased with the whitespace collapsed.
+    """
+    return ' '.join(text.lower().split())
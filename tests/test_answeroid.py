@@ -0,0 +1,289 @@
+import asyncio
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from sothoth import Answeroid
+from sothoth.elements import Triple, Entity, Relationship, Statement
+from sothoth.taggers import Tagger
+
+
+class CapitalizedTagger(Tagger):
+    """
+    Tag the capitalized tokens as proper nouns, the tagger
+    of the tests needs no nltk data package.
+    """
+    def __init__(self, **kwargs):
+        pass
+
+    def tag(self, tokens):
+        return [(token, 'NNP' if token[:1].isupper() else 'NN') for token in tokens]
+
+
+def person_triple(name, age):
+    return Triple(
+        subject=Entity(name=name, type='PERSON'),
+        predicate=Relationship(
+            type='AGE', subject_type='PERSON', object_type='NUMBER',
+            contexts=[Statement(text='How old is <PERSON>'), Statement(text='What is the age of <PERSON>')]
+        ),
+        object=Entity(name=age, type='NUMBER')
+    )
+
+
+def typed_triple(subject, relationship_type, subject_type, object_type, object, contexts=()):
+    return Triple(
+        subject=Entity(name=subject[0], type=subject[1]),
+        predicate=Relationship(
+            type=relationship_type, subject_type=subject_type, object_type=object_type,
+            contexts=[Statement(text=text) for text in contexts]
+        ),
+        object=Entity(name=object[0], type=object[1])
+    )
+
+
+def birth_triples():
+    alice = ('Alice Smith', 'PERSON')
+
+    # The context of the birthplace is closer to the question asking the date
+    return [
+        typed_triple(alice, 'BIRTHPLACE', 'PERSON', 'PLACE', ('Paris', 'PLACE'), ['When was <PERSON> born']),
+        typed_triple(
+            alice, 'BIRTHDATE', 'PERSON', 'DATE', ('1990-01-01', 'DATE'), ['What is the birth date of <PERSON>']
+        ),
+        # Stored with a wrong subject type, no relationship of Acme fits it
+        typed_triple(
+            ('Acme', 'ORGANIZATION'), 'FOUNDED', 'PERSON', 'DATE', ('1999', 'DATE'),
+            ['When was <ORGANIZATION> founded']
+        ),
+    ]
+
+
+class AnsweroidTestCase(unittest.TestCase):
+
+    def create_answeroid(self, **kwargs):
+        kwargs.setdefault(
+            'storage_adapter', {'import_path': 'sothoth.storage.SQLStorageAdapter', 'database_uri': None}
+        )
+        kwargs.setdefault('tokenizer', 'sothoth.tokenizers.RegexTreebankTokenizer')
+        kwargs.setdefault('tagger', 'tests.test_answeroid.CapitalizedTagger')
+        kwargs.setdefault('recognizer', 'sothoth.recognizers.GazetteerRecognizer')
+
+        return Answeroid(**kwargs)
+
+    def test_shared_storage_configuration(self):
+        storage_adapter = {'import_path': 'sothoth.storage.MemoryStorageAdapter'}
+
+        first = self.create_answeroid(
+            storage_adapter=storage_adapter, instrument='sothoth.instruments.HistogramInstrument'
+        )
+        second = self.create_answeroid(
+            storage_adapter=storage_adapter, instrument='sothoth.instruments.HistogramInstrument'
+        )
+
+        self.assertEqual(storage_adapter, {'import_path': 'sothoth.storage.MemoryStorageAdapter'})
+        self.assertIs(first.storage.instrument, first.instrument)
+        self.assertIs(second.storage.instrument, second.instrument)
+        self.assertIsNot(first.instrument, second.instrument)
+
+    def test_update_entity(self):
+        answeroid = self.create_answeroid(answer_cache_size=10)
+        answeroid.learn_knowledge([person_triple('Alice Smith', '30'), person_triple('Bruno Diaz', '40')])
+
+        self.assertEqual(answeroid.get_answer('How old is Alice Smith?'), {'30'})
+
+        entity, = answeroid.storage.select(Entity(name='Alice Smith'))
+        answeroid.storage.update(Entity(id=entity.id, name='Alicia Smith', type='PERSON'))
+
+        # The cached answer and the indexes follow the new name
+        self.assertEqual(answeroid.get_answer('How old is Alice Smith?'), set())
+        self.assertEqual(answeroid.get_answer('How old is Alicia Smith?'), {'30'})
+
+        linked_entity = answeroid.entity_linker(Entity(name='Alicia Smith', type='<PERSON>'))
+        self.assertEqual((linked_entity.id, linked_entity.name), (entity.id, 'Alicia Smith'))
+
+        ranked_entity, _ = answeroid.entity_linker.rank(Entity(name='Alicia Smith', type='<PERSON>'), 1)[0]
+        self.assertEqual(ranked_entity.id, entity.id)
+
+    def test_gazetteer_stored_aliases(self):
+        answeroid = self.create_answeroid()
+        answeroid.learn_knowledge(
+            [person_triple('Alice Smith', '30'), person_triple('Bruno Diaz', '40')],
+            aliases={'Ally': 'Alice Smith'}
+        )
+
+        self.assertEqual(answeroid.get_answer('How old is Ally?'), {'30'})
+
+        # The built automaton follows the created and removed aliases
+        answeroid.learn_knowledge([], aliases={'Bru': Entity(name='Bruno Diaz', type='PERSON')})
+        self.assertEqual(answeroid.get_answer('How old is Bru?'), {'40'})
+
+        answeroid.storage.remove_aliases([('ally', Entity(name='Alice Smith'))])
+        self.assertEqual(answeroid.get_answer('How old is Ally?'), set())
+        self.assertEqual(answeroid.get_answer('How old is Alice Smith?'), {'30'})
+
+        answeroid.storage.remove(Entity(name='Bruno Diaz'))
+        self.assertEqual(answeroid.get_answer('How old is Bru?'), set())
+
+    def test_get_answers(self):
+        questions = [
+            'How old is Bruno Diaz?', 'How old is Alice Smith?', 'Who is Nobody?',
+            'What is the age of Alice Smith?', 'How old is Bruno Diaz?', 'How old is Chloe?',
+        ]
+
+        for answer_cache_size in [None, 10]:
+            with self.subTest(answer_cache_size=answer_cache_size):
+                answeroid = self.create_answeroid(answer_cache_size=answer_cache_size)
+                answeroid.learn_knowledge([
+                    person_triple('Alice Smith', '30'), person_triple('Bruno Diaz', '40'),
+                    person_triple('Chloe', '50'),
+                ])
+
+                answers = answeroid.get_answers(questions)
+
+                # In the input order, as answered one by one
+                self.assertEqual(answers, [{'40'}, {'30'}, set(), {'30'}, {'40'}, {'50'}])
+                self.assertEqual(answers, [answeroid.get_answer(question) for question in questions])
+
+    def test_relationship_pruning_answer_types(self):
+        default = self.create_answeroid()
+        default.learn_knowledge(birth_triples())
+
+        # The pruning is off by default, the closest context answers
+        self.assertEqual(default.get_answer('When was Alice Smith born?'), {'Paris'})
+
+        pruning = self.create_answeroid(relationship_pruning=True)
+        pruning.learn_knowledge(birth_triples())
+
+        # 'when' asks a DATE or TIME
+        self.assertEqual(pruning.get_answer('When was Alice Smith born?'), {'1990-01-01'})
+        self.assertEqual(pruning.get_answer('When was Acme founded?'), {'1999'})
+
+    def test_relationship_pruning_storage_filters(self):
+        answeroid = self.create_answeroid(relationship_pruning=True)
+        answeroid.learn_knowledge(birth_triples())
+
+        with mock.patch.object(
+            answeroid.storage, 'get_candidate_triples', wraps=answeroid.storage.get_candidate_triples
+        ) as get_candidate_triples:
+            answeroid.get_answer('When was Alice Smith born?')
+
+            get_candidate_triples.assert_called_once_with(
+                mock.ANY, subject_type='PERSON', object_type='PERSON'
+            )
+
+            # Nothing fits Acme, its triples are read again without the filters
+            get_candidate_triples.reset_mock()
+            self.assertEqual(answeroid.get_answer('When was Acme founded?'), {'1999'})
+
+            self.assertEqual(get_candidate_triples.call_args_list, [
+                mock.call(mock.ANY, subject_type='ORGANIZATION', object_type='ORGANIZATION'),
+                mock.call(mock.ANY),
+            ])
+
+    def test_relationship_pruning_async(self):
+        with tempfile.TemporaryDirectory() as directory:
+            answeroid = self.create_answeroid(
+                relationship_pruning=True,
+                storage_adapter={
+                    'import_path': 'sothoth.storage.AsyncSQLStorageAdapter',
+                    'database_uri': 'sqlite:///' + os.path.join(directory, 'test.sqlite3')
+                }
+            )
+            answeroid.learn_knowledge(birth_triples())
+
+            try:
+                self.assertEqual(
+                    asyncio.run(answeroid.aget_answers(['When was Alice Smith born?', 'When was Acme founded?'])),
+                    [{'1990-01-01'}, {'1999'}]
+                )
+            finally:
+                answeroid.storage.executor.shutdown()
+                answeroid.storage.engine.dispose()
+
+    def test_prune_triples(self):
+        answeroid = self.create_answeroid(
+            relationship_pruning=True, storage_adapter={'import_path': 'sothoth.storage.MemoryStorageAdapter'}
+        )
+
+        alice = ('Alice Smith', 'PERSON')
+        answeroid.learn_knowledge([
+            typed_triple(alice, 'BIRTHPLACE', 'PERSON', 'PLACE', ('Paris', 'PLACE')),
+            typed_triple(('Acme', 'ORGANIZATION'), 'EMPLOYS', 'ORGANIZATION', 'PERSON', alice),
+            typed_triple(alice, 'HEADQUARTERS', 'ORGANIZATION', 'PLACE', ('Berlin', 'PLACE')),
+            typed_triple(alice, 'KNOWS', None, None, ('Bruno Diaz', 'PERSON')),
+        ])
+
+        entity, = answeroid.storage.select(Entity(name='Alice Smith'))
+        candidate_triples = list(answeroid.storage.get_candidate_triples(entity))
+
+        def prune(entity, answer_types):
+            return sorted(
+                triple.predicate.type
+                for triple in answeroid._prune_triples(entity, candidate_triples, answer_types)
+            )
+
+        # The role of the entity, a relationship without types fits any entity
+        self.assertEqual(prune(entity, None), ['BIRTHPLACE', 'EMPLOYS', 'KNOWS'])
+
+        # The answer types, of the relationship or else of the answer entity
+        self.assertEqual(prune(entity, {'PLACE'}), ['BIRTHPLACE'])
+        self.assertEqual(prune(entity, {'PERSON'}), ['KNOWS'])
+
+        # A step pruning every triple is skipped
+        self.assertEqual(prune(entity, {'MONEY'}), ['BIRTHPLACE', 'EMPLOYS', 'KNOWS'])
+
+        # An entity without a type fits any relationship
+        self.assertEqual(
+            prune(Entity(id=entity.id, name=entity.name), None),
+            ['BIRTHPLACE', 'EMPLOYS', 'HEADQUARTERS', 'KNOWS']
+        )
+        self.assertEqual(prune(Entity(id=entity.id, name=entity.name), {'PLACE'}), ['BIRTHPLACE', 'HEADQUARTERS'])
+
+    def test_search_best_triple_score_cutoff(self):
+        rng = random.Random(0)
+
+        answeroid = self.create_answeroid(
+            sent_comparator='sothoth.comparisons.sent_comparators.BitParallelLevenshteinSimilarity'
+        )
+
+        words = ['born', 'old', 'age', 'live', 'work', 'when', 'where', 'is', 'the', 'of']
+        contexts = [' '.join(rng.sample(words, 4)) + ' <PERSON>' for _ in range(60)]
+
+        relationships = [
+            Relationship(id=index, contexts=[Statement(text=text) for text in rng.sample(contexts, 3)])
+            for index in range(20)
+        ]
+
+        entity = Entity(id=1, name='Alice Smith', type='PERSON')
+        candidate_triples = [
+            Triple(
+                id=index, subject=entity, predicate=relationships[index % 20],
+                object=Entity(id=1000 + index, name=str(index))
+            )
+            for index in range(40)
+        ]
+
+        questions = [' '.join(rng.sample(words, 3)) + ' <PERSON> ?' for _ in range(30)]
+
+        def search(cutoff):
+            # The scores are shared by the questions and the candidates
+            # of other entities, as in a batch
+            relationship_scores = {}
+
+            with mock.patch.object(answeroid.sent_comparator, 'supports_score_cutoff', cutoff):
+                return [
+                    answeroid._search_best_triple(
+                        entity, Statement(text=question), triples, relationship_scores
+                    ).id
+                    for question in questions
+                    for triples in [candidate_triples, candidate_triples[::2], candidate_triples[1::3]]
+                ]
+
+        self.assertEqual(search(True), search(False))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import random
+import unittest
+
+from sothoth.comparisons import sent_comparators, word_comparators
+from sothoth.comparisons.edit_distance import (
+    indel_distance, indel_similarity, levenshtein_distance, pattern_masks
+)
+
+
+def reference_levenshtein(a, b):
+    row = list(range(len(b) + 1))
+
+    for i, char_a in enumerate(a, 1):
+        previous, row[0] = row[0], i
+
+        for j, char_b in enumerate(b, 1):
+            previous, row[j] = row[j], min(row[j] + 1, row[j - 1] + 1, previous + (char_a != char_b))
+
+    return row[-1]
+
+
+def reference_indel(a, b):
+    # The characters outside the longest common subsequence
+    row = [0] * (len(b) + 1)
+
+    for char_a in a:
+        previous = 0
+
+        for j, char_b in enumerate(b, 1):
+            previous, row[j] = row[j], previous + 1 if char_a == char_b else max(row[j], row[j - 1])
+
+    return len(a) + len(b) - 2 * row[-1]
+
+
+def random_pairs(seed, count=300):
+    """
+    Return random pairs of strings over small alphabets, some longer
+    than a machine word to cover the carries of the big integers.
+    """
+    rng = random.Random(seed)
+
+    pairs = [('', ''), ('', 'abc'), ('abc', ''), ('a', 'a')]
+
+    for _ in range(count):
+        alphabet = rng.choice(['ab', 'abc', 'abcdefgh'])
+        length = rng.choice([rng.randint(1, 12), rng.randint(60, 140)])
+
+        a = ''.join(rng.choice(alphabet) for _ in range(length))
+        b = ''.join(rng.choice(alphabet) for _ in range(max(0, length + rng.randint(-5, 5))))
+
+        pairs.append((a, b))
+
+    return pairs
+
+
+class EditDistanceTestCase(unittest.TestCase):
+
+    def assertBounded(self, kernel, reference):
+        for a, b in random_pairs(0):
+            distance = reference(a, b)
+
+            self.assertEqual(kernel(a, b), distance, (a, b))
+            self.assertEqual(kernel(a, b, masks=pattern_masks(a)), distance, (a, b))
+
+            # Exact within the bound, one beyond it otherwise
+            for max_distance in {0, distance - 1, distance, distance + 1}:
+                if max_distance < 0:
+                    continue
+
+                self.assertEqual(
+                    kernel(a, b, max_distance), min(distance, max_distance + 1), (a, b, max_distance)
+                )
+
+    def test_levenshtein_distance(self):
+        self.assertBounded(levenshtein_distance, reference_levenshtein)
+
+    def test_indel_distance(self):
+        self.assertBounded(indel_distance, reference_indel)
+
+    def test_indel_similarity(self):
+        for a, b in random_pairs(1):
+            if not a and not b:
+                continue
+
+            self.assertEqual(
+                indel_similarity(a, b), round(1 - reference_indel(a, b) / (len(a) + len(b)), 2)
+            )
+
+    def test_indel_similarity_cutoff_boundary(self):
+        # 'a' * length turned into 'a' * (length - deleted) + 'b' * inserted,
+        # every total length and distance up to 60
+        for length in range(31):
+            for deleted in range(length + 1):
+                for inserted in range(31):
+                    pattern = 'a' * length
+                    text = 'a' * (length - deleted) + 'b' * inserted
+
+                    if not pattern and not text:
+                        continue
+
+                    similarity = indel_similarity(pattern, text)
+
+                    # The cutoffs at, just below and just above the rounded similarity
+                    for cutoff in [similarity, round(similarity - 0.01, 2), round(similarity + 0.01, 2)]:
+                        self.assertEqual(
+                            indel_similarity(pattern, text, cutoff),
+                            similarity if similarity >= cutoff else 0,
+                            (length, deleted, inserted, cutoff)
+                        )
+
+    def test_comparators(self):
+        rng = random.Random(2)
+        texts = [''.join(rng.choice('abc ') for _ in range(rng.randint(0, 20))) for _ in range(100)]
+
+        for comparator in [
+            word_comparators.BitParallelLevenshteinSimilarity(),
+            sent_comparators.BitParallelLevenshteinSimilarity(),
+        ]:
+            self.assertTrue(comparator.supports_score_cutoff)
+
+            for text in texts[:10]:
+                scores = [comparator.compare(other_text, text) for other_text in texts]
+
+                self.assertEqual(list(comparator.compare_many(text, texts)), scores)
+
+                for cutoff in [0.3, 0.5, 0.8]:
+                    self.assertEqual(
+                        list(comparator.compare_many(text, texts, score_cutoff=cutoff)),
+                        [score if score >= cutoff else 0 for score in scores]
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import random
+import unittest
+
+from sothoth.comparisons.edit_distance import levenshtein_distance
+from sothoth.comparisons.word_comparators import BitParallelLevenshteinSimilarity, LevenshteinSimilarity
+from sothoth.elements import Triple, Entity, Relationship
+from sothoth.linkers import BKTree, BKTreeEntityLinker, ExhaustiveEntityLinker
+from sothoth.storage import MemoryStorageAdapter
+
+
+def random_names(seed, count):
+    rng = random.Random(seed)
+
+    return [
+        ''.join(rng.choice('abcde') for _ in range(rng.randint(1, 9)))
+        for _ in range(count)
+    ]
+
+
+class BKTreeTestCase(unittest.TestCase):
+
+    def test_search(self):
+        calls = []
+
+        def distance(a, b, max_distance=None):
+            calls.append(max_distance)
+            return levenshtein_distance(a, b, max_distance)
+
+        names = random_names(0, 300)
+
+        tree = BKTree(distance)
+        for item_id, name in enumerate(names):
+            tree.add(name, item_id, name)
+
+        for key in random_names(1, 20):
+            for radius in [0, 1, 2, 3]:
+                del calls[:]
+
+                found = dict(
+                    (name, distance) for distance, name, _ in tree.search(key, lambda: radius)
+                )
+
+                self.assertEqual(found, dict(
+                    (name, levenshtein_distance(key, name)) for name in names
+                    if levenshtein_distance(key, name) <= radius
+                ))
+
+                # Every node is measured with a bound
+                self.assertNotIn(None, calls)
+
+
+class BKTreeEntityLinkerTestCase(unittest.TestCase):
+
+    def test_rank_equals_exhaustive(self):
+        storage = MemoryStorageAdapter()
+
+        rng = random.Random(2)
+        for name in random_names(3, 200):
+            storage.create(Triple(
+                subject=Entity(name=name, type=rng.choice(['PERSON', 'PLACE', 'THING'])),
+                predicate=Relationship(type='NAMED'),
+                object=Entity(name='x', type='NAME')
+            ))
+
+        for comparator in [BitParallelLevenshteinSimilarity(), LevenshteinSimilarity()]:
+            exhaustive = ExhaustiveEntityLinker(storage, comparator, exact_linking=False)
+            bk_tree = BKTreeEntityLinker(storage, comparator, exact_linking=False)
+
+            for name in random_names(4, 30):
+                mention = Entity(name=name, type='<PERSON>')
+
+                for top_k in [1, 5]:
+                    with self.subTest(comparator=type(comparator).__name__, name=name, top_k=top_k):
+                        self.assertEqual(
+                            [(entity.id, score) for entity, score in bk_tree.rank(mention, top_k)],
+                            [(entity.id, score) for entity, score in exhaustive.rank(mention, top_k)]
+                        )
+
+    def test_follows_storage_changes(self):
+        storage = MemoryStorageAdapter()
+        linker = BKTreeEntityLinker(storage, LevenshteinSimilarity(), exact_linking=False)
+
+        self.assertIsNone(linker(Entity(name='Alice', type='<PERSON>')))
+
+        def person(name):
+            return Triple(
+                subject=Entity(name=name, type='PERSON'),
+                predicate=Relationship(type='AGE'),
+                object=Entity(name='30', type='NUMBER')
+            )
+
+        storage.create(person('Alice Smith'))
+        storage.create(person('Bruno Diaz'))
+
+        self.assertEqual(linker(Entity(name='Alice Smyth', type='<PERSON>')).name, 'Alice Smith')
+
+        # The built index follows the created, updated and removed entities
+        storage.create(person('Alice Smyth'))
+        self.assertEqual(linker(Entity(name='Alice Smyth', type='<PERSON>')).name, 'Alice Smyth')
+
+        entity, = storage.select(Entity(name='Bruno Diaz'))
+        storage.update(Entity(id=entity.id, name='Bruno Wayne', type='PERSON'))
+        self.assertEqual(linker(Entity(name='Bruno Diaz', type='<PERSON>')).name, 'Bruno Wayne')
+
+        storage.remove(Entity(name='Alice Smyth'))
+        self.assertEqual(linker(Entity(name='Alice Smyth', type='<PERSON>')).name, 'Alice Smith')
+
+        storage.drop()
+        self.assertIsNone(linker(Entity(name='Alice Smith', type='<PERSON>')))
+
+
+if __name__ == '__main__':
+    unittest.main()
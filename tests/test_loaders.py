@@ -0,0 +1,160 @@
+import json
+import os
+import tempfile
+import unittest
+
+from sothoth import loaders
+from sothoth.elements import Triple
+from sothoth.storage import MemoryStorageAdapter
+
+
+RECORDS = [
+    ('Alice Smith', 'PERSON', 'AGE', '30', 'NUMBER', ['How old is <PERSON>', 'What is the age of <PERSON>']),
+    ('Bruno Diaz', 'PERSON', 'AGE', '40', 'NUMBER', ['How old is <PERSON>', 'What is the age of <PERSON>']),
+    ('Bruno Diaz', 'PERSON', 'BIRTHPLACE', 'Paris, France', 'PLACE', []),
+]
+
+
+def describe(storage):
+    return sorted(
+        (
+            triple.subject.name, triple.subject.type, triple.predicate.type,
+            triple.predicate.subject_type, triple.predicate.object_type,
+            triple.object.name, triple.object.type,
+            sorted(context.text for context in triple.predicate.contexts)
+        )
+        for triple in storage.select(Triple())
+    )
+
+
+class LoadersTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, lines):
+        path = os.path.join(self.directory.name, name)
+
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(lines) + '\n')
+
+        return path
+
+    def write_jsonl(self):
+        return self.write('knowledge.jsonl', [
+            json.dumps({
+                'subject': {'name': subject, 'type': subject_type},
+                'predicate': {'type': predicate, 'contexts': contexts},
+                'object': {'name': object, 'type': object_type},
+            })
+            for subject, subject_type, predicate, object, object_type, contexts in RECORDS
+        ])
+
+    def expected(self):
+        return sorted(
+            (
+                subject, subject_type, predicate, subject_type, object_type,
+                object, object_type, sorted(contexts)
+            )
+            for subject, subject_type, predicate, object, object_type, contexts in RECORDS
+        )
+
+    def test_formats(self):
+        csv_path = self.write('knowledge.csv', ['subject,subject_type,predicate,object,object_type,contexts'] + [
+            '{},{},{},"{}",{},{}'.format(
+                subject, subject_type, predicate, object, object_type, '|'.join(contexts)
+            )
+            for subject, subject_type, predicate, object, object_type, contexts in RECORDS
+        ])
+
+        ntriples_path = self.write('knowledge.nt', ['# A comment', ''] + [
+            '<http://example.org/{}> <http://example.org/ontology#{}> "{}"^^<http://example.org/{}> .'.format(
+                subject.replace(' ', '_'), predicate, object, object_type
+            )
+            for subject, _, predicate, object, object_type, _ in RECORDS
+        ])
+
+        for path, expected in [
+            (self.write_jsonl(), self.expected()),
+            (csv_path, self.expected()),
+            (ntriples_path, [
+                (subject.replace(' ', '_'), None, predicate, None, object_type, object, object_type, [])
+                for subject, _, predicate, _, _, object, object_type, _ in self.expected()
+            ]),
+        ]:
+            with self.subTest(path=os.path.basename(path)):
+                storage = MemoryStorageAdapter()
+
+                loaders.load_knowledge(storage, path, batch_size=2)
+
+                self.assertEqual(describe(storage), expected)
+
+    def test_ntriples_terms(self):
+        self.assertEqual(loaders.parse_ntriples_term('<http://example.org/a/b#Obama>'), ('Obama', None))
+        self.assertEqual(loaders.parse_ntriples_term('_:node1'), ('node1', None))
+        self.assertEqual(loaders.parse_ntriples_term('"Caf\\u00e9 \\"A\\""@fr'), ('Café "A"', None))
+        self.assertEqual(
+            loaders.parse_ntriples_term('"1961"^^<http://www.w3.org/2001/XMLSchema#gYear>'), ('1961', 'gYear')
+        )
+
+        path = self.write('illegal.nt', ['<a> <b> .'])
+
+        with self.assertRaises(loaders.LoaderException):
+            list(loaders.parse(path))
+
+    def test_resume(self):
+        path = self.write_jsonl()
+        checkpoint = os.path.join(self.directory.name, 'knowledge.checkpoint')
+
+        storage = MemoryStorageAdapter()
+
+        # Crash while storing the second batch
+        create_many = storage.create_many
+        calls = []
+
+        def failing_create_many(triples, **kwargs):
+            calls.append(triples)
+
+            if len(calls) == 2:
+                raise RuntimeError('crash')
+
+            return create_many(triples, **kwargs)
+
+        storage.create_many = failing_create_many
+
+        with self.assertRaises(RuntimeError):
+            loaders.load_knowledge(storage, path, batch_size=2, checkpoint=checkpoint)
+
+        self.assertEqual(len(list(storage.select(Triple()))), 2)
+
+        # Resumed from the checkpoint of the first batch
+        del storage.create_many
+
+        end_offset = loaders.load_knowledge(storage, path, batch_size=2, checkpoint=checkpoint)
+
+        self.assertEqual(end_offset, os.path.getsize(path))
+        self.assertEqual(loaders.read_checkpoint(checkpoint), end_offset)
+        self.assertEqual(describe(storage), self.expected())
+
+    def test_csv_offset(self):
+        path = self.write('knowledge.csv', [
+            'object,predicate,subject,contexts',
+            '30,AGE,Alice Smith,How old is <PERSON>',
+            '40,AGE,Bruno Diaz,',
+        ])
+
+        # The header is read whatever the offset
+        _, offset = next(loaders.parse(path))
+        records = list(loaders.parse(path, offset=offset))
+
+        self.assertEqual(
+            [(triple.subject.name, triple.object.name, triple.predicate.contexts) for triple, _ in records],
+            [('Bruno Diaz', '40', [])]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+from sothoth.elements import Triple, Entity, Relationship, Statement
+from sothoth.storage import MemoryStorageAdapter
+
+
+def person_triple(name, age):
+    return Triple(
+        subject=Entity(name=name, type='PERSON'),
+        predicate=Relationship(
+            type='AGE', subject_type='PERSON', object_type='NUMBER',
+            contexts=[Statement(text='How old is <PERSON>')]
+        ),
+        object=Entity(name=age, type='NUMBER')
+    )
+
+
+class MemoryStorageAdapterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.storage = MemoryStorageAdapter()
+
+        self.storage.create(person_triple('Alice', '30'))
+        self.storage.create(person_triple('Bruno', '40'))
+        self.storage.add_aliases([('Ally', Entity(name='Alice'))])
+
+    def names(self):
+        return sorted(entity.name for entity in self.storage.select(Entity(type='PERSON')))
+
+    def test_changing_selected_elements(self):
+        entity, = self.storage.select(Entity(name='Alice'))
+        entity.name = 'Chloe'
+
+        triple = next(self.storage.select(Triple()))
+        triple.subject.name = 'Dan'
+        triple.predicate.type = 'HEIGHT'
+        triple.predicate.contexts[0].text = 'How tall is <PERSON>'
+
+        alias, = self.storage.get_aliases()
+        alias.name = 'bru'
+
+        # The graph and its indexes are left intact
+        self.assertEqual(self.names(), ['Alice', 'Bruno'])
+        self.assertEqual(len(list(self.storage.select(Entity(name='Alice')))), 1)
+        self.assertEqual(list(self.storage.select(Entity(name='Chloe'))), [])
+        self.assertEqual(
+            [relationship.type for relationship in self.storage.select(Relationship())], ['AGE']
+        )
+        self.assertEqual(
+            [statement.text for statement in self.storage.select(Statement())], ['How old is <PERSON>']
+        )
+        self.assertEqual([alias.name for alias in self.storage.get_aliases()], ['ally'])
+
+    def test_updating_selected_elements(self):
+        entity, = self.storage.select(Entity(name='Alice'))
+        entity.name = 'Chloe'
+        self.storage.update(entity)
+
+        self.assertEqual(self.names(), ['Bruno', 'Chloe'])
+        self.assertEqual(list(self.storage.select(Entity(name='Alice'))), [])
+
+        statement, = self.storage.select(Statement())
+        statement.text = 'What is the age of <PERSON>'
+        self.storage.update(statement)
+
+        self.assertEqual(
+            [context.text for context in next(self.storage.select(Relationship())).contexts],
+            ['What is the age of <PERSON>']
+        )
+
+        # Removed by the indexed name
+        self.storage.remove(Entity(name='Chloe'))
+        self.assertEqual(self.names(), ['Bruno'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+
+from sothoth.elements import Triple, Entity, Relationship
+from sothoth.recognizers import AhoCorasick, GazetteerRecognizer
+from sothoth.storage import MemoryStorageAdapter
+
+
+class AhoCorasickTestCase(unittest.TestCase):
+
+    def test_overlapping_keywords(self):
+        automaton = AhoCorasick()
+
+        for item_id, keyword in enumerate(['new york', 'new york city', 'york', 'york city hall', 'city']):
+            automaton.add(tuple(keyword.split()), item_id, keyword)
+
+        tokens = 'i love new york city hall'.split()
+
+        # Every occurrence, the nested ones through the output links
+        self.assertEqual(
+            sorted((start, end, list(items.values())) for start, end, items in automaton.search(tokens)),
+            [
+                (2, 4, ['new york']), (2, 5, ['new york city']), (3, 4, ['york']),
+                (3, 6, ['york city hall']), (4, 5, ['city']),
+            ]
+        )
+
+        # A discarded keyword keeps its states to route the others
+        automaton.discard(('new', 'york'), 0)
+        automaton.add(('love',), 5, 'love')
+
+        self.assertEqual(
+            sorted((start, end) for start, end, items in automaton.search(tokens) if items),
+            [(1, 2), (2, 5), (3, 4), (3, 6), (4, 5)]
+        )
+
+
+class GazetteerRecognizerTestCase(unittest.TestCase):
+
+    def create_recognizer(self, names, **kwargs):
+        storage = MemoryStorageAdapter()
+
+        for name, entity_type in names:
+            storage.create(Triple(
+                subject=Entity(name=name, type=entity_type),
+                predicate=Relationship(type='IS'),
+                object=Entity(name='thing', type='THING')
+            ))
+
+        recognizer = GazetteerRecognizer(tokenizer='sothoth.tokenizers.RegexTreebankTokenizer', **kwargs)
+        recognizer.fit(storage)
+
+        return storage, recognizer
+
+    def mentions(self, recognizer, text):
+        tagged_tokens = [(token, 'NN') for token in text.split()]
+
+        return [
+            (item[0], item[2]) for item in recognizer.distinct(tagged_tokens) if item[2] != '<>'
+        ]
+
+    def test_longest_match(self):
+        _, recognizer = self.create_recognizer([
+            ('New York', 'PLACE'), ('New York City', 'PLACE'), ('York City Hall', 'FACILITY'),
+            ('City', 'PLACE'), ('Hall', 'PERSON'),
+        ])
+
+        # The longest of the mentions starting first wins an overlap,
+        # the following mentions start after it
+        self.assertEqual(
+            self.mentions(recognizer, 'where is new york city hall ?'),
+            [('New York City', '<PLACE>'), ('Hall', '<PERSON>')]
+        )
+        self.assertEqual(
+            self.mentions(recognizer, 'is york city hall in new york'),
+            [('York City Hall', '<FACILITY>'), ('New York', '<PLACE>')]
+        )
+
+    def test_shared_name(self):
+        storage, recognizer = self.create_recognizer([('Paris', 'PLACE'), ('Paris', 'PERSON')])
+
+        place, = storage.select(Entity(name='Paris', type='PLACE'))
+
+        # The entity of the smallest id
+        tagged_tokens = recognizer.distinct([('Paris', 'NNP'), ('?', '.')])
+        self.assertEqual(tagged_tokens, [('Paris', 'NNP', '<PLACE>', place.id), ('?', '.', '<>')])
+
+        storage.remove(Entity(id=place.id))
+        self.assertEqual(self.mentions(recognizer, 'Paris ?'), [('Paris', '<PERSON>')])
+
+    def test_aliases(self):
+        storage, recognizer = self.create_recognizer(
+            [('Obama', 'PERSON'), ('United States', 'PLACE')],
+            gazetteer_aliases={'Barack Obama': 'Obama'}
+        )
+        storage.add_aliases([('the States', Entity(name='United States'))])
+
+        # An alias longer than the name wins the overlap
+        self.assertEqual(
+            self.mentions(recognizer, 'was barack obama the president of the states ?'),
+            [('Obama', '<PERSON>'), ('United States', '<PLACE>')]
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
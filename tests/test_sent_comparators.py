@@ -0,0 +1,139 @@
+import random
+import unittest
+
+import numpy
+
+from sothoth.comparisons import sent_comparators
+from sothoth.comparisons.sent_comparators import GlobalCosineSimilarity
+from sothoth.elements import Triple, Entity, Relationship, Statement
+from sothoth.storage import SQLStorageAdapter, MemoryStorageAdapter
+
+
+WORDS = ['how', 'old', 'is', 'the', 'age', 'of', 'when', 'was', 'born', 'where']
+
+
+def random_text(rng):
+    return ' '.join(rng.choice(WORDS) for _ in range(rng.randint(1, 5))) + ' <PERSON>'
+
+
+class CompareManyTestCase(unittest.TestCase):
+
+    def test_compare_many_equals_compare(self):
+        rng = random.Random(0)
+
+        storage = MemoryStorageAdapter()
+        storage.create(Triple(
+            subject=Entity(name='Alice', type='PERSON'),
+            predicate=Relationship(type='AGE', contexts=[Statement(text=random_text(rng)) for _ in range(10)]),
+            object=Entity(name='30', type='NUMBER')
+        ))
+
+        contexts = [statement.text for statement in storage.select(Statement())]
+        sentences = contexts + [random_text(rng) for _ in range(10)] + ['', 'where']
+
+        for name in [
+            'LevenshteinSimilarity', 'JaccardSimilarity', 'CosineSimilarity',
+            'GlobalCosineSimilarity', 'BitParallelLevenshteinSimilarity',
+        ]:
+            comparator = getattr(sent_comparators, name)(tokenizer='sothoth.tokenizers.RegexTreebankTokenizer')
+            comparator.fit(storage)
+
+            for sentence in sentences[::3]:
+                with self.subTest(comparator=name, sentence=sentence):
+                    # The CosineSimilarity scores 0 instead of nan a sentence without tokens
+                    numpy.testing.assert_allclose(
+                        comparator.compare_many(sentence, sentences),
+                        numpy.nan_to_num([comparator.compare(other_sentence, sentence) for other_sentence in sentences])
+                    )
+
+
+class CascadeSimilarityTestCase(unittest.TestCase):
+
+    def test_configured_stages(self):
+        cascade = sent_comparators.CascadeSimilarity(
+            tokenizer='sothoth.tokenizers.RegexTreebankTokenizer',
+            sent_cascade_first='sothoth.comparisons.sent_comparators.JaccardSimilarity',
+            sent_cascade_second='sothoth.comparisons.sent_comparators.CosineSimilarity',
+            sent_cascade_top_n=2
+        )
+
+        self.assertIsInstance(cascade.first_comparator, sent_comparators.JaccardSimilarity)
+        self.assertIsInstance(cascade.second_comparator, sent_comparators.CosineSimilarity)
+
+        sentences = ['how old is <PERSON>', 'when was <PERSON> born', 'how old was <PERSON>', 'where is <PERSON>']
+
+        # The two best by the Jaccard similarity are re-scored by the cosine similarity
+        numpy.testing.assert_allclose(
+            cascade.compare_many('how old is <PERSON> ?', sentences),
+            [
+                cascade.second_comparator.compare(sentences[0], 'how old is <PERSON> ?'), 0,
+                cascade.second_comparator.compare(sentences[2], 'how old is <PERSON> ?'), 0,
+            ]
+        )
+
+
+class GlobalCosineSimilarityTestCase(unittest.TestCase):
+
+    def create_comparator(self, storage):
+        comparator = GlobalCosineSimilarity(tokenizer='sothoth.tokenizers.RegexTreebankTokenizer')
+        comparator.fit(storage)
+
+        return comparator
+
+    def change(self, storage, rng):
+        statements = list(storage.select(Statement()))
+        relationships = list(storage.select(Relationship()))
+
+        operation = rng.choice(['create'] * 3 + ['remove', 'update', 'remove_relationship', 'remove_entity'])
+
+        if operation == 'create' or not statements:
+            storage.create(Triple(
+                subject=Entity(name=rng.choice('abcd'), type='PERSON'),
+                predicate=Relationship(
+                    type=rng.choice(['R1', 'R2', 'R3', 'R4']),
+                    contexts=[Statement(text=random_text(rng)) for _ in range(rng.randint(1, 3))]
+                ),
+                object=Entity(name=rng.choice('123'), type='NUMBER')
+            ))
+        elif operation == 'remove':
+            storage.remove(Statement(text=rng.choice(statements).text))
+        elif operation == 'update':
+            storage.update(Statement(id=rng.choice(statements).id, text=random_text(rng)))
+        elif operation == 'remove_relationship':
+            storage.remove(Relationship(type=rng.choice(relationships).type))
+        else:
+            storage.remove(Entity(name=rng.choice('abcd')))
+
+    def test_incremental_learning_equals_fit(self):
+        for storage_class in [SQLStorageAdapter, MemoryStorageAdapter]:
+            for seed in range(5):
+                with self.subTest(storage=storage_class.__name__, seed=seed):
+                    rng = random.Random(seed)
+
+                    storage = storage_class(database_uri=None)
+                    comparator = self.create_comparator(storage)
+
+                    for _ in range(60):
+                        self.change(storage, rng)
+
+                        fitted = self.create_comparator(storage)
+                        storage.remove_listener(fitted.on_storage_changed)
+
+                        self.assertEqual(set(comparator.rows), set(fitted.rows))
+                        self.assertEqual(comparator.counts, fitted.counts)
+
+                        texts = sorted(fitted.rows) + [random_text(rng), 'where <PLACE>']
+
+                        for sentence in [random_text(rng) for _ in range(3)]:
+                            numpy.testing.assert_allclose(
+                                comparator.compare_many(sentence, texts),
+                                fitted.compare_many(sentence, texts)
+                            )
+
+                    # The dropped rows are compacted
+                    comparator.get_matrix()
+                    self.assertLessEqual(comparator.row_count, 2 * len(comparator.rows))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+
+from sothoth.elements import Triple, Entity, Relationship, Statement
+from sothoth.linkers import BKTreeEntityLinker
+from sothoth.comparisons.word_comparators import LevenshteinSimilarity
+from sothoth.storage import MemoryStorageAdapter
+from sothoth.storage.snapshot_storage import SnapshotStorageAdapter, compile_snapshot
+
+
+def person_triple(name, age):
+    return Triple(
+        subject=Entity(name=name, type='PERSON'),
+        predicate=Relationship(
+            type='AGE', subject_type='PERSON', object_type='NUMBER',
+            contexts=[Statement(text='How old is <PERSON>')]
+        ),
+        object=Entity(name=age, type='NUMBER')
+    )
+
+
+class SnapshotStorageAdapterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'test.snapshot')
+
+        self.memory = MemoryStorageAdapter()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def compile(self):
+        compile_snapshot(self.memory, self.path)
+
+        return SnapshotStorageAdapter(snapshot_path=self.path)
+
+    def test_nameless_entity(self):
+        self.memory.create(person_triple('Alice', '30'))
+        self.memory.create(person_triple(None, '40'))
+
+        snapshot = self.compile()
+
+        self.assertEqual(
+            sorted((entity.name or '', entity.type) for entity in snapshot.select(Entity())),
+            [('', 'PERSON'), ('30', 'NUMBER'), ('40', 'NUMBER'), ('Alice', 'PERSON')]
+        )
+
+        # The nameless entity is not indexed under another string
+        for entity in snapshot.select(Entity()):
+            for string in ['30', '40', 'AGE', 'Alice', 'How old is <PERSON>', 'NUMBER', 'PERSON']:
+                self.assertEqual(
+                    entity.id in snapshot.entities_by_name.get(string, []), entity.name == string
+                )
+
+    def test_aliases(self):
+        self.memory.create(person_triple('Alice Smith', '30'))
+        self.memory.create(person_triple('Bruno Diaz', '40'))
+        self.memory.add_aliases([('Ally', Entity(name='Alice Smith')), ('Bru', Entity(name='Bruno Diaz'))])
+
+        snapshot = self.compile()
+
+        self.assertEqual(
+            [alias.serialize() for alias in snapshot.get_aliases()],
+            [alias.serialize() for alias in self.memory.get_aliases()]
+        )
+
+        linker = BKTreeEntityLinker(snapshot, LevenshteinSimilarity())
+        self.assertEqual(linker(Entity(name='ALLY', type='<PERSON>')).name, 'Alice Smith')
+        self.assertEqual(linker.link_stats()['hits'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+import os
+import random
+import tempfile
+import unittest
+from collections import Counter
+
+from sqlalchemy.exc import IntegrityError
+
+from sothoth.elements import Triple, Entity, Relationship, Statement
+from sothoth.storage import SQLStorageAdapter, MemoryStorageAdapter
+
+
+def person_triple(name, age, relationship_type='AGE'):
+    return Triple(
+        subject=Entity(name=name, type='PERSON'),
+        predicate=Relationship(
+            type=relationship_type, subject_type='PERSON', object_type='NUMBER',
+            contexts=[Statement(text='How old is <PERSON>')]
+        ),
+        object=Entity(name=age, type='NUMBER')
+    )
+
+
+def random_triples(seed, count=12):
+    """
+    Return random triples over few names, types and contexts,
+    so that the elements are often shared or left null.
+    """
+    rng = random.Random(seed)
+
+    triples = []
+
+    for _ in range(count):
+        triples.append(Triple(
+            subject=Entity(name=rng.choice('abc'), type=rng.choice(['PERSON', 'PLACE'])),
+            predicate=Relationship(
+                type=rng.choice(['R1', 'R2']),
+                subject_type=rng.choice(['PERSON', 'PLACE', None]),
+                object_type=rng.choice(['DATE', None]),
+                contexts=[
+                    Statement(text=text)
+                    for text in rng.sample(['x <P>', 'y <P>', 'z <P>'], rng.randint(0, 2))
+                ]
+            ),
+            object=Entity(name=rng.choice('123'), type=rng.choice(['DATE', 'NUMBER']))
+        ))
+
+    return triples
+
+
+def describe(triple):
+    predicate = triple.predicate
+
+    return (
+        triple.id, triple.subject.serialize(), triple.object.serialize(), predicate.id,
+        predicate.type, predicate.subject_type, predicate.object_type,
+        [context.text for context in predicate.contexts]
+    )
+
+
+def stored_rows(storage):
+    """
+    Return the counts of the stored rows by their natural keys.
+    """
+    def entity_key(entity):
+        return entity.type, entity.name
+
+    def relationship_key(relationship):
+        return relationship.type, relationship.subject_type, relationship.object_type
+
+    relationships = list(storage.select(Relationship()))
+
+    return {
+        'entities': Counter(entity_key(entity) for entity in storage.select(Entity())),
+        'relationships': Counter(relationship_key(relationship) for relationship in relationships),
+        'statements': Counter(
+            (relationship_key(relationship), context.text)
+            for relationship in relationships for context in relationship.contexts
+        ),
+        'triples': Counter(
+            (entity_key(triple.subject), relationship_key(triple.predicate), entity_key(triple.object))
+            for triple in storage.select(Triple())
+        ),
+    }
+
+
+class SQLStorageAdapterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+        # A file database, the scoped sessions of thread_safe can`t share an in-memory one
+        self.storage = SQLStorageAdapter(
+            database_uri='sqlite:///' + os.path.join(self.directory.name, 'test.sqlite3'),
+            thread_safe=True
+        )
+
+    def tearDown(self):
+        self.storage.engine.dispose()
+        self.directory.cleanup()
+
+    def test_create_many_rolls_back_a_failed_chunk(self):
+        # The type of a relationship can`t be null, the second chunk
+        # fails after inserting its entities
+        triples = [person_triple('Alice', '30'), person_triple('Dan', '40', None)]
+
+        with self.assertRaises(IntegrityError):
+            self.storage.create_many(triples, chunk_size=1)
+
+        names = sorted(entity.name for entity in self.storage.select(Entity()))
+        self.assertEqual(names, ['30', 'Alice'])
+
+        # The session of the thread is still usable
+        self.storage.create(person_triple('Bruno', '50'))
+        self.storage.create_many([person_triple('Chloe', '60')])
+
+        names = sorted(entity.name for entity in self.storage.select(Entity()))
+        self.assertEqual(names, ['30', '50', '60', 'Alice', 'Bruno', 'Chloe'])
+
+    def test_create_and_create_many_store_the_same_rows(self):
+        for seed in range(50):
+            with self.subTest(seed=seed):
+                triples = random_triples(seed)
+                descriptions = [describe(triple) for triple in triples]
+
+                one_by_one = SQLStorageAdapter(database_uri=None)
+                for triple in triples:
+                    one_by_one.create(triple)
+
+                # The same objects, which are not modified by the first path
+                bulk = SQLStorageAdapter(database_uri=None)
+                bulk.create_many(triples, chunk_size=5)
+
+                memory = MemoryStorageAdapter()
+                for triple in triples:
+                    memory.create(triple)
+
+                self.assertEqual([describe(triple) for triple in triples], descriptions)
+                self.assertEqual(stored_rows(one_by_one), stored_rows(bulk))
+                self.assertEqual(stored_rows(memory), stored_rows(bulk))
+
+
+class CandidateTriplesTestCase(unittest.TestCase):
+
+    def create_storages(self):
+        def triple(subject, relationship_type, subject_type, object_type, object):
+            return Triple(
+                subject=Entity(name=subject[0], type=subject[1]),
+                predicate=Relationship(
+                    type=relationship_type, subject_type=subject_type, object_type=object_type
+                ),
+                object=Entity(name=object[0], type=object[1])
+            )
+
+        alice, bruno, carol = ('Alice', 'PERSON'), ('Bruno', 'PERSON'), ('Carol', 'PERSON')
+
+        triples = [
+            triple(alice, 'AGE', 'PERSON', 'NUMBER', ('30', 'NUMBER')),
+            triple(bruno, 'AGE', 'PERSON', 'NUMBER', ('40', 'NUMBER')),
+            triple(alice, 'FOUNDED', 'ORGANIZATION', 'DATE', ('1990', 'DATE')),
+            triple(alice, 'KNOWS', None, None, bruno),
+            triple(bruno, 'OWNS', 'PERSON', 'ORGANIZATION', alice),
+            triple(carol, 'PARENT', 'PERSON', 'PERSON', alice),
+        ]
+
+        for storage in [SQLStorageAdapter(database_uri=None), MemoryStorageAdapter()]:
+            for item in triples:
+                storage.create(item)
+
+            yield storage
+
+    def assertCandidates(self, storage, expected_types, **kwargs):
+        entity, = storage.select(Entity(name='Alice'))
+
+        self.assertEqual(
+            sorted(
+                triple.predicate.type
+                for triple in storage.get_candidate_triples(entity, **kwargs)
+            ),
+            expected_types
+        )
+
+    def test_linked_entity(self):
+        for storage in self.create_storages():
+            with self.subTest(storage=type(storage).__name__):
+                # Not the AGE of Bruno, another entity of the same type
+                self.assertCandidates(storage, ['AGE', 'FOUNDED', 'KNOWS', 'OWNS', 'PARENT'])
+
+    def test_subject_type(self):
+        for storage in self.create_storages():
+            with self.subTest(storage=type(storage).__name__):
+                # The relationship without a subject type fits,
+                # the triples <?, ?, entity> are not filtered
+                self.assertCandidates(
+                    storage, ['AGE', 'KNOWS', 'OWNS', 'PARENT'], subject_type='PERSON'
+                )
+
+    def test_object_type(self):
+        for storage in self.create_storages():
+            with self.subTest(storage=type(storage).__name__):
+                self.assertCandidates(
+                    storage, ['AGE', 'FOUNDED', 'KNOWS', 'PARENT'], object_type='PERSON'
+                )
+
+    def test_subject_type_and_object_type(self):
+        for storage in self.create_storages():
+            with self.subTest(storage=type(storage).__name__):
+                self.assertCandidates(
+                    storage, ['AGE', 'KNOWS', 'PARENT'], subject_type='PERSON', object_type='PERSON'
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
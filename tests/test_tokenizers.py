@@ -0,0 +1,25 @@
+import unittest
+
+from nltk.tokenize import NLTKWordTokenizer
+
+from benchmarks.tokenizers import corpus
+from sothoth.tokenizers import RegexTreebankTokenizer
+
+
+class RegexTreebankTokenizerTestCase(unittest.TestCase):
+
+    def test_conformance(self):
+        questions = corpus(200)
+
+        treebank_tokenizer = NLTKWordTokenizer()
+        regex_tokenizer = RegexTreebankTokenizer()
+
+        # The questions are single sentences, where nltk.word_tokenize equals the treebank tokenizer
+        for question, tokens in zip(questions, regex_tokenizer.tokenize_many(questions)):
+            with self.subTest(question=question):
+                self.assertEqual(tokens, treebank_tokenizer.tokenize(question))
+                self.assertEqual(regex_tokenizer.tokenize(question), tokens)
+
+
+if __name__ == '__main__':
+    unittest.main()
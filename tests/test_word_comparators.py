@@ -0,0 +1,68 @@
+import random
+import unittest
+
+import numpy
+
+from sothoth.comparisons import word_comparators
+
+
+class CompareManyTestCase(unittest.TestCase):
+
+    def test_compare_many_equals_compare(self):
+        rng = random.Random(0)
+
+        words = [''.join(rng.choice('abcAB ') for _ in range(rng.randint(0, 10))) for _ in range(40)]
+        words += ['', None, 'PERSON', '<PERSON>']
+
+        for name in ['LevenshteinSimilarity', 'BitParallelLevenshteinSimilarity']:
+            comparator = getattr(word_comparators, name)()
+
+            for word in words[::4]:
+                with self.subTest(comparator=name, word=word):
+                    numpy.testing.assert_allclose(
+                        comparator.compare_many(word, words),
+                        [comparator.compare(other_word, word) for other_word in words]
+                    )
+
+
+class CascadeSimilarityTestCase(unittest.TestCase):
+
+    def assertCascade(self, cascade, word, words, survivors):
+        first_scores = cascade.first_comparator.compare_many(word, words)
+        second_scores = cascade.second_comparator.compare_many(word, words)
+
+        numpy.testing.assert_allclose(
+            cascade.compare_many(word, words),
+            [second_scores[index] if index in survivors else 0 for index in range(len(words))]
+        )
+
+        return first_scores
+
+    def test_top_n(self):
+        cascade = word_comparators.CascadeSimilarity(word_cascade_top_n=3)
+
+        words = ['Obama', 'Obamma', 'Osama', 'Bush', 'Obama', 'Clinton', 'O']
+
+        # The best 3 by the first comparator, the earlier one wins the tie of the two Obama
+        self.assertCascade(cascade, 'obama', words, {0, 1, 4})
+
+        # A single pair is scored by the second comparator
+        self.assertEqual(
+            cascade.compare('Obamma', 'obama'), word_comparators.LevenshteinSimilarity().compare('Obamma', 'obama')
+        )
+
+    def test_threshold(self):
+        cascade = word_comparators.CascadeSimilarity(word_cascade_top_n=None, word_cascade_threshold=0.7)
+
+        first_scores = self.assertCascade(cascade, 'obama', ['Obama', 'Obamma', 'Osama', 'Bush', 'Clinton'], {0, 1, 2})
+
+        self.assertEqual([score >= 0.7 for score in first_scores], [True, True, True, False, False])
+
+    def test_unpruned(self):
+        cascade = word_comparators.CascadeSimilarity(word_cascade_top_n=None)
+
+        self.assertCascade(cascade, 'obama', ['Obama', 'Bush', ''], {0, 1, 2})
+
+
+if __name__ == '__main__':
+    unittest.main()